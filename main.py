@@ -98,6 +98,7 @@ def list_activities(game: str = "rok"):
 
     config_mgr = ConfigManager()
     activities_data = config_mgr.load_activities(game)
+    config_mgr.close()
 
     for idx, activity in enumerate(activities_data.get('activities', []), 1):
         enabled_status = "✓ ENABLED" if activity['enabled'] else "✗ disabled"
@@ -224,6 +225,9 @@ def main():
                     priority=activity_data['priority'],
                     max_retries=activity_data.get('max_retries', 3),
                     retry_delay_minutes=activity_data.get('retry_delay_minutes', 5),
+                    retry_backoff_multiplier=activity_data.get('retry_backoff_multiplier', 2.0),
+                    retry_delay_max_minutes=activity_data.get('retry_delay_max_minutes', 60),
+                    retry_jitter=activity_data.get('retry_jitter', 0.1),
                     max_execution_seconds=activity_data.get('max_execution_seconds', 120),
                     parameters=activity_data.get('parameters', {})
                 )
@@ -244,6 +248,7 @@ def main():
             logger.warning("No activities enabled!")
             print("\n⚠️  No activities are enabled in config/activities_rok.json")
             print("   Enable at least one activity and try again")
+            config_mgr.close()
             return 1
 
         logger.info(f"✓ Created {len(activities)} activity instance(s)")
@@ -294,7 +299,7 @@ def main():
 
                 # Show status every 30 seconds
                 if int(time.time() - start_time) % 30 == 0:
-                    status = scheduler.get_status()
+                    status = scheduler.get_status(include_formatted=False)
                     print(f"\n[Status] Running: {status['running']}, "
                           f"Executions: {status['total_executions']}, "
                           f"Success: {status['successful_executions']}, "
@@ -325,7 +330,8 @@ def main():
         # ====================================================================
         # STEP 8: Cleanup
         # ====================================================================
-        scheduler.stop()
+        scheduler.close()
+        config_mgr.close()
 
         # Final statistics
         print("\n" + "="*60)
@@ -26,13 +26,20 @@ import logging
 import time
 import random
 from typing import Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from src.core.activity import Activity, ActivityConfig
 from src.core.adb import ADBConnection
 from src.core.screen import ScreenAnalyzer
 
 
+# Module-level RNG for human-like waits (avoids the shared global random lock)
+_RNG = random.Random()
+
+# Daily cooldown between collections, in seconds
+COLLECTION_COOLDOWN_SECONDS = 23 * 3600
+
+
 class VIPCollectionActivity(Activity):
     """
     Collects daily VIP chest rewards.
@@ -92,7 +99,9 @@ class VIPCollectionActivity(Activity):
             'ok_button': 'templates/buttons/ok.png'
         }
 
+        # Wall-clock time kept for display; monotonic time used for cooldown math
         self.last_collection_time: Optional[datetime] = None
+        self._last_collection_monotonic: Optional[float] = None
 
     def check_prerequisites(self) -> bool:
         """
@@ -115,10 +124,10 @@ class VIPCollectionActivity(Activity):
             return False
 
         # Check: Is it too soon since last collection?
-        if self.last_collection_time:
-            time_since_last = datetime.now() - self.last_collection_time
-            if time_since_last < timedelta(hours=23):
-                hours_remaining = 23 - (time_since_last.total_seconds() / 3600)
+        if self._last_collection_monotonic is not None:
+            seconds_since_last = time.monotonic() - self._last_collection_monotonic
+            if seconds_since_last < COLLECTION_COOLDOWN_SECONDS:
+                hours_remaining = (COLLECTION_COOLDOWN_SECONDS - seconds_since_last) / 3600
                 self.logger.info(f"Too soon to collect VIP (wait {hours_remaining:.1f} more hours)")
                 return False
 
@@ -168,6 +177,7 @@ class VIPCollectionActivity(Activity):
 
             # Update last collection time
             self.last_collection_time = datetime.now()
+            self._last_collection_monotonic = time.monotonic()
 
             self.logger.info("✓ VIP collection execution complete")
             return True
@@ -191,9 +201,8 @@ class VIPCollectionActivity(Activity):
         self.logger.info("Verifying VIP collection completion")
 
         # Method 1: Was last_collection_time updated?
-        if self.last_collection_time:
-            time_since = datetime.now() - self.last_collection_time
-            if time_since.total_seconds() < 60:  # Updated in last minute
+        if self._last_collection_monotonic is not None:
+            if time.monotonic() - self._last_collection_monotonic < 60:  # Updated in last minute
                 self.logger.info("✓ Collection time was updated - success")
                 return True
 
@@ -273,7 +282,7 @@ class VIPCollectionActivity(Activity):
             return False
 
         # Wait for screen to load
-        wait_time = random.uniform(2.0, 3.0)
+        wait_time = _RNG.uniform(2.0, 3.0)
         self.logger.debug(f"Waiting {wait_time:.1f}s for VIP screen to load")
         time.sleep(wait_time)
 
@@ -356,7 +365,7 @@ class VIPCollectionActivity(Activity):
             return False
 
         # Wait for popup to appear
-        wait_time = random.uniform(1.5, 2.5)
+        wait_time = _RNG.uniform(1.5, 2.5)
         self.logger.debug(f"Waiting {wait_time:.1f}s for reward popup")
         time.sleep(wait_time)
 
@@ -394,7 +403,7 @@ class VIPCollectionActivity(Activity):
                 collect_result.location[1],
                 randomize=True
             )
-            time.sleep(random.uniform(0.8, 1.2))
+            time.sleep(_RNG.uniform(0.8, 1.2))
             return True
 
         # Try finding "OK" button
@@ -411,7 +420,7 @@ class VIPCollectionActivity(Activity):
                 ok_result.location[1],
                 randomize=True
             )
-            time.sleep(random.uniform(0.8, 1.2))
+            time.sleep(_RNG.uniform(0.8, 1.2))
             return True
 
         self.logger.warning("No reward popup buttons found")
@@ -444,13 +453,13 @@ class VIPCollectionActivity(Activity):
                 close_result.location[1],
                 randomize=True
             )
-            time.sleep(random.uniform(1.0, 1.5))
+            time.sleep(_RNG.uniform(1.0, 1.5))
             return True
         else:
             # Fallback: Use hardware back button
             self.logger.info("Close button not found, using back button")
             self.adb.press_back()
-            time.sleep(random.uniform(1.0, 1.5))
+            time.sleep(_RNG.uniform(1.0, 1.5))
             return True
 
 
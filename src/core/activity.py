@@ -8,16 +8,30 @@ Every automated task inherits from this and implements three methods:
 - verify_completion(): Did it work?
 """
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, Optional, Callable
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, Optional, Callable, Tuple
 from datetime import datetime, timedelta, time as dt_time
 from enum import Enum
 import logging
+import math
+import random
+import signal
+import threading
 import time
 import traceback
 
 
+# Time budgets for the prerequisite and verification phases of run()
+# (execution uses ActivityConfig.max_execution_seconds)
+PREREQUISITE_TIMEOUT_SECONDS = 30
+VERIFICATION_TIMEOUT_SECONDS = 30
+
+# Module-level RNG for retry jitter (avoids the shared global random lock)
+_RNG = random.Random()
+
+
 class ActivityState(Enum):
     """Current state of an activity in its lifecycle"""
     IDLE = "idle"                   # Disabled, not running
@@ -28,14 +42,37 @@ class ActivityState(Enum):
     VERIFYING = "verifying"         # Checking if it worked
     SUCCESS = "success"             # Completed successfully
     FAILED = "failed"               # Failed, will retry
+    TIMEOUT = "timeout"             # Exceeded its time budget, will retry
     DISABLED = "disabled"           # Failed too many times, needs manual intervention
 
 
-@dataclass
+# Small-int codes for ActivityState. Activities store the code so hot-path
+# comparisons are plain int compares instead of Enum __eq__ calls.
+_CODE_TO_STATE = tuple(ActivityState)
+_STATE_TO_CODE = {state: code for code, state in enumerate(_CODE_TO_STATE)}
+STATE_DISABLED = _STATE_TO_CODE[ActivityState.DISABLED]
+
+
+# Serialized field names per config class (public dataclass fields only)
+_CONFIG_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _parse_time_of_day(value: Optional[str]) -> Optional[dt_time]:
+    """Parse "HH:MM" into a time object (None passes through)"""
+    if not value:
+        return None
+    hour, minute = map(int, value.split(':'))
+    return dt_time(hour, minute)
+
+
+@dataclass(slots=True)
 class ActivityConfig:
     """
     Complete configuration for an activity.
     All settings that control HOW and WHEN an activity runs.
+
+    Slotted for compact instances; subclasses that add plain class
+    attributes still get a __dict__ and keep working unchanged.
     """
     # Enable/disable
     enabled: bool = True
@@ -53,7 +90,10 @@ class ActivityConfig:
 
     # Retry behavior
     max_retries: int = 3
-    retry_delay_minutes: int = 5
+    retry_delay_minutes: int = 5           # Delay before the first retry
+    retry_backoff_multiplier: float = 2.0  # Delay grows by this factor per retry
+    retry_delay_max_minutes: int = 60      # Cap on the backed-off delay
+    retry_jitter: float = 0.1              # +/- fraction of random spread
 
     # Activity-specific parameters
     parameters: Dict[str, Any] = field(default_factory=dict)
@@ -61,19 +101,72 @@ class ActivityConfig:
     # Timeouts
     max_execution_seconds: int = 300  # 5 minutes default
 
+    # Report every state transition during run() instead of only the last one
+    on_state_change_verbose: bool = False
+
+    # Derived values, parsed once in __post_init__ (not serialized)
+    _start_t: Optional[dt_time] = field(default=None, init=False, repr=False, compare=False)
+    _end_t: Optional[dt_time] = field(default=None, init=False, repr=False, compare=False)
+    _interval_td: timedelta = field(default=timedelta(0), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Pre-parse time window and interval so scheduling never re-parses them"""
+        self._start_t = _parse_time_of_day(self.start_time)
+        self._end_t = _parse_time_of_day(self.end_time)
+        self._interval_td = timedelta(
+            hours=self.interval_hours,
+            minutes=self.interval_minutes
+        )
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization.
+
+        Shallow copy - unlike dataclasses.asdict() nothing is deep-copied,
+        so `parameters` is the same dict object as on the config.
+        Fields added by config subclasses are included.
+        """
+        names = _CONFIG_FIELD_NAMES.get(type(self))
+        if names is None:
+            names = tuple(f.name for f in fields(self) if not f.name.startswith('_'))
+            _CONFIG_FIELD_NAMES[type(self)] = names
 
+        return {name: getattr(self, name) for name in names}
 
-class Activity(ABC):
+
+class Activity:
     """
     Base class for all activities.
 
     REAL IMPLEMENTATION - not a placeholder!
     Complete with state management, error handling, statistics, and lifecycle control.
+
+    Base attributes live in __slots__ (no per-instance dict lookup on the
+    scheduling hot path). Subclasses don't declare __slots__, so they still
+    get a __dict__ for their own attributes (templates, counters, etc.).
     """
 
+    __slots__ = (
+        'name', 'config', 'adb', 'screen', 'logger',
+        'state_code', 'retry_count',
+        'last_execution', 'next_execution',
+        'last_execution_monotonic', 'next_execution_monotonic',
+        'total_executions', 'successful_executions', 'failed_executions',
+        'total_execution_time_seconds', 'average_execution_time_seconds',
+        'success_rate', '_stats_dirty', '_stats_cache',
+        '_schedule_to_start_sum', '_schedule_to_start_count', '_exec_latency_hist',
+        'on_state_change', 'on_execution_complete', 'on_reschedule',
+        '_deferring_state', '_deferred_transition',
+        '_pre', '_exec', '_verify',
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """Reject subclasses that don't implement the lifecycle phases."""
+        super().__init_subclass__(**kwargs)
+        for method_name in ('check_prerequisites', 'execute', 'verify_completion'):
+            if getattr(cls, method_name) is getattr(Activity, method_name):
+                raise TypeError(f"{cls.__name__} must implement {method_name}()")
+
     def __init__(
         self,
         name: str,
@@ -95,13 +188,26 @@ class Activity(ABC):
         self.adb = adb_connection
         self.screen = screen_analyzer
 
+        # Bind the lifecycle phases once so run() calls plain attributes
+        # instead of resolving the methods through the class on every run
+        self._pre = self.check_prerequisites
+        self._exec = self.execute
+        self._verify = self.verify_completion
+
         # Setup logging
         self.logger = logging.getLogger(f"Activity.{name}")
 
         # State tracking
-        self.state = ActivityState.IDLE if not config.enabled else ActivityState.SCHEDULED
+        self.state_code = _STATE_TO_CODE[
+            ActivityState.IDLE if not config.enabled else ActivityState.SCHEDULED
+        ]
         self.last_execution: Optional[datetime] = None
         self.next_execution: Optional[datetime] = None
+
+        # Monotonic mirrors of the above - used for all scheduling comparisons
+        # (datetime values are kept only for display / statistics)
+        self.last_execution_monotonic: float = 0.0
+        self.next_execution_monotonic: float = 0.0
         self.retry_count = 0
 
         # Statistics for monitoring and optimization
@@ -110,10 +216,26 @@ class Activity(ABC):
         self.failed_executions = 0
         self.total_execution_time_seconds = 0.0
         self.average_execution_time_seconds = 0.0
+        self.success_rate = 0.0  # Percent, updated on every completion
+
+        # Scheduling lag (deadline -> actual start) and a log2-bucketed
+        # histogram of successful execution times (bucket b = [2^b, 2^(b+1)) s)
+        self._schedule_to_start_sum = 0.0
+        self._schedule_to_start_count = 0
+        self._exec_latency_hist: Counter = Counter()
+
+        # get_statistics() result, rebuilt only after something changed
+        self._stats_dirty = True
+        self._stats_cache: Optional[Dict[str, Any]] = None
 
         # Callbacks (for UI updates, notifications, etc.)
         self.on_state_change: Optional[Callable] = None
         self.on_execution_complete: Optional[Callable] = None
+        self.on_reschedule: Optional[Callable] = None  # Called when next_execution changes
+
+        # State-change coalescing during run() (see _defer_state_changes)
+        self._deferring_state = False
+        self._deferred_transition: Optional[Tuple[ActivityState, ActivityState]] = None
 
         self.logger.info(f"Activity '{name}' initialized (priority={config.priority})")
 
@@ -121,7 +243,6 @@ class Activity(ABC):
     # ABSTRACT METHODS - Must be implemented by subclasses
     # ========================================================================
 
-    @abstractmethod
     def check_prerequisites(self) -> bool:
         """
         Check if activity can run right now.
@@ -139,9 +260,8 @@ class Activity(ABC):
         Returns:
             True if can run, False otherwise
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def execute(self) -> bool:
         """
         Execute the actual activity automation.
@@ -158,9 +278,8 @@ class Activity(ABC):
         Returns:
             True if executed successfully, False if failed
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def verify_completion(self) -> bool:
         """
         Verify that the activity completed successfully.
@@ -176,7 +295,7 @@ class Activity(ABC):
         Returns:
             True if verified successful, False otherwise
         """
-        pass
+        raise NotImplementedError
 
     # ========================================================================
     # LIFECYCLE MANAGEMENT
@@ -194,113 +313,183 @@ class Activity(ABC):
         5. Handle errors
         6. Calculate next execution
 
+        Intermediate state changes are coalesced: on_state_change fires once
+        with the terminal transition (see _defer_state_changes).
+
         Returns:
             True if successful, False if failed
         """
-        execution_start = datetime.now()
+        with self._defer_state_changes():
+            execution_start = time.perf_counter()
 
-        try:
-            self.logger.info(f"Starting '{self.name}' (attempt {self.retry_count + 1})")
-            self._change_state(ActivityState.CHECKING)
-
-            # Step 1: Check prerequisites
-            if not self._run_with_timeout(
-                self.check_prerequisites,
-                timeout_seconds=30,
-                operation_name="prerequisite check"
-            ):
-                self.logger.warning(f"Prerequisites not met for '{self.name}'")
-                self._change_state(ActivityState.SCHEDULED)
-                return False
+            # How late did we start relative to the scheduled deadline?
+            if self.next_execution is not None:
+                self._schedule_to_start_sum += max(
+                    0.0, time.monotonic() - self.next_execution_monotonic
+                )
+                self._schedule_to_start_count += 1
+
+            try:
+                self.logger.info("Starting '%s' (attempt %d)", self.name, self.retry_count + 1)
+                self._change_state(ActivityState.CHECKING)
+
+                # Step 1: Check prerequisites
+                with self._deadline(PREREQUISITE_TIMEOUT_SECONDS, "prerequisite check"):
+                    prerequisites_met = self._pre()
+
+                if not prerequisites_met:
+                    self.logger.warning("Prerequisites not met for '%s'", self.name)
+                    self._change_state(ActivityState.SCHEDULED)
+                    return False
+
+                # Step 2: Execute
+                self._change_state(ActivityState.READY)
+                self.logger.info("Prerequisites met, executing '%s'", self.name)
+
+                self._change_state(ActivityState.EXECUTING)
+                with self._deadline(self.config.max_execution_seconds, "execution"):
+                    execution_success = self._exec()
+
+                if not execution_success:
+                    self.logger.error(f"Execution failed for '{self.name}'")
+                    self._handle_failure()
+                    return False
+
+                # Step 3: Verify
+                self._change_state(ActivityState.VERIFYING)
+                with self._deadline(VERIFICATION_TIMEOUT_SECONDS, "verification"):
+                    verification_success = self._verify()
+
+                if not verification_success:
+                    self.logger.error(f"Verification failed for '{self.name}'")
+                    self._handle_failure()
+                    return False
+
+                # Success!
+                self._change_state(ActivityState.SUCCESS)
+                execution_time = time.perf_counter() - execution_start
+                self._handle_success(execution_time)
+
+                self.logger.info(
+                    "'%s' completed successfully in %.2fs", self.name, execution_time
+                )
 
-            # Step 2: Execute
-            self._change_state(ActivityState.READY)
-            self.logger.info(f"Prerequisites met, executing '{self.name}'")
+                return True
 
-            self._change_state(ActivityState.EXECUTING)
-            execution_success = self._run_with_timeout(
-                self.execute,
-                timeout_seconds=self.config.max_execution_seconds,
-                operation_name="execution"
-            )
-
-            if not execution_success:
-                self.logger.error(f"Execution failed for '{self.name}'")
+            except TimeoutError as e:
+                self.logger.error(f"'{self.name}' timed out: {e}")
+                self._change_state(ActivityState.TIMEOUT)
                 self._handle_failure()
                 return False
 
-            # Step 3: Verify
-            self._change_state(ActivityState.VERIFYING)
-            verification_success = self._run_with_timeout(
-                self.verify_completion,
-                timeout_seconds=30,
-                operation_name="verification"
-            )
-
-            if not verification_success:
-                self.logger.error(f"Verification failed for '{self.name}'")
+            except Exception as e:
+                self.logger.error(
+                    f"Unexpected error in '{self.name}': {e}\n{traceback.format_exc()}"
+                )
                 self._handle_failure()
                 return False
 
-            # Success!
-            self._change_state(ActivityState.SUCCESS)
-            execution_time = (datetime.now() - execution_start).total_seconds()
-            self._handle_success(execution_time)
-
-            self.logger.info(
-                f"'{self.name}' completed successfully in {execution_time:.2f}s"
-            )
+            finally:
+                # Always return to scheduled state (unless disabled)
+                if self.state_code != STATE_DISABLED:
+                    self._change_state(ActivityState.SCHEDULED)
 
-            return True
+    @contextmanager
+    def _defer_state_changes(self):
+        """
+        Coalesce on_state_change callbacks while the block runs.
 
-        except Exception as e:
-            self.logger.error(
-                f"Unexpected error in '{self.name}': {e}\n{traceback.format_exc()}"
-            )
-            self._handle_failure()
-            return False
+        A run() walks through up to six states; instead of calling the
+        (usually UI-bound) callback for each, only the last transition is
+        reported when the block exits. Set
+        ActivityConfig.on_state_change_verbose to get every transition.
+        """
+        if self.config.on_state_change_verbose:
+            yield
+            return
 
+        self._deferring_state = True
+        self._deferred_transition = None
+        try:
+            yield
         finally:
-            # Always return to scheduled state (unless disabled)
-            if self.state != ActivityState.DISABLED:
-                self._change_state(ActivityState.SCHEDULED)
+            self._deferring_state = False
+            transition = self._deferred_transition
+            self._deferred_transition = None
 
-    def _run_with_timeout(
-        self,
-        func: Callable,
-        timeout_seconds: int,
-        operation_name: str
-    ) -> bool:
-        """
-        Run a function with timeout protection.
+            if transition and self.on_state_change:
+                self.on_state_change(self, *transition)
 
-        Prevents activities from hanging indefinitely.
+    @contextmanager
+    def _deadline(self, timeout_seconds: float, operation_name: str):
         """
-        start_time = time.time()
-        try:
-            result = func()
-            elapsed = time.time() - start_time
+        Enforce a real timeout on a lifecycle phase.
 
-            if elapsed > timeout_seconds:
-                self.logger.warning(
-                    f"{operation_name} took {elapsed:.1f}s (timeout: {timeout_seconds}s)"
-                )
+        On the main thread (POSIX) a SIGALRM interval timer raises
+        TimeoutError inside the phase. Elsewhere - including the scheduler
+        thread - a threading.Timer cancels the ADB commands in flight so a
+        hung device call returns, and TimeoutError is raised once the phase
+        unwinds.
 
-            return result
+        Raises:
+            TimeoutError: If the phase exceeded timeout_seconds
+        """
+        if (hasattr(signal, "SIGALRM")
+                and threading.current_thread() is threading.main_thread()):
+            def _on_alarm(signum, frame):
+                raise TimeoutError(f"{operation_name} exceeded {timeout_seconds}s")
+
+            previous_handler = signal.signal(signal.SIGALRM, _on_alarm)
+            signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+            try:
+                yield
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.signal(signal.SIGALRM, previous_handler)
+            return
+
+        timed_out = threading.Event()
+
+        def _on_timer():
+            timed_out.set()
+            cancel_pending = getattr(self.adb, "cancel_pending", None)
+            if cancel_pending:
+                cancel_pending()
+
+        timer = threading.Timer(timeout_seconds, _on_timer)
+        timer.daemon = True
+        timer.start()
+        try:
+            yield
+        finally:
+            timer.cancel()
+            if timed_out.is_set():
+                clear_cancel = getattr(self.adb, "clear_cancel", None)
+                if clear_cancel:
+                    clear_cancel()
 
-        except Exception as e:
-            self.logger.error(f"Error during {operation_name}: {e}")
-            return False
+        if timed_out.is_set():
+            raise TimeoutError(f"{operation_name} exceeded {timeout_seconds}s")
 
     def _handle_success(self, execution_time: float):
         """Handle successful execution"""
         self.total_executions += 1
         self.successful_executions += 1
+        self.success_rate = self.successful_executions / self.total_executions * 100
+        self._stats_dirty = True
         self.retry_count = 0
         self.last_execution = datetime.now()
-        self.next_execution = self.get_next_execution_time()
+        self.last_execution_monotonic = time.monotonic()
+
+        next_time = self.get_next_execution_time()
+        self._set_next_execution(
+            next_time,
+            self.last_execution_monotonic
+            + (next_time - self.last_execution).total_seconds()
+        )
 
         # Update statistics
+        self._exec_latency_hist[math.floor(math.log2(max(1e-3, execution_time)))] += 1
         self.total_execution_time_seconds += execution_time
         self.average_execution_time_seconds = (
             self.total_execution_time_seconds / self.total_executions
@@ -314,6 +503,8 @@ class Activity(ABC):
         """Handle failed execution"""
         self.total_executions += 1
         self.failed_executions += 1
+        self.success_rate = self.successful_executions / self.total_executions * 100
+        self._stats_dirty = True
         self.retry_count += 1
 
         if self.retry_count >= self.config.max_retries:
@@ -323,97 +514,143 @@ class Activity(ABC):
             self._change_state(ActivityState.DISABLED)
             self.config.enabled = False
         else:
+            delay_minutes = self._get_retry_delay_minutes()
             self.logger.info(
-                f"'{self.name}' will retry in {self.config.retry_delay_minutes} minutes "
-                f"(attempt {self.retry_count}/{self.config.max_retries})"
+                "'%s' will retry in %.1f minutes (attempt %d/%d)",
+                self.name, delay_minutes, self.retry_count, self.config.max_retries
             )
             # Schedule retry
-            self.next_execution = datetime.now() + timedelta(
-                minutes=self.config.retry_delay_minutes
+            delay_seconds = delay_minutes * 60
+            self._set_next_execution(
+                datetime.now() + timedelta(seconds=delay_seconds),
+                time.monotonic() + delay_seconds
             )
 
         # Callback for UI updates
         if self.on_execution_complete:
             self.on_execution_complete(self, success=False)
 
+    def _get_retry_delay_minutes(self) -> float:
+        """
+        Exponential backoff delay for the current retry.
+
+        delay = min(max, base * multiplier^(retry_count - 1)) * (1 +/- jitter)
+        so longer outages are covered without adding retries, and jitter
+        keeps activities sharing a dependency from retrying in lockstep.
+        """
+        config = self.config
+        delay = min(
+            config.retry_delay_max_minutes,
+            config.retry_delay_minutes
+            * config.retry_backoff_multiplier ** (self.retry_count - 1)
+        )
+
+        if config.retry_jitter:
+            delay *= 1 + _RNG.uniform(-config.retry_jitter, config.retry_jitter)
+
+        return delay
+
+    @property
+    def state(self) -> ActivityState:
+        """Current lifecycle state (stored internally as a small-int code)"""
+        return _CODE_TO_STATE[self.state_code]
+
+    @state.setter
+    def state(self, new_state: ActivityState):
+        self.state_code = _STATE_TO_CODE[new_state]
+        self._stats_dirty = True
+
     def _change_state(self, new_state: ActivityState):
         """Change state and trigger callback"""
-        old_state = self.state
-        self.state = new_state
+        old_code = self.state_code
+        new_code = _STATE_TO_CODE[new_state]
+        self.state_code = new_code
+        self._stats_dirty = True
+
+        if old_code == new_code:
+            return
+
+        old_state = _CODE_TO_STATE[old_code]
 
-        if self.on_state_change and old_state != new_state:
+        if self._deferring_state:
+            self.logger.debug("State %s -> %s (deferred)", old_state.value, new_state.value)
+            self._deferred_transition = (old_state, new_state)
+        elif self.on_state_change:
             self.on_state_change(self, old_state, new_state)
 
     # ========================================================================
     # TIMING & SCHEDULING
     # ========================================================================
 
+    def set_next_execution(self, next_time: datetime):
+        """
+        Set when this activity should run next.
+
+        Keeps the monotonic deadline in sync and notifies the scheduler
+        so it can re-queue the activity in its heap.
+        """
+        offset_seconds = (next_time - datetime.now()).total_seconds()
+        self._set_next_execution(next_time, time.monotonic() + offset_seconds)
+
+    def _set_next_execution(self, next_time: datetime, next_monotonic: float):
+        """Set both representations of the next run time and notify listeners"""
+        self.next_execution = next_time
+        self.next_execution_monotonic = next_monotonic
+        self._stats_dirty = True
+
+        if self.on_reschedule:
+            self.on_reschedule(self)
+
     def get_next_execution_time(self) -> datetime:
         """Calculate when this activity should run next"""
         if self.last_execution is None:
             return datetime.now()
 
         # Calculate next time based on interval
-        interval = timedelta(
-            hours=self.config.interval_hours,
-            minutes=self.config.interval_minutes
-        )
-        next_time = self.last_execution + interval
+        next_time = self.last_execution + self.config._interval_td
 
         # Adjust for time window if set
-        if self.config.start_time or self.config.end_time:
+        if self.config._start_t or self.config._end_t:
             next_time = self._adjust_for_time_window(next_time)
 
         return next_time
 
     def _adjust_for_time_window(self, next_time: datetime) -> datetime:
-        """Adjust execution time to fit within configured time window"""
-        if not (self.config.start_time or self.config.end_time):
-            return next_time
-
-        try:
-            # Parse time strings
-            start_time = None
-            end_time = None
-
-            if self.config.start_time:
-                hour, minute = map(int, self.config.start_time.split(':'))
-                start_time = dt_time(hour, minute)
+        """
+        Adjust execution time to fit within configured time window.
 
-            if self.config.end_time:
-                hour, minute = map(int, self.config.end_time.split(':'))
-                end_time = dt_time(hour, minute)
+        Uses the window bounds pre-parsed by ActivityConfig, so malformed
+        times are reported once at config creation instead of every run.
+        """
+        start_time = self.config._start_t
+        end_time = self.config._end_t
 
-            next_time_of_day = next_time.time()
+        if not (start_time or end_time):
+            return next_time
 
-            # If before window, move to start of window
-            if start_time and next_time_of_day < start_time:
-                next_time = datetime.combine(next_time.date(), start_time)
+        next_time_of_day = next_time.time()
 
-            # If after window, move to start of window next day
-            elif end_time and next_time_of_day > end_time:
-                if start_time:
-                    next_day = next_time.date() + timedelta(days=1)
-                    next_time = datetime.combine(next_day, start_time)
+        # If before window, move to start of window
+        if start_time and next_time_of_day < start_time:
+            next_time = datetime.combine(next_time.date(), start_time)
 
-            return next_time
+        # If after window, move to start of window next day
+        elif end_time and next_time_of_day > end_time:
+            if start_time:
+                next_day = next_time.date() + timedelta(days=1)
+                next_time = datetime.combine(next_day, start_time)
 
-        except Exception as e:
-            self.logger.error(f"Error adjusting time window: {e}")
-            return next_time
+        return next_time
 
     def is_due(self) -> bool:
         """Check if this activity should run now"""
-        if not self.config.enabled:
-            return False
-
-        if self.state == ActivityState.DISABLED:
+        if not self.config.enabled or self.state_code == STATE_DISABLED:
             return False
 
         if self.next_execution is None:
-            self.next_execution = self.get_next_execution_time()
+            self.set_next_execution(self.get_next_execution_time())
 
-        return datetime.now() >= self.next_execution
+        return time.monotonic() >= self.next_execution_monotonic
 
     # ========================================================================
     # CONTROL METHODS
@@ -423,12 +660,18 @@ class Activity(ABC):
         """Enable this activity"""
         self.config.enabled = True
         self.retry_count = 0  # Reset retry counter
+        self._stats_dirty = True
         self._change_state(ActivityState.SCHEDULED)
         self.logger.info(f"Activity '{self.name}' enabled")
 
+        # Disabled activities are dropped from the scheduler heap - re-queue
+        if self.on_reschedule:
+            self.on_reschedule(self)
+
     def disable(self):
         """Disable this activity"""
         self.config.enabled = False
+        self._stats_dirty = True
         self._change_state(ActivityState.IDLE)
         self.logger.info(f"Activity '{self.name}' disabled")
 
@@ -439,12 +682,17 @@ class Activity(ABC):
         self.failed_executions = 0
         self.total_execution_time_seconds = 0.0
         self.average_execution_time_seconds = 0.0
+        self.success_rate = 0.0
+        self._schedule_to_start_sum = 0.0
+        self._schedule_to_start_count = 0
+        self._exec_latency_hist.clear()
         self.retry_count = 0
+        self._stats_dirty = True
         self.logger.info(f"Statistics reset for '{self.name}'")
 
     def force_run_now(self):
         """Force immediate execution (bypass scheduling)"""
-        self.next_execution = datetime.now()
+        self._set_next_execution(datetime.now(), time.monotonic())
         self.logger.info(f"'{self.name}' forced to run now")
 
     # ========================================================================
@@ -460,14 +708,15 @@ class Activity(ABC):
         - Performance monitoring
         - Identifying problem activities
         - Optimization decisions
+
+        The dict is cached and only rebuilt after the activity changes
+        (state, counters, schedule, enable/disable), so frequent UI polling
+        is cheap. Treat the returned dict as read-only.
         """
-        success_rate = (
-            self.successful_executions / self.total_executions * 100
-            if self.total_executions > 0
-            else 0
-        )
+        if not self._stats_dirty and self._stats_cache is not None:
+            return self._stats_cache
 
-        return {
+        self._stats_cache = {
             "name": self.name,
             "state": self.state.value,
             "enabled": self.config.enabled,
@@ -475,13 +724,42 @@ class Activity(ABC):
             "total_executions": self.total_executions,
             "successful_executions": self.successful_executions,
             "failed_executions": self.failed_executions,
-            "success_rate_percent": round(success_rate, 1),
+            "success_rate_percent": round(self.success_rate, 1),
             "average_execution_time_seconds": round(self.average_execution_time_seconds, 2),
             "last_execution": self.last_execution.isoformat() if self.last_execution else None,
             "next_execution": self.next_execution.isoformat() if self.next_execution else None,
             "retry_count": self.retry_count,
             "interval_minutes": self.config.interval_hours * 60 + self.config.interval_minutes,
+            "schedule_to_start_avg_seconds": round(
+                self._schedule_to_start_sum / self._schedule_to_start_count, 2
+            ) if self._schedule_to_start_count else 0.0,
+            "execution_time_p50_seconds": self._estimate_execution_percentile(0.50),
+            "execution_time_p95_seconds": self._estimate_execution_percentile(0.95),
         }
+        self._stats_dirty = False
+
+        return self._stats_cache
+
+    def _estimate_execution_percentile(self, fraction: float) -> float:
+        """
+        Estimate an execution-time percentile from the log2 histogram.
+
+        Returns the upper bound of the bucket containing the percentile,
+        so the estimate is within 2x of the true value.
+        """
+        histogram = self._exec_latency_hist
+        total = sum(histogram.values())
+        if not total:
+            return 0.0
+
+        threshold = fraction * total
+        cumulative = 0
+        for bucket in sorted(histogram):
+            cumulative += histogram[bucket]
+            if cumulative >= threshold:
+                return round(2.0 ** (bucket + 1), 3)
+
+        return round(2.0 ** (max(histogram) + 1), 3)
 
     def get_status_summary(self) -> str:
         """Get one-line status summary for logging/UI"""
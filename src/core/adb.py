@@ -14,16 +14,28 @@ Supports:
 - File transfer
 """
 
+import asyncio
 import subprocess
 import logging
+import queue
+import threading
 import time
 import random
 import os
-from typing import Optional, List, Tuple
+import re
+import socket
+import struct
+from typing import Optional, List, Tuple, Set, Dict, Any, Callable, Hashable, Union
 from pathlib import Path
+from multiprocessing.shared_memory import SharedMemory
 import numpy as np
-from PIL import Image
-import io
+import cv2
+
+# One `adb devices` line for a usable device: "<serial>\tdevice"
+_DEVICE_LINE_RE = re.compile(rb'^(\S+)\s+(?:device|online)\s*$', re.M)
+
+# Android Emulator serial; its gRPC port is the console port + 3000
+_EMULATOR_SERIAL_RE = re.compile(r'emulator-(\d+)')
 
 
 class ADBConnection:
@@ -33,7 +45,7 @@ class ADBConnection:
     Handles all communication with Android emulator through ADB.
     """
 
-    def __init__(self, device_id: Optional[str] = None, adb_path: str = "adb"):
+    def __init__(self, device_id: Optional[str] = None, adb_path: str = "adb", use_adbutils: bool = False):
         """
         Initialize ADB connection.
 
@@ -41,15 +53,62 @@ class ADBConnection:
             device_id: Specific device ID (e.g., "emulator-5555")
                       If None, will auto-detect first available device
             adb_path: Path to adb executable (default: "adb" assumes it's in PATH)
+            use_adbutils: Talk to the ADB server over its socket protocol via
+                          adbutils instead of spawning adb per command
         """
-        self.device_id = device_id
-        self.adb_path = adb_path
+        self._device_id = device_id
+        self._adb_path = adb_path
+        self._argv_prefix: Tuple[str, ...] = ()
+        self._rebuild_argv_prefix()
         self.logger = logging.getLogger("ADB")
         self.connected = False
 
+        # Optional native ADB client (see _get_adbutils_device)
+        self.use_adbutils = use_adbutils
+        self._adbutils_device = None
+        self._adbutils_serial: Optional[str] = None
+        self._adbutils_unavailable = False
+
         # Performance optimization - cache last screenshot
         self._last_screenshot: Optional[np.ndarray] = None
-        self._last_screenshot_time: float = 0.0
+        self._last_screenshot_time: int = 0  # time.monotonic_ns()
+
+        # Capture rate limit: within this interval every capture_screen call
+        # returns the last frame, whatever use_cache says (0 = unlimited)
+        self.min_capture_interval_ms = 0
+        self._throttle_logged = False
+
+        # Opt-in: decode every capture into one preallocated frame. The
+        # returned array is then overwritten by the next capture, so callers
+        # that keep a frame across captures must copy it.
+        self.reuse_screenshot_buffer = False
+        self._screenshot_buf: Optional[np.ndarray] = None
+        self._jpeg_unsupported = False
+
+        # Opt-in: keep one device-side screencap loop alive and request
+        # frames over its stdin instead of spawning adb per capture
+        self.persistent_capture = False
+        self._capture_proc: Optional[subprocess.Popen] = None
+        self._capture_output: Optional[queue.Queue] = None
+        self._capture_lock = threading.Lock()
+        self._raw_header_size: Optional[int] = None
+
+        # Optional minitouch input injection (see start_minitouch)
+        self._minitouch: Optional[socket.socket] = None
+        self._minitouch_process: Optional[subprocess.Popen] = None
+        self._minitouch_port: Optional[int] = None
+        self._minitouch_scale: Tuple[float, float] = (1.0, 1.0)
+        self._minitouch_lock = threading.Lock()
+
+        # Optional shared-memory backing for that buffer (see enable_shared_frame)
+        self.shared_frame_name: Optional[str] = None
+        self._shm: Optional[SharedMemory] = None
+
+        # Results of expensive analysis keyed by frame hash (see get_cached_or_compute)
+        self._phash_cache: Dict[Tuple[bytes, Hashable], Any] = {}
+        self.phash_cache_size = 256
+        self._last_phash_time: Optional[int] = None
+        self._last_phash: Optional[bytes] = None
 
         # Randomization settings (for human-like behavior)
         self.randomize_taps = True
@@ -57,8 +116,73 @@ class ADBConnection:
         self.min_tap_delay_ms = 100
         self.max_tap_delay_ms = 300
 
+        # Jitter and delays are drawn in bulk and consumed from ring buffers
+        # (see _next_jitter / _next_tap_delay)
+        self._rng = random.Random(os.urandom(16))
+        self._np_rng = np.random.default_rng(int.from_bytes(os.urandom(16), "little"))
+        self._jitter: List[int] = []
+        self._jitter_idx = 0
+        self._jitter_variance: Optional[int] = None
+        self._tap_delays: List[float] = []
+        self._tap_delay_idx = 0
+        self._tap_delay_range: Optional[Tuple[int, int]] = None
+
+        # In-flight ADB processes, so a timed-out activity can cancel them
+        self._active_processes: Set[subprocess.Popen] = set()
+        self._process_lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+        # Optional gRPC screenshot channel (Android Emulator only), built lazily.
+        # grpc_port overrides the port derived from an emulator-N device ID
+        grpc_port = os.getenv("ANDROID_GRPC_PORT")
+        self.grpc_port: Optional[int] = int(grpc_port) if grpc_port else None
+        self._grpc_stub = None
+        self._grpc_stub_port: Optional[int] = None
+        self._grpc_unavailable = False
+
+        # Continuous H.264 capture (see start_video_stream)
+        self._video_thread: Optional[threading.Thread] = None
+        self._video_process: Optional[subprocess.Popen] = None
+        self._video_stop = threading.Event()
+        self._video_lock = threading.Lock()
+        self._video_frame: Optional[np.ndarray] = None
+
+        # Long-lived `adb shell` for input/app commands (see _shell_exec)
+        self._shell: Optional[subprocess.Popen] = None
+        self._shell_device: Optional[str] = None
+        # Lines read from the shell by a reader thread; None marks EOF
+        self._shell_output: Optional[queue.Queue] = None
+        self._shell_lock = threading.Lock()
+
         self.logger.info("ADB Connection initialized")
 
+    @property
+    def device_id(self) -> Optional[str]:
+        """Selected device ID"""
+        return self._device_id
+
+    @device_id.setter
+    def device_id(self, value: Optional[str]):
+        self._device_id = value
+        self._rebuild_argv_prefix()
+
+    @property
+    def adb_path(self) -> str:
+        """Path to adb executable"""
+        return self._adb_path
+
+    @adb_path.setter
+    def adb_path(self, value: str):
+        self._adb_path = value
+        self._rebuild_argv_prefix()
+
+    def _rebuild_argv_prefix(self):
+        """Cache `adb [-s <device>]` so commands don't rebuild it per call"""
+        if self._device_id:
+            self._argv_prefix = (self._adb_path, "-s", self._device_id)
+        else:
+            self._argv_prefix = (self._adb_path,)
+
     # ========================================================================
     # CONNECTION MANAGEMENT
     # ========================================================================
@@ -76,8 +200,7 @@ class ADBConnection:
         """
         try:
             # First, try to connect to ADB server
-            connect_cmd = f"{self.adb_path} connect {host}:{port}"
-            result = self._run_command(connect_cmd)
+            result = self._run_command([self.adb_path, "connect", f"{host}:{port}"])
 
             if result and ("connected" in result.lower() or "already connected" in result.lower()):
                 self.logger.info(f"Connected to {host}:{port}")
@@ -104,9 +227,13 @@ class ADBConnection:
 
     def disconnect(self):
         """Disconnect from device"""
+        self.stop_video_stream()
+        self._close_shell()
+        self._close_capture_proc()
+        self.stop_minitouch()
+        self.close_shm()
         if self.device_id:
-            cmd = f"{self.adb_path} disconnect {self.device_id}"
-            self._run_command(cmd)
+            self._run_command([self.adb_path, "disconnect", self.device_id])
             self.connected = False
             self.logger.info("Disconnected from device")
 
@@ -118,19 +245,11 @@ class ADBConnection:
             List of device IDs
         """
         try:
-            result = self._run_command(f"{self.adb_path} devices")
+            result = self._run_command([self.adb_path, "devices"], text=False)
             if not result:
                 return []
 
-            devices = []
-            lines = result.strip().split('\n')[1:]  # Skip header
-
-            for line in lines:
-                if '\tdevice' in line or '\tonline' in line:
-                    device_id = line.split('\t')[0]
-                    devices.append(device_id)
-
-            return devices
+            return [serial.decode() for serial in _DEVICE_LINE_RE.findall(result)]
 
         except Exception as e:
             self.logger.error(f"Error getting devices: {e}")
@@ -150,7 +269,14 @@ class ADBConnection:
     # SCREEN CAPTURE
     # ========================================================================
 
-    def capture_screen(self, use_cache: bool = False, cache_duration_seconds: float = 0.5) -> Optional[np.ndarray]:
+    CAPTURE_FORMATS = ("auto", "raw", "jpeg", "png")
+
+    def capture_screen(
+        self,
+        use_cache: bool = False,
+        cache_duration_seconds: float = 0.5,
+        image_format: str = "auto"
+    ) -> Optional[np.ndarray]:
         """
         Capture screenshot from device.
 
@@ -159,43 +285,70 @@ class ADBConnection:
         Args:
             use_cache: If True, return cached screenshot if recent enough
             cache_duration_seconds: How long to cache screenshots
+            image_format: Transfer format:
+                - "auto": emulator gRPC, then raw, then PNG
+                - "raw": uncompressed RGBA; pixel-exact and no device-side
+                  encoding - best for 1:1 template matching
+                - "jpeg": `screencap -j` (Android 14+); fewest bytes over
+                  adb but lossy, fine for OCR and coarse matching. Falls
+                  back to raw on devices without JPEG support
+                - "png": lossless but slowest (PNG encode on device)
 
         Returns:
             Screenshot as numpy array (BGR format for OpenCV) or None if failed
         """
+        if image_format not in self.CAPTURE_FORMATS:
+            raise ValueError(f"Unknown capture format: {image_format}")
+
         try:
-            # Check cache
-            if use_cache and self._last_screenshot is not None:
-                age = time.time() - self._last_screenshot_time
-                if age < cache_duration_seconds:
+            # Check cache (callers get the cached array itself and must not modify it)
+            if self._last_screenshot is not None:
+                age_ns = time.monotonic_ns() - self._last_screenshot_time
+
+                if age_ns < self.min_capture_interval_ms * 1_000_000:
+                    if not self._throttle_logged:
+                        self._throttle_logged = True
+                        self.logger.debug(
+                            f"Capture throttled to one frame per {self.min_capture_interval_ms}ms"
+                        )
                     return self._last_screenshot
 
-            # Capture screenshot using exec-out (fastest method)
-            device_arg = f"-s {self.device_id}" if self.device_id else ""
-            cmd = f"{self.adb_path} {device_arg} exec-out screencap -p"
+                if use_cache and age_ns < cache_duration_seconds * 1_000_000_000:
+                    return self._last_screenshot
 
-            # Run command and get raw bytes
-            process = subprocess.Popen(
-                cmd,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            stdout, stderr = process.communicate()
+            if self._cancelled.is_set():
+                self.logger.debug("Screen capture skipped - commands cancelled")
+                return None
 
-            if process.returncode != 0 or not stdout:
-                self.logger.error(f"Screen capture failed: {stderr.decode()}")
+            if image_format == "auto":
+                # Emulator gRPC gives raw frames without PNG encoding or a subprocess;
+                # otherwise raw screencap, with PNG only if the raw frame can't be parsed
+                screenshot = self._capture_screen_grpc()
+                if screenshot is None:
+                    screenshot = self.capture_screen_raw()
+                if screenshot is None:
+                    screenshot = self._capture_screen_encoded(["screencap", "-p"])
+            elif image_format == "raw":
+                screenshot = self.capture_screen_raw()
+            elif image_format == "jpeg":
+                screenshot = self._capture_screen_jpeg()
+            else:
+                screenshot = self._capture_screen_encoded(["screencap", "-p"])
+
+            if screenshot is None:
                 return None
 
-            # Convert bytes to image
-            image = Image.open(io.BytesIO(stdout))
-            # Convert to numpy array (BGR for OpenCV)
-            screenshot = np.array(image)
-            screenshot = screenshot[:, :, ::-1]  # RGB to BGR
+            if self.reuse_screenshot_buffer:
+                if screenshot is not self._screenshot_buf:
+                    buffer = self._get_screenshot_buffer(screenshot.shape)
+                    np.copyto(buffer, screenshot)
+                # Fresh array object per capture over the same memory, so
+                # identity-keyed caches (ScreenAnalyzer._to_gray) see a new frame
+                screenshot = self._screenshot_buf.view()
 
             # Cache
             self._last_screenshot = screenshot
-            self._last_screenshot_time = time.time()
+            self._last_screenshot_time = time.monotonic_ns()
 
             return screenshot
 
@@ -203,6 +356,424 @@ class ADBConnection:
             self.logger.error(f"Screen capture error: {e}")
             return None
 
+    def capture_screen_hashed(
+        self,
+        use_cache: bool = False,
+        cache_duration_seconds: float = 0.5
+    ) -> Tuple[Optional[np.ndarray], Optional[bytes]]:
+        """
+        Capture screenshot together with its perceptual hash.
+
+        The hash keys get_cached_or_compute(), so OCR or template matching on
+        an unchanged screen (idle menus, loading screens) is done only once.
+
+        Args:
+            use_cache: If True, return cached screenshot if recent enough
+            cache_duration_seconds: How long to cache screenshots
+
+        Returns:
+            (screenshot, hash) or (None, None) if capture failed
+        """
+        screenshot = self.capture_screen(use_cache, cache_duration_seconds)
+        if screenshot is None:
+            return None, None
+
+        # Time-cached frame (no new capture since last hash): same hash
+        if self._last_screenshot_time == self._last_phash_time:
+            return screenshot, self._last_phash
+
+        phash = self.compute_phash(screenshot)
+        self._last_phash_time = self._last_screenshot_time
+        self._last_phash = phash
+        return screenshot, phash
+
+    @staticmethod
+    def compute_phash(image: np.ndarray) -> bytes:
+        """
+        Compute a 64-bit perceptual (average) hash of an image.
+
+        Downsamples to 8x8 grayscale and thresholds at the mean, so small
+        noise or compression differences produce the same hash.
+
+        Args:
+            image: Image (BGR or grayscale)
+
+        Returns:
+            8-byte hash
+        """
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        small = cv2.resize(gray, (8, 8), interpolation=cv2.INTER_AREA)
+        return np.packbits(small > small.mean()).tobytes()
+
+    def get_cached_or_compute(self, phash: bytes, fn: Callable[[], Any], key: Hashable = None) -> Any:
+        """
+        Return a cached result for this frame hash, computing it on a miss.
+
+        Args:
+            phash: Frame hash from capture_screen_hashed()
+            fn: Computes the result (e.g., lambda: screen.read_text(frame))
+            key: Identifies the computation; defaults to fn itself, so pass
+                 one when fn is a fresh lambda on every call
+
+        Returns:
+            Cached or freshly computed result
+        """
+        cache_key = (phash, fn if key is None else key)
+        try:
+            return self._phash_cache[cache_key]
+        except KeyError:
+            pass
+
+        result = fn()
+        if len(self._phash_cache) >= self.phash_cache_size:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._phash_cache[next(iter(self._phash_cache))]
+        self._phash_cache[cache_key] = result
+        return result
+
+    def clear_phash_cache(self):
+        """Drop all hash-keyed results"""
+        self._phash_cache.clear()
+
+    def capture_screen_raw(self) -> Optional[np.ndarray]:
+        """
+        Capture screenshot with raw `screencap` (no -p).
+
+        Skips PNG encoding on the device and decoding on the host. The output
+        is a small header (width, height, pixel format, plus colorspace on
+        newer Android) followed by RGBA pixels. exec-out keeps the stream
+        binary-safe, so no CRLF fix-up is needed on Windows.
+
+        Returns:
+            Screenshot as numpy array (BGR) or None if failed or not RGBA_8888
+        """
+        if self.persistent_capture and self._raw_header_size is not None:
+            screenshot = self._capture_raw_persistent()
+            if screenshot is not None:
+                return screenshot
+
+        return self._decode_raw_screencap(self._exec_out(["screencap"]))
+
+    _CAPTURE_TIMEOUT = 10
+
+    def _capture_raw_persistent(self) -> Optional[np.ndarray]:
+        """
+        Read one raw frame from the long-lived device screencap loop.
+
+        The loop (`while read _; do screencap; done`) captures a frame per
+        input line. Frames are length-delimited by their header, using the
+        header size learned from the first one-shot raw capture. A frame that
+        doesn't arrive within _CAPTURE_TIMEOUT seconds kills the loop (it is
+        respawned on the next call) and returns None, so the caller falls
+        back to a one-shot screencap.
+        """
+        if self._cancelled.is_set():
+            return None
+
+        with self._capture_lock:
+            try:
+                process = self._capture_proc
+                if process is None or process.poll() is not None:
+                    self._close_capture_proc_locked()
+                    process = subprocess.Popen(
+                        [*self._argv_prefix, "shell", "-T", "while read _; do screencap; done"],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL
+                    )
+                    self._track_process(process)
+                    self._capture_proc = process
+
+                    # Read on a thread so each frame can be awaited with a
+                    # deadline; a plain select() doesn't work on pipes on Windows
+                    self._capture_output = queue.Queue()
+                    threading.Thread(
+                        target=self._pump_capture_frames,
+                        args=(process.stdout, self._raw_header_size, self._capture_output),
+                        name="adb-capture-reader", daemon=True
+                    ).start()
+
+                process.stdin.write(b"\n")
+                process.stdin.flush()
+
+                try:
+                    frame = self._capture_output.get(timeout=self._CAPTURE_TIMEOUT)
+                except queue.Empty:
+                    self.logger.warning("Persistent capture timed out, restarting")
+                    frame = None
+                else:
+                    if frame is not None:
+                        return self._rgba_to_bgr(*frame)
+                    self.logger.debug("Persistent capture stream ended, restarting")
+            except (OSError, ValueError) as e:
+                self.logger.debug(f"Persistent capture failed: {e}")
+
+            self._close_capture_proc_locked()
+            return None
+
+    @staticmethod
+    def _pump_capture_frames(stdout, header_size: int, output: queue.Queue):
+        """Copy (pixels, width, height) frames into a queue until EOF (reader thread)"""
+        try:
+            while True:
+                header = stdout.read(header_size)
+                if len(header) != header_size:
+                    break
+                width, height, _pixel_format = struct.unpack_from('<III', header)
+                frame_size = width * height * 4
+                pixels = stdout.read(frame_size)
+                if len(pixels) != frame_size:
+                    break
+                output.put((pixels, width, height))
+        except (OSError, ValueError):
+            pass
+        finally:
+            output.put(None)
+
+    def _close_capture_proc(self):
+        """Tear down the persistent capture loop"""
+        with self._capture_lock:
+            self._close_capture_proc_locked()
+
+    def _close_capture_proc_locked(self):
+        """Tear down the persistent capture loop (lock held)"""
+        process = self._capture_proc
+        if process is None:
+            return
+
+        self._capture_proc = None
+        self._capture_output = None
+        self._untrack_process(process)
+        try:
+            process.kill()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+    def _decode_raw_screencap(self, stdout: Optional[bytes]) -> Optional[np.ndarray]:
+        """Convert raw screencap output (header + RGBA) to a BGR frame"""
+        if not stdout or len(stdout) < 12:
+            return None
+
+        width, height, pixel_format = struct.unpack_from('<III', stdout)
+        frame_size = width * height * 4
+        header_size = len(stdout) - frame_size
+
+        if header_size not in (12, 16):
+            self.logger.debug(
+                f"Unexpected raw screencap layout ({width}x{height}, "
+                f"format {pixel_format}, {len(stdout)} bytes)"
+            )
+            return None
+
+        self._raw_header_size = header_size
+        return self._rgba_to_bgr(stdout, width, height, header_size)
+
+    def _rgba_to_bgr(self, data: bytes, width: int, height: int, offset: int = 0) -> np.ndarray:
+        """Convert RGBA pixel bytes to a BGR frame (into the reusable buffer if enabled)"""
+        rgba = np.frombuffer(data, dtype=np.uint8, count=width * height * 4, offset=offset)
+        dst = self._get_screenshot_buffer((height, width, 3)) if self.reuse_screenshot_buffer else None
+        return cv2.cvtColor(rgba.reshape(height, width, 4), cv2.COLOR_RGBA2BGR, dst=dst)
+
+    def _get_screenshot_buffer(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """Return the reusable frame buffer, (re)allocating on size change"""
+        if self._screenshot_buf is None or self._screenshot_buf.shape != shape:
+            if self.shared_frame_name:
+                self.close_shm()
+                self._shm = SharedMemory(
+                    name=self.shared_frame_name, create=True, size=int(np.prod(shape))
+                )
+                self._screenshot_buf = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf)
+                self.logger.info(f"Shared frame buffer '{self.shared_frame_name}' allocated: {shape}")
+            else:
+                self._screenshot_buf = np.empty(shape, dtype=np.uint8)
+        return self._screenshot_buf
+
+    def enable_shared_frame(self, name: str = "adb_fb"):
+        """
+        Decode captures into a named shared-memory block.
+
+        Worker processes attach with attach_shared_frame() and read frames
+        in place instead of receiving a pickled copy. Implies
+        reuse_screenshot_buffer: each capture overwrites the same memory.
+
+        Args:
+            name: Shared memory block name
+        """
+        self.close_shm()
+        self.shared_frame_name = name
+        self.reuse_screenshot_buffer = True
+
+    def close_shm(self):
+        """Release and unlink the shared frame buffer, if any"""
+        shm = self._shm
+        if shm is None:
+            return
+
+        if self._last_screenshot is not None and self._last_screenshot.base is self._screenshot_buf:
+            self._last_screenshot = None
+        self._screenshot_buf = None
+        self._shm = None
+
+        try:
+            shm.close()
+        except BufferError:
+            # A caller still holds a view of the frame; memory is freed when it goes
+            self.logger.debug("Shared frame buffer still referenced at close")
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def attach_shared_frame(name: str, shape: Tuple[int, int, int]) -> Tuple[SharedMemory, np.ndarray]:
+        """
+        Attach to a frame buffer published by enable_shared_frame().
+
+        Args:
+            name: Shared memory block name
+            shape: Frame shape (height, width, 3)
+
+        Returns:
+            (shared memory handle, frame view). Keep the handle alive while
+            using the view and close() it when done.
+        """
+        shm = SharedMemory(name=name)
+        return shm, np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+
+    def _capture_screen_encoded(self, command: List[str]) -> Optional[np.ndarray]:
+        """Capture an encoded (PNG/JPEG) screenshot and decode it"""
+        stdout = self._exec_out(command)
+        if not stdout:
+            return None
+
+        return self._decode_image(stdout)
+
+    def _capture_screen_jpeg(self) -> Optional[np.ndarray]:
+        """Capture with `screencap -j`, falling back to raw where unsupported"""
+        if self._jpeg_unsupported:
+            return self.capture_screen_raw()
+
+        screenshot = self._capture_screen_encoded(["screencap", "-j"])
+        if screenshot is None:
+            self._jpeg_unsupported = True
+            self.logger.info("Device screencap has no JPEG support, using raw capture")
+            return self.capture_screen_raw()
+
+        return screenshot
+
+    @staticmethod
+    def _decode_image(stdout: bytes) -> Optional[np.ndarray]:
+        """Decode PNG/JPEG bytes straight to BGR in one pass"""
+        return cv2.imdecode(np.frombuffer(stdout, dtype=np.uint8), cv2.IMREAD_COLOR)
+
+    def _exec_out(self, command: List[str]) -> Optional[bytes]:
+        """
+        Run `adb exec-out <command>` and return raw stdout bytes.
+
+        Args:
+            command: Device command argv (e.g., ["screencap", "-p"])
+
+        Returns:
+            Raw output or None if failed
+        """
+        if self._cancelled.is_set():
+            return None
+
+        device = self._get_adbutils_device()
+        if device is not None:
+            try:
+                # exec: service, like `adb exec-out`; shell: may run under a
+                # PTY on older adbd and mangle binary output
+                conn = device.open_transport()
+                try:
+                    conn.send_command(f"exec:{' '.join(command)}")
+                    conn.check_okay()
+                    return conn.read_until_close(encoding=None) or None
+                finally:
+                    conn.close()
+            except Exception as e:
+                self.logger.warning(f"adbutils exec failed, using adb exec-out: {e}")
+
+        process = subprocess.Popen(
+            [*self._argv_prefix, "exec-out", *command],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        self._track_process(process)
+        try:
+            stdout, stderr = process.communicate()
+        finally:
+            self._untrack_process(process)
+
+        if process.returncode != 0 or not stdout:
+            self.logger.error(f"Screen capture failed: {stderr.decode()}")
+            return None
+
+        return stdout
+
+    def _capture_screen_grpc(self) -> Optional[np.ndarray]:
+        """
+        Grab a raw RGB888 frame from the emulator's EmulatorController service.
+
+        Needs grpcio plus emulator_controller_pb2 / emulator_controller_pb2_grpc
+        generated from the emulator's emulator_controller.proto with
+        grpc_tools.protoc and importable from sys.path.
+
+        The port belongs to the selected device: emulator-N uses N + 3000
+        (the emulator's own default), and other devices (BlueStacks, network
+        serials) only use gRPC when grpc_port is set explicitly. A port that
+        fails is skipped until the device changes and capture_screen falls
+        back to exec-out.
+
+        Returns:
+            Screenshot as numpy array (BGR) or None if gRPC is unavailable
+        """
+        port = self.grpc_port
+        if port is None:
+            match = _EMULATOR_SERIAL_RE.fullmatch(self.device_id or "")
+            if match is None:
+                return None
+            port = int(match.group(1)) + 3000
+
+        if port != self._grpc_stub_port:
+            self._grpc_stub = None
+            self._grpc_stub_port = port
+            self._grpc_unavailable = False
+
+        if self._grpc_unavailable:
+            return None
+
+        try:
+            if self._grpc_stub is None:
+                import grpc
+                import emulator_controller_pb2_grpc
+
+                channel = grpc.insecure_channel(
+                    f"localhost:{port}",
+                    options=[('grpc.max_receive_message_length', 32 * 1024 * 1024)]
+                )
+                self._grpc_stub = emulator_controller_pb2_grpc.EmulatorControllerStub(channel)
+
+            import emulator_controller_pb2 as pb
+
+            response = self._grpc_stub.getScreenshot(
+                pb.ImageFormat(format=pb.ImageFormat.RGB888),
+                timeout=5
+            )
+            height = response.format.height
+            width = response.format.width
+            rgb = np.frombuffer(response.image, dtype=np.uint8).reshape(height, width, 3)
+            # cvtColor yields a C-contiguous BGR array; a [:, :, ::-1] view
+            # would force every OpenCV consumer to copy it first
+            return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+
+        except Exception as e:
+            self._grpc_unavailable = True
+            self._grpc_stub = None
+            self.logger.debug(f"gRPC screenshot unavailable, using exec-out: {e}")
+            return None
+
     def save_screenshot(self, output_path: str) -> bool:
         """
         Capture and save screenshot to file.
@@ -218,15 +789,112 @@ class ADBConnection:
             return False
 
         try:
-            # Convert BGR to RGB for PIL
-            image = Image.fromarray(screenshot[:, :, ::-1])
-            image.save(output_path)
+            if not cv2.imwrite(output_path, screenshot):
+                self.logger.error(f"Error saving screenshot: could not write {output_path}")
+                return False
             self.logger.info(f"Screenshot saved to {output_path}")
             return True
         except Exception as e:
             self.logger.error(f"Error saving screenshot: {e}")
             return False
 
+    # ========================================================================
+    # VIDEO STREAM
+    # ========================================================================
+
+    def start_video_stream(self, size: str = "1280x720", bit_rate: int = 8000000) -> bool:
+        """
+        Start continuous capture via `screenrecord --output-format=h264`.
+
+        The H.264 stream is decoded with PyAV on a background thread and the
+        newest frame is kept for get_latest_frame(). This amortizes capture
+        cost over many frames; capture_screen() remains for one-shot use.
+
+        Args:
+            size: Stream resolution (WIDTHxHEIGHT)
+            bit_rate: Encoder bit rate in bits per second
+
+        Returns:
+            True if the stream is running, False if PyAV is unavailable
+        """
+        if self._video_thread is not None and self._video_thread.is_alive():
+            return True
+
+        try:
+            import av
+        except ImportError:
+            self.logger.error("Video streaming requires PyAV (pip install av)")
+            return False
+
+        self._video_stop.clear()
+        self._video_thread = threading.Thread(
+            target=self._video_stream_loop,
+            args=(av, size, bit_rate),
+            daemon=True,
+            name="ADBVideoStream"
+        )
+        self._video_thread.start()
+        self.logger.info(f"Video stream started ({size}, {bit_rate} bps)")
+        return True
+
+    def stop_video_stream(self):
+        """Stop the background video stream, if running"""
+        if self._video_thread is None:
+            return
+
+        self._video_stop.set()
+        process = self._video_process
+        if process is not None:
+            try:
+                process.kill()
+            except OSError:
+                pass
+
+        self._video_thread.join(timeout=5)
+        self._video_thread = None
+        with self._video_lock:
+            self._video_frame = None
+        self.logger.info("Video stream stopped")
+
+    def get_latest_frame(self) -> Optional[np.ndarray]:
+        """
+        Get the most recently decoded stream frame.
+
+        Returns:
+            Frame as numpy array (BGR) or None if no frame decoded yet
+        """
+        with self._video_lock:
+            return self._video_frame
+
+    def _video_stream_loop(self, av, size: str, bit_rate: int):
+        """Run screenrecord and decode its output until stopped"""
+        argv = [
+            *self._argv_prefix, "exec-out", "screenrecord",
+            "--output-format=h264", "--size", size, "--bit-rate", str(bit_rate), "-"
+        ]
+
+        while not self._video_stop.is_set():
+            process = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            self._video_process = process
+
+            try:
+                container = av.open(process.stdout, format="h264")
+                for frame in container.decode(video=0):
+                    image = frame.to_ndarray(format="bgr24")
+                    with self._video_lock:
+                        self._video_frame = image
+                    if self._video_stop.is_set():
+                        break
+            except Exception as e:
+                self.logger.debug(f"Video stream interrupted: {e}")
+            finally:
+                process.kill()
+                process.wait()
+                self._video_process = None
+
+            # screenrecord exits at its time limit (3 minutes) - restart it
+            self._video_stop.wait(1.0)
+
     # ========================================================================
     # TOUCH & INPUT SIMULATION
     # ========================================================================
@@ -251,22 +919,16 @@ class ADBConnection:
                 randomize = self.randomize_taps
 
             if randomize:
-                x += random.randint(-self.tap_variance_px, self.tap_variance_px)
-                y += random.randint(-self.tap_variance_px, self.tap_variance_px)
-
-            # Execute tap
-            device_arg = f"-s {self.device_id}" if self.device_id else ""
-            cmd = f"{self.adb_path} {device_arg} shell input tap {x} {y}"
+                x += self._next_jitter()
+                y += self._next_jitter()
 
-            result = self._run_command(cmd)
+            # Execute tap (minitouch socket when running, else `input tap`)
+            if not self._minitouch_send([(x, y)]):
+                self._shell_exec(f"input tap {x} {y}")
 
             # Add random delay (human-like behavior)
             if randomize:
-                delay = random.uniform(
-                    self.min_tap_delay_ms / 1000,
-                    self.max_tap_delay_ms / 1000
-                )
-                time.sleep(delay)
+                time.sleep(self._next_tap_delay())
 
             self.logger.debug(f"Tapped at ({x}, {y})")
             return True
@@ -297,16 +959,13 @@ class ADBConnection:
         try:
             # Randomize if enabled
             if randomize:
-                x1 += random.randint(-self.tap_variance_px, self.tap_variance_px)
-                y1 += random.randint(-self.tap_variance_px, self.tap_variance_px)
-                x2 += random.randint(-self.tap_variance_px, self.tap_variance_px)
-                y2 += random.randint(-self.tap_variance_px, self.tap_variance_px)
-                duration_ms += random.randint(-50, 50)
-
-            device_arg = f"-s {self.device_id}" if self.device_id else ""
-            cmd = f"{self.adb_path} {device_arg} shell input swipe {x1} {y1} {x2} {y2} {duration_ms}"
+                x1 += self._next_jitter()
+                y1 += self._next_jitter()
+                x2 += self._next_jitter()
+                y2 += self._next_jitter()
+                duration_ms += self._rng.randint(-50, 50)
 
-            self._run_command(cmd)
+            self._shell_exec(f"input swipe {x1} {y1} {x2} {y2} {duration_ms}")
 
             # Small delay after swipe
             time.sleep(duration_ms / 1000 + 0.1)
@@ -318,6 +977,72 @@ class ADBConnection:
             self.logger.error(f"Swipe error: {e}")
             return False
 
+    _JITTER_POOL_SIZE = 65536
+    _TAP_DELAY_POOL_SIZE = 8192
+
+    def _next_jitter(self) -> int:
+        """Next ±tap_variance_px offset from the pre-drawn pool"""
+        if self._jitter_idx >= len(self._jitter) or self._jitter_variance != self.tap_variance_px:
+            variance = self.tap_variance_px
+            self._jitter = self._np_rng.integers(
+                -variance, variance, size=self._JITTER_POOL_SIZE, endpoint=True
+            ).tolist()
+            self._jitter_variance = variance
+            self._jitter_idx = 0
+
+        value = self._jitter[self._jitter_idx]
+        self._jitter_idx += 1
+        return value
+
+    def _next_tap_delay(self) -> float:
+        """Next post-tap delay in seconds from the pre-drawn pool"""
+        delay_range = (self.min_tap_delay_ms, self.max_tap_delay_ms)
+        if self._tap_delay_idx >= len(self._tap_delays) or self._tap_delay_range != delay_range:
+            self._tap_delays = self._np_rng.uniform(
+                delay_range[0] / 1000, delay_range[1] / 1000, size=self._TAP_DELAY_POOL_SIZE
+            ).tolist()
+            self._tap_delay_range = delay_range
+            self._tap_delay_idx = 0
+
+        value = self._tap_delays[self._tap_delay_idx]
+        self._tap_delay_idx += 1
+        return value
+
+    def swipe_batch(self, paths: np.ndarray, randomize: bool = True) -> bool:
+        """
+        Run several swipes in one shell round-trip.
+
+        Jitter for all paths is drawn in one vectorized call. `input swipe`
+        blocks on the device for its duration, so the swipes run back to back
+        without host-side sleeps between them.
+
+        Args:
+            paths: N x 5 array of (x1, y1, x2, y2, duration_ms)
+            randomize: Add human-like variance
+
+        Returns:
+            True if successful, False otherwise
+        """
+        paths = np.asarray(paths, dtype=np.int64).reshape(-1, 5)
+        if not len(paths):
+            return True
+
+        if randomize:
+            variance = self.tap_variance_px
+            jitter = np.empty_like(paths)
+            jitter[:, :4] = self._np_rng.integers(-variance, variance, size=(len(paths), 4), endpoint=True)
+            jitter[:, 4] = self._np_rng.integers(-50, 50, size=len(paths), endpoint=True)
+            paths = paths + jitter
+
+        result = self.execute_batch([
+            f"input swipe {x1} {y1} {x2} {y2} {duration_ms}"
+            for x1, y1, x2, y2, duration_ms in paths.tolist()
+        ])
+
+        time.sleep(0.1)
+        self.logger.debug(f"Swiped {len(paths)} path(s) in one batch")
+        return bool(result)
+
     def long_press(self, x: int, y: int, duration_ms: int = 1000, randomize: bool = True) -> bool:
         """
         Simulate long press (implemented as swipe with no movement).
@@ -332,6 +1057,37 @@ class ADBConnection:
         """
         return self.swipe(x, y, x, y, duration_ms, randomize)
 
+    def tap_sequence(self, points: List[Tuple[int, int, int]], randomize: bool = None) -> bool:
+        """
+        Tap several points in one shell round-trip.
+
+        The taps and the waits between them run as a single device command
+        (`input tap x y; sleep 0.1; input tap ...`). The sleeps still happen
+        on the device, but no extra host process or round-trip is spent per tap.
+
+        Args:
+            points: (x, y, delay_ms) per tap; delay_ms is the wait after the tap
+            randomize: Override randomization setting (None = use default)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if randomize is None:
+            randomize = self.randomize_taps
+
+        commands = []
+        for x, y, delay_ms in points:
+            if randomize:
+                x += self._next_jitter()
+                y += self._next_jitter()
+            commands.append(f"input tap {x} {y}")
+            if delay_ms > 0:
+                commands.append(f"sleep {delay_ms / 1000:.3f}")
+
+        result = self.execute_batch(commands)
+        self.logger.debug(f"Tapped {len(points)} point(s) in one batch")
+        return bool(result)
+
     def input_text(self, text: str) -> bool:
         """
         Input text into currently focused field.
@@ -349,10 +1105,7 @@ class ADBConnection:
             text = text.replace('(', '\\(')
             text = text.replace(')', '\\)')
 
-            device_arg = f"-s {self.device_id}" if self.device_id else ""
-            cmd = f'{self.adb_path} {device_arg} shell input text "{text}"'
-
-            self._run_command(cmd)
+            self._shell_exec(f"input text {text}")
             self.logger.debug(f"Inputted text: {text}")
             return True
 
@@ -375,14 +1128,153 @@ class ADBConnection:
     def _press_key(self, keycode: str) -> bool:
         """Press a keycode"""
         try:
-            device_arg = f"-s {self.device_id}" if self.device_id else ""
-            cmd = f"{self.adb_path} {device_arg} shell input keyevent {keycode}"
-            self._run_command(cmd)
+            self._shell_exec(f"input keyevent {keycode}")
             return True
         except Exception as e:
             self.logger.error(f"Key press error ({keycode}): {e}")
             return False
 
+    # ========================================================================
+    # MINITOUCH
+    # ========================================================================
+
+    MINITOUCH_REMOTE_PATH = "/data/local/tmp/minitouch"
+
+    def start_minitouch(self, binary_path: str, port: int = 1111) -> bool:
+        """
+        Start minitouch and route taps through its socket.
+
+        `input tap` goes through the Android InputManager (~50-150ms per tap);
+        minitouch writes touch events directly, so a tap is one socket write
+        and several fingers can go down in the same frame (multi_tap()).
+
+        Args:
+            binary_path: Local minitouch binary built for the device ABI
+            port: Local TCP port forwarded to the minitouch socket
+
+        Returns:
+            True if minitouch is ready, False otherwise (taps keep using `input`)
+        """
+        self.stop_minitouch()
+
+        if not self.push_file(binary_path, self.MINITOUCH_REMOTE_PATH):
+            return False
+        self._shell_exec(f"chmod 755 {self.MINITOUCH_REMOTE_PATH}")
+
+        resolution = self.get_screen_resolution()
+        if resolution is None:
+            self.logger.error("minitouch: could not read screen resolution")
+            return False
+
+        self._minitouch_process = subprocess.Popen(
+            [*self._argv_prefix, "shell", self.MINITOUCH_REMOTE_PATH],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        self._run_command([*self._argv_prefix, "forward", f"tcp:{port}", "localabstract:minitouch"])
+        self._minitouch_port = port
+
+        # minitouch needs a moment to open its socket
+        for _ in range(20):
+            sock = None
+            try:
+                sock = socket.create_connection(("127.0.0.1", port), timeout=2)
+                banner = sock.makefile("rb").readline  # "v 1", "^ ...", "$ pid"
+                header = b""
+                while not header.startswith(b"^"):
+                    header = banner()
+                    if not header:
+                        raise OSError("minitouch closed before banner")
+                banner()  # "$ <pid>"
+                break
+            except OSError:
+                if sock is not None:
+                    sock.close()
+                time.sleep(0.1)
+        else:
+            self.logger.error("minitouch: could not connect to socket")
+            self.stop_minitouch()
+            return False
+
+        # Touch coordinates are in the touch device's range, not screen pixels
+        _, _max_contacts, max_x, max_y, _max_pressure = header.split()
+        self._minitouch_scale = (int(max_x) / resolution[0], int(max_y) / resolution[1])
+        self._minitouch = sock
+        self.logger.info(f"minitouch ready on port {port}")
+        return True
+
+    def stop_minitouch(self):
+        """Stop minitouch and fall back to `input` taps"""
+        with self._minitouch_lock:
+            sock = self._minitouch
+            self._minitouch = None
+
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+        if self._minitouch_process is not None:
+            try:
+                self._minitouch_process.kill()
+                self._minitouch_process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+            self._minitouch_process = None
+
+        if self._minitouch_port is not None:
+            self._run_command([*self._argv_prefix, "forward", "--remove", f"tcp:{self._minitouch_port}"])
+            self._minitouch_port = None
+
+    def multi_tap(self, points: List[Tuple[int, int]], randomize: bool = None) -> bool:
+        """
+        Tap several points simultaneously (one finger per point).
+
+        Requires minitouch (start_minitouch()); `input tap` can't do multi-touch.
+
+        Args:
+            points: (x, y) per finger
+            randomize: Override randomization setting (None = use default)
+
+        Returns:
+            True if sent, False otherwise
+        """
+        if randomize is None:
+            randomize = self.randomize_taps
+
+        if randomize:
+            points = [(x + self._next_jitter(), y + self._next_jitter()) for x, y in points]
+
+        if not self._minitouch_send(points):
+            self.logger.error("Multi-touch requires minitouch")
+            return False
+
+        self.logger.debug(f"Multi-tapped {len(points)} point(s)")
+        return True
+
+    def _minitouch_send(self, points: List[Tuple[int, int]]) -> bool:
+        """Send press+release for each point in one write; False if minitouch isn't running"""
+        sock = self._minitouch
+        if sock is None:
+            return False
+
+        scale_x, scale_y = self._minitouch_scale
+        downs = "".join(
+            f"d {contact} {int(x * scale_x)} {int(y * scale_y)} 50\n"
+            for contact, (x, y) in enumerate(points)
+        )
+        ups = "".join(f"u {contact}\n" for contact in range(len(points)))
+
+        try:
+            with self._minitouch_lock:
+                sock.sendall(f"{downs}c\n{ups}c\n".encode())
+            return True
+        except OSError as e:
+            self.logger.warning(f"minitouch connection lost, using input tap: {e}")
+            self.stop_minitouch()
+            return False
+
     # ========================================================================
     # APP MANAGEMENT
     # ========================================================================
@@ -399,14 +1291,11 @@ class ADBConnection:
             True if started, False otherwise
         """
         try:
-            device_arg = f"-s {self.device_id}" if self.device_id else ""
-
             if activity_name:
-                cmd = f"{self.adb_path} {device_arg} shell am start -n {package_name}/{activity_name}"
+                self._shell_exec(f"am start -n {package_name}/{activity_name}")
             else:
-                cmd = f"{self.adb_path} {device_arg} shell monkey -p {package_name} -c android.intent.category.LAUNCHER 1"
+                self._shell_exec(f"monkey -p {package_name} -c android.intent.category.LAUNCHER 1")
 
-            self._run_command(cmd)
             self.logger.info(f"Started app: {package_name}")
             return True
 
@@ -425,9 +1314,7 @@ class ADBConnection:
             True if stopped, False otherwise
         """
         try:
-            device_arg = f"-s {self.device_id}" if self.device_id else ""
-            cmd = f"{self.adb_path} {device_arg} shell am force-stop {package_name}"
-            self._run_command(cmd)
+            self._shell_exec(f"am force-stop {package_name}")
             self.logger.info(f"Stopped app: {package_name}")
             return True
         except Exception as e:
@@ -445,9 +1332,8 @@ class ADBConnection:
             True if running, False otherwise
         """
         try:
-            device_arg = f"-s {self.device_id}" if self.device_id else ""
-            cmd = f"{self.adb_path} {device_arg} shell pidof {package_name}"
-            result = self._run_command(cmd)
+            # adbutils' shell service merges stderr, so drop it device-side
+            result = self._shell_exec(f"pidof {package_name} 2>/dev/null")
             return bool(result and result.strip())
         except:
             return False
@@ -468,9 +1354,7 @@ class ADBConnection:
             True if successful, False otherwise
         """
         try:
-            device_arg = f"-s {self.device_id}" if self.device_id else ""
-            cmd = f'{self.adb_path} {device_arg} push "{local_path}" "{remote_path}"'
-            result = self._run_command(cmd)
+            result = self._run_command([*self._argv_prefix, "push", local_path, remote_path])
             success = result and "error" not in result.lower()
 
             if success:
@@ -493,9 +1377,7 @@ class ADBConnection:
             True if successful, False otherwise
         """
         try:
-            device_arg = f"-s {self.device_id}" if self.device_id else ""
-            cmd = f'{self.adb_path} {device_arg} pull "{remote_path}" "{local_path}"'
-            result = self._run_command(cmd)
+            result = self._run_command([*self._argv_prefix, "pull", remote_path, local_path])
             success = result and "error" not in result.lower()
 
             if success:
@@ -518,9 +1400,7 @@ class ADBConnection:
             (width, height) or None if failed
         """
         try:
-            device_arg = f"-s {self.device_id}" if self.device_id else ""
-            cmd = f"{self.adb_path} {device_arg} shell wm size"
-            result = self._run_command(cmd)
+            result = self._shell_exec("wm size")
 
             if result and "Physical size:" in result:
                 size_str = result.split("Physical size:")[1].strip()
@@ -533,38 +1413,387 @@ class ADBConnection:
             self.logger.error(f"Error getting resolution: {e}")
             return None
 
-    def _run_command(self, cmd: str, timeout: int = 30) -> Optional[str]:
+    def _run_command(self, argv: List[str], timeout: int = 30, text: bool = True) -> Optional[Union[str, bytes]]:
         """
         Run ADB command and return output.
 
+        The argv is executed directly (no /bin/sh), so arguments need no
+        quoting and device IDs or paths can't inject shell syntax.
+
         Args:
-            cmd: Command to run
+            argv: Command and arguments (e.g., ["adb", "devices"])
             timeout: Timeout in seconds
+            text: Decode output to str; False returns raw bytes
 
         Returns:
             Command output or None if failed
         """
+        if self._cancelled.is_set():
+            self.logger.debug(f"Command skipped - commands cancelled: {' '.join(argv)}")
+            return None
+
         try:
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout
+            process = subprocess.Popen(
+                argv,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=text
             )
+            self._track_process(process)
+
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                self.logger.error(f"Command timeout: {' '.join(argv)}")
+                return None
+            finally:
+                self._untrack_process(process)
+
+            if process.returncode != 0 and stderr:
+                self.logger.debug(f"Command stderr: {stderr}")
+
+            return stdout
+
+        except Exception as e:
+            self.logger.error(f"Command error: {e}")
+            return None
+
+    _SHELL_SENTINEL = "__ADB_SHELL_END__"
+    # Quoted apart so a terminal echo of the input line never contains the
+    # sentinel; only the echo command's output does
+    _SHELL_SENTINEL_ECHO = "echo __ADB_SHELL_''END__"
+    _SHELL_TIMEOUT = 30
+    _BATCH_SEPARATOR = "__ADB_BATCH_NEXT__"
+
+    def execute_batch(self, commands: List[str]) -> List[str]:
+        """
+        Run several shell commands in a single round-trip.
+
+        Args:
+            commands: Device shell commands, run in order
+
+        Returns:
+            Output of each command (empty list if the batch failed)
+        """
+        if not commands:
+            return []
+
+        joined = f"; echo {self._BATCH_SEPARATOR}; ".join(commands)
+        result = self._shell_exec(joined)
+        if result is None:
+            return []
+
+        return result.split(f"{self._BATCH_SEPARATOR}\n")
 
-            if result.returncode != 0 and result.stderr:
-                self.logger.debug(f"Command stderr: {result.stderr}")
+    def _shell_exec(self, command: str) -> Optional[str]:
+        """
+        Run a command on the persistent `adb shell` and return its output.
 
-            return result.stdout
+        One shell process is kept open and fed commands on stdin, so each
+        call is a pipe write instead of a new adb process and connection.
+        Output is read up to a sentinel line, for at most _SHELL_TIMEOUT
+        seconds. Calls are serialized with a lock; if the shell can't be used
+        it is closed and the command falls back to a one-off `adb shell` via
+        _run_command. A shell that doesn't answer in time is closed and the
+        call returns None, since the command may already have run.
 
-        except subprocess.TimeoutExpired:
-            self.logger.error(f"Command timeout: {cmd}")
+        Args:
+            command: Device shell command (e.g., "input tap 100 200")
+
+        Returns:
+            Command output or None if failed
+        """
+        if self._cancelled.is_set():
+            self.logger.debug(f"Command skipped - commands cancelled: {command}")
             return None
+
+        device = self._get_adbutils_device()
+        if device is not None:
+            try:
+                return device.shell(command, timeout=30)
+            except Exception as e:
+                self.logger.debug(f"adbutils shell failed, using adb: {e}")
+
+        with self._shell_lock:
+            try:
+                shell = self._get_shell()
+                output = self._shell_output
+                shell.stdin.write(f"{command}; {self._SHELL_SENTINEL_ECHO}\n")
+                shell.stdin.flush()
+
+                deadline = time.monotonic() + self._SHELL_TIMEOUT
+                lines = []
+                while True:
+                    try:
+                        line = output.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        # Not retried: a tap or swipe may already have run
+                        self.logger.warning(f"Persistent shell timed out during: {command}")
+                        self._close_shell_locked()
+                        return None
+
+                    if line is None:
+                        # EOF before the sentinel: shell died (or was cancelled)
+                        self.logger.debug(f"Persistent shell closed during: {command}")
+                        self._close_shell_locked()
+                        return None
+
+                    if line.rstrip("\r\n").endswith(self._SHELL_SENTINEL):
+                        # Output without a trailing newline shares the sentinel line
+                        lines.append(line[:line.rindex(self._SHELL_SENTINEL)])
+                        return "".join(lines)
+                    lines.append(line)
+
+            except (OSError, ValueError) as e:
+                self.logger.debug(f"Persistent shell unavailable ({e}), using one-off shell")
+                self._close_shell_locked()
+
+        return self._run_command([*self._argv_prefix, "shell", command])
+
+    def _get_adbutils_device(self):
+        """
+        Return the adbutils device when use_adbutils is set.
+
+        adbutils speaks the ADB server protocol over a socket, so commands
+        skip the adb client process entirely. Returns None (subprocess path)
+        if disabled, if adbutils isn't installed or the device can't be opened.
+        """
+        if not self.use_adbutils or self._adbutils_unavailable:
+            return None
+
+        if self._adbutils_device is not None and self._adbutils_serial == self.device_id:
+            return self._adbutils_device
+
+        try:
+            import adbutils
+            self._adbutils_device = adbutils.adb.device(serial=self.device_id)
+            self._adbutils_serial = self.device_id
+            return self._adbutils_device
         except Exception as e:
+            self._adbutils_unavailable = True
+            self._adbutils_device = None
+            self.logger.warning(f"adbutils unavailable, using adb subprocesses: {e}")
+            return None
+
+    def _get_shell(self) -> subprocess.Popen:
+        """Return the persistent shell, (re)starting it if needed (lock held)"""
+        shell = self._shell
+        if shell is not None and shell.poll() is None and self._shell_device == self.device_id:
+            return shell
+
+        self._close_shell_locked()
+
+        shell = subprocess.Popen(
+            [*self._argv_prefix, "shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            # Discarded, like the one-off path's stderr, so error text
+            # never shows up as command output
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
+        # Tracked so cancel_pending() can kill a hung command
+        self._track_process(shell)
+
+        # Read on a thread so _shell_exec can wait with a deadline; a plain
+        # select() doesn't work on pipes on Windows
+        output = queue.Queue()
+        threading.Thread(
+            target=self._pump_shell_output, args=(shell.stdout, output),
+            name="adb-shell-reader", daemon=True
+        ).start()
+
+        self._shell = shell
+        self._shell_device = self.device_id
+        self._shell_output = output
+        return shell
+
+    @staticmethod
+    def _pump_shell_output(stdout, output: queue.Queue):
+        """Copy shell output lines into a queue until EOF (reader thread)"""
+        try:
+            for line in stdout:
+                output.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            output.put(None)
+
+    def _close_shell(self):
+        """Tear down the persistent shell"""
+        with self._shell_lock:
+            self._close_shell_locked()
+
+    def _close_shell_locked(self):
+        """Tear down the persistent shell (lock held)"""
+        shell = self._shell
+        if shell is None:
+            return
+
+        self._shell = None
+        self._shell_device = None
+        self._shell_output = None
+        self._untrack_process(shell)
+        try:
+            shell.kill()
+            shell.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+    # ========================================================================
+    # ASYNC VARIANTS
+    # ========================================================================
+
+    async def _run_command_async(self, argv: List[str], timeout: int = 30) -> Optional[bytes]:
+        """
+        Run ADB command without blocking the event loop.
+
+        Lets callers overlap device I/O, e.g.
+        asyncio.gather(adb.is_app_running_async(pkg), adb.capture_screen_async()).
+
+        Args:
+            argv: Command and arguments
+            timeout: Timeout in seconds
+
+        Returns:
+            Raw stdout or None if failed
+        """
+        if self._cancelled.is_set():
+            self.logger.debug(f"Command skipped - commands cancelled: {' '.join(argv)}")
+            return None
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except OSError as e:
             self.logger.error(f"Command error: {e}")
             return None
 
+        self._track_process(process)
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.communicate()
+            self.logger.error(f"Command timeout: {' '.join(argv)}")
+            return None
+        finally:
+            self._untrack_process(process)
+
+        if process.returncode != 0:
+            if stderr:
+                self.logger.debug(f"Command stderr: {stderr.decode(errors='replace')}")
+            return None
+
+        return stdout
+
+    async def capture_screen_async(self) -> Optional[np.ndarray]:
+        """
+        Capture screenshot without blocking the event loop.
+
+        Uses raw screencap, falling back to PNG like capture_screen().
+
+        Returns:
+            Screenshot as numpy array (BGR) or None if failed
+        """
+        stdout = await self._run_command_async([*self._argv_prefix, "exec-out", "screencap"])
+        screenshot = self._decode_raw_screencap(stdout)
+
+        if screenshot is None:
+            stdout = await self._run_command_async([*self._argv_prefix, "exec-out", "screencap", "-p"])
+            if not stdout:
+                return None
+            screenshot = self._decode_image(stdout)
+            if screenshot is None:
+                return None
+
+        self._last_screenshot = screenshot
+        self._last_screenshot_time = time.monotonic_ns()
+        return screenshot
+
+    async def tap_async(self, x: int, y: int, randomize: bool = None) -> bool:
+        """
+        Tap without blocking the event loop (see tap()).
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if randomize is None:
+            randomize = self.randomize_taps
+
+        if randomize:
+            x += self._next_jitter()
+            y += self._next_jitter()
+
+        result = await self._run_command_async(
+            [*self._argv_prefix, "shell", "input", "tap", str(x), str(y)]
+        )
+
+        if randomize:
+            await asyncio.sleep(self._next_tap_delay())
+
+        self.logger.debug(f"Tapped at ({x}, {y})")
+        return result is not None
+
+    async def is_app_running_async(self, package_name: str) -> bool:
+        """
+        Check if app is running without blocking the event loop.
+
+        Returns:
+            True if running, False otherwise
+        """
+        result = await self._run_command_async([*self._argv_prefix, "shell", "pidof", package_name])
+        return bool(result and result.strip())
+
+    # ========================================================================
+    # CANCELLATION
+    # ========================================================================
+
+    def _track_process(self, process: subprocess.Popen):
+        """Register an in-flight ADB process"""
+        with self._process_lock:
+            self._active_processes.add(process)
+
+    def _untrack_process(self, process: subprocess.Popen):
+        """Forget a finished ADB process"""
+        with self._process_lock:
+            self._active_processes.discard(process)
+
+    def cancel_pending(self):
+        """
+        Kill all in-flight ADB commands and refuse new ones.
+
+        Called when an activity exceeds its timeout so a hung device call
+        cannot block the scheduler. Commands fail fast (return None) until
+        clear_cancel() is called.
+        """
+        self._cancelled.set()
+
+        with self._process_lock:
+            processes = list(self._active_processes)
+
+        for process in processes:
+            try:
+                process.kill()
+            except OSError:
+                pass
+
+        self.logger.warning(f"Cancelled {len(processes)} pending ADB command(s)")
+
+    def clear_cancel(self):
+        """Allow ADB commands again after cancel_pending()"""
+        # The persistent shell was killed but may not be reaped yet; drop it
+        # so the next command starts a fresh one instead of hitting EOF
+        self._close_shell()
+        self._close_capture_proc()
+        self._cancelled.clear()
+
     def __repr__(self) -> str:
         """String representation"""
         return f"ADBConnection(device={self.device_id}, connected={self.connected})"
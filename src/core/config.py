@@ -8,20 +8,126 @@ Manages:
 - Account configurations (accounts.json)
 - Activity configurations (activities_rok.json, activities_cod.json)
 - Application settings (settings.json)
+- Optional single-file layout (config.json, one section per file above)
 - Hot-reload support (auto-detect file changes)
 """
 
-import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, List, Optional, Iterator, Iterable, Set, Tuple
+from dataclasses import dataclass, fields, MISSING
 from datetime import datetime
-import time
+import mmap
 import os
+import queue
 
+# json and fastjsonschema are imported on first use: json is only the
+# fallback when orjson is missing, and validation isn't needed on every path
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    import json
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any, pretty: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, indented or compact (orjson when available)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    import json
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Files at least this big are parsed straight from a memory map
+_MMAP_MIN_BYTES = 64 * 1024
+
+
+def _load_json_file(filepath: Path) -> Any:
+    """
+    Parse a JSON file.
+
+    Large files are memory-mapped and handed to orjson as a memoryview, so
+    the file contents aren't copied into a bytes object first.
+    """
+    if orjson is not None and filepath.stat().st_size >= _MMAP_MIN_BYTES:
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+    return _json_loads(filepath.read_bytes())
+
+
+# Schema for one entry of an activities file's "activities" list
+_ACTIVITY_SCHEMA = {
+    "type": "object",
+    "required": ["id", "name", "enabled", "priority"],
+    "properties": {
+        "priority": {"type": "number", "minimum": 1, "maximum": 10},
+    },
+}
+
+# Compiled on first validation; False once fastjsonschema is known to be missing
+_activity_validator = None
+
+
+def _get_activity_validator():
+    """Compiled fastjsonschema validator for activities, or None without fastjsonschema"""
+    global _activity_validator
+    if _activity_validator is None:
+        try:
+            import fastjsonschema
+        except ImportError:
+            _activity_validator = False
+        else:
+            _activity_validator = fastjsonschema.compile(_ACTIVITY_SCHEMA)
+    return _activity_validator or None
+
+
+# Field names per config dataclass, resolved once per class
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _flat_dict(obj) -> Dict[str, Any]:
+    """
+    Shallow dict of a flat dataclass.
+
+    Faster than asdict(), which deep-copies every value; all config
+    dataclasses here hold only scalars.
+    """
+    names = _FIELD_NAMES.get(type(obj))
+    if names is None:
+        names = tuple(f.name for f in fields(obj))
+        _FIELD_NAMES[type(obj)] = names
+
+    return {name: getattr(obj, name) for name in names}
+
+
+# Field defaults per config dataclass (MISSING for required fields)
+_FIELD_DEFAULTS: Dict[type, Dict[str, Any]] = {}
+
+
+def _field_defaults(cls) -> Dict[str, Any]:
+    """Field name -> default for a flat dataclass, resolved once per class"""
+    defaults = _FIELD_DEFAULTS.get(cls)
+    if defaults is None:
+        defaults = {f.name: f.default for f in fields(cls)}
+        _FIELD_DEFAULTS[cls] = defaults
+    return defaults
+
+
+@dataclass(slots=True)
 class AccountConfig:
     """Complete account configuration"""
     account_id: str
@@ -42,15 +148,30 @@ class AccountConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return asdict(self)
+        return _flat_dict(self)
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'AccountConfig':
         """Create from dictionary"""
         return AccountConfig(**data)
 
+    def update_from_dict(self, data: Dict[str, Any]):
+        """Update in place to match from_dict(data), keeping this object's identity"""
+        defaults = _field_defaults(AccountConfig)
+
+        unknown = data.keys() - defaults.keys()
+        if unknown:
+            raise TypeError(f"Unexpected account fields: {sorted(unknown)}")
+        missing = [name for name, default in defaults.items()
+                   if default is MISSING and name not in data]
+        if missing:
+            raise TypeError(f"Missing account fields: {missing}")
+
+        for name, default in defaults.items():
+            setattr(self, name, data.get(name, default))
+
 
-@dataclass
+@dataclass(slots=True)
 class EmulatorConfig:
     """Emulator connection settings"""
     emulator_type: str = "BlueStacks"
@@ -61,10 +182,10 @@ class EmulatorConfig:
     auto_detect: bool = True
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return _flat_dict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     """Application-wide settings"""
     # General
@@ -84,6 +205,7 @@ class AppSettings:
     screenshot_cache_duration_seconds: float = 0.5
     max_parallel_activities: int = 1
     activity_timeout_seconds: int = 300
+    pretty_output: bool = True  # Indent config files (False writes compact JSON)
 
     # Notifications
     notifications_enabled: bool = True
@@ -91,7 +213,7 @@ class AppSettings:
     notify_on_complete: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return _flat_dict(self)
 
 
 class ConfigManager:
@@ -119,14 +241,34 @@ class ConfigManager:
         self.activities_rok_file = self.config_dir / "activities_rok.json"
         self.activities_cod_file = self.config_dir / "activities_cod.json"
 
-        # File modification tracking for hot-reload
-        self._file_mtimes: Dict[Path, float] = {}
+        # Optional single-file layout: when config.json exists, each of the
+        # files above is a section of it, keyed by the file's stem
+        self.unified_file = self.config_dir / "config.json"
+        self._use_unified = self.unified_file.exists()
+        self._unified_data: Optional[Dict[str, Any]] = None
+        self._unified_mtime: float = 0.0
+
+        # File modification tracking for hot-reload, keyed by file name
+        self._file_mtimes: Dict[str, float] = {}
 
         # In-memory configuration cache
         self._accounts: List[AccountConfig] = []
+        self._accounts_by_id: Dict[str, AccountConfig] = {}
         self._settings: AppSettings = AppSettings()
         self._activities_cache: Dict[str, Dict[str, Any]] = {}
 
+        # Indented JSON for hand-edited files; follows AppSettings.pretty_output
+        self.pretty_output: bool = True
+
+        # Default emulator section written with accounts (flat, so shallow copies suffice)
+        self._default_emulator_dict = EmulatorConfig().to_dict()
+
+        # OS file-change notifications for hot-reload (watchdog, optional;
+        # check_for_updates falls back to polling mtimes without it)
+        self._change_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending_changes: set = set()
+        self._observer = self._start_observer()
+
         self.logger.info(f"Config Manager initialized (dir: {self.config_dir})")
 
     # ========================================================================
@@ -140,24 +282,29 @@ class ConfigManager:
         Returns:
             List of AccountConfig objects
         """
-        if not self.accounts_file.exists():
+        if not self._config_exists(self.accounts_file):
             self.logger.warning("No accounts.json file found - creating default")
             self._create_default_accounts_file()
             return []
 
         try:
-            with open(self.accounts_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_config(self.accounts_file)
 
+            # Accounts already in memory are updated in place, so references
+            # held elsewhere stay valid across reloads
             accounts = []
             for acc_data in data.get('accounts', []):
                 try:
-                    account = AccountConfig.from_dict(acc_data)
+                    account = self._accounts_by_id.get(acc_data.get('account_id'))
+                    if account is not None:
+                        account.update_from_dict(acc_data)
+                    else:
+                        account = AccountConfig.from_dict(acc_data)
                     accounts.append(account)
                 except Exception as e:
                     self.logger.error(f"Error parsing account {acc_data.get('account_id')}: {e}")
 
-            self._accounts = accounts
+            self._set_accounts(accounts)
             self._update_mtime(self.accounts_file)
             self.logger.info(f"Loaded {len(accounts)} accounts")
 
@@ -180,14 +327,13 @@ class ConfigManager:
         try:
             data = {
                 'accounts': [acc.to_dict() for acc in accounts],
-                'emulator': EmulatorConfig().to_dict(),
+                'emulator': dict(self._default_emulator_dict),
                 'last_updated': datetime.now().isoformat()
             }
 
-            with open(self.accounts_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_config(self.accounts_file, data)
 
-            self._accounts = accounts
+            self._set_accounts(accounts)
             self._update_mtime(self.accounts_file)
             self.logger.info(f"Saved {len(accounts)} accounts")
 
@@ -199,29 +345,83 @@ class ConfigManager:
 
     def add_account(self, account: AccountConfig) -> bool:
         """Add new account"""
-        accounts = self.load_accounts()
-        accounts.append(account)
-        return self.save_accounts(accounts)
+        return self.add_accounts([account])
+
+    def add_accounts(self, accounts: Iterable[AccountConfig]) -> bool:
+        """Add several accounts with a single save"""
+        current = list(self._get_accounts_cached())
+        current.extend(accounts)
+        return self.save_accounts(current)
 
     def remove_account(self, account_id: str) -> bool:
         """Remove account by ID"""
-        accounts = self.load_accounts()
-        accounts = [acc for acc in accounts if acc.account_id != account_id]
-        return self.save_accounts(accounts)
+        return self.remove_accounts({account_id})
+
+    def remove_accounts(self, account_ids: Set[str]) -> bool:
+        """Remove several accounts by ID with a single save"""
+        self._get_accounts_cached()
+        accounts_by_id = dict(self._accounts_by_id)
+        for account_id in account_ids:
+            accounts_by_id.pop(account_id, None)
+        return self.save_accounts(list(accounts_by_id.values()))
 
     def get_account(self, account_id: str) -> Optional[AccountConfig]:
         """Get specific account by ID"""
-        accounts = self.load_accounts()
-        for account in accounts:
-            if account.account_id == account_id:
-                return account
-        return None
+        self._get_accounts_cached()
+        return self._accounts_by_id.get(account_id)
 
     def get_enabled_accounts(self) -> List[AccountConfig]:
         """Get only enabled accounts"""
-        accounts = self.load_accounts()
+        accounts = self._get_accounts_cached()
         return [acc for acc in accounts if acc.enabled]
 
+    def iter_enabled_accounts(self) -> Iterator[AccountConfig]:
+        """
+        Lazily yield enabled accounts.
+
+        Served from memory when accounts.json is unchanged. Otherwise, if
+        ijson is installed, the file is streamed and only enabled entries
+        are turned into AccountConfig objects; disabled ones are never built.
+        Streaming doesn't refresh the in-memory cache.
+        """
+        if self.accounts_file.name in self._file_mtimes and not self._file_changed(self.accounts_file):
+            yield from (acc for acc in self._accounts if acc.enabled)
+            return
+
+        try:
+            import ijson
+        except ImportError:
+            yield from self.get_enabled_accounts()
+            return
+
+        if not self._config_exists(self.accounts_file):
+            return
+
+        if self._use_unified:
+            source, prefix = self.unified_file, 'accounts.accounts.item'
+        else:
+            source, prefix = self.accounts_file, 'accounts.item'
+
+        with open(source, 'rb') as f:
+            for acc_data in ijson.items(f, prefix):
+                if not acc_data.get('enabled', True):
+                    continue
+                try:
+                    yield AccountConfig.from_dict(acc_data)
+                except Exception as e:
+                    self.logger.error(f"Error parsing account {acc_data.get('account_id')}: {e}")
+
+    def _get_accounts_cached(self) -> List[AccountConfig]:
+        """Return in-memory accounts, re-reading accounts.json only if it changed"""
+        if self.accounts_file.name in self._file_mtimes and not self._file_changed(self.accounts_file):
+            return self._accounts
+        return self.load_accounts()
+
+    def _set_accounts(self, accounts: List[AccountConfig]):
+        """Replace the in-memory accounts and their ID index"""
+        self._accounts = accounts
+        self._accounts_by_id = {acc.account_id: acc for acc in accounts}
+
     # ========================================================================
     # ACTIVITIES CONFIGURATION
     # ========================================================================
@@ -248,14 +448,17 @@ class ConfigManager:
             if not self._file_changed(filepath):
                 return self._activities_cache[filepath]
 
-        if not filepath.exists():
+        if not self._config_exists(filepath):
             self.logger.warning(f"No {filename} found - creating default")
             self._create_default_activities_file(game.lower())
             return {"activities": []}
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_config(filepath)
+
+            for activity_data in data.get('activities', []):
+                if not self.validate_activity_config(activity_data):
+                    self.logger.warning(f"Invalid activity in {filename}: {activity_data.get('id')}")
 
             self._activities_cache[filepath] = data
             self._update_mtime(filepath)
@@ -267,6 +470,56 @@ class ConfigManager:
             self.logger.error(f"Error loading activities for {game}: {e}")
             return {}
 
+    def iter_activity_ids(self, game: str, enabled_only: bool = True) -> Iterator[str]:
+        """
+        Lazily yield activity IDs for a game.
+
+        Served from memory when the activities file is unchanged. Otherwise,
+        if ijson is installed, the file is streamed and only the ids are
+        kept, so per-activity parameters are never held in memory together.
+        Streaming doesn't refresh the in-memory cache.
+
+        Args:
+            game: Game identifier ("rok" or "cod")
+            enabled_only: Skip disabled activities
+        """
+        if game.lower() not in ['rok', 'cod']:
+            self.logger.error(f"Invalid game: {game}")
+            return
+
+        filepath = self.config_dir / f"activities_{game.lower()}.json"
+
+        if filepath in self._activities_cache and not self._file_changed(filepath):
+            activities = self._activities_cache[filepath].get('activities', [])
+        else:
+            try:
+                import ijson
+            except ImportError:
+                activities = self.load_activities(game).get('activities', [])
+            else:
+                activities = None
+
+        if activities is not None:
+            for activity_data in activities:
+                if enabled_only and not activity_data.get('enabled'):
+                    continue
+                yield activity_data['id']
+            return
+
+        if not self._config_exists(filepath):
+            return
+
+        if self._use_unified:
+            source, prefix = self.unified_file, f'{filepath.stem}.activities.item'
+        else:
+            source, prefix = filepath, 'activities.item'
+
+        with open(source, 'rb') as f:
+            for activity_data in ijson.items(f, prefix):
+                if enabled_only and not activity_data.get('enabled'):
+                    continue
+                yield activity_data['id']
+
     def save_activities(self, game: str, activities_data: Dict[str, Any]) -> bool:
         """
         Save activity configurations.
@@ -290,8 +543,7 @@ class ConfigManager:
             activities_data['last_updated'] = datetime.now().isoformat()
             activities_data['game'] = game.upper()
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(activities_data, f, indent=2, ensure_ascii=False)
+            self._write_config(filepath, activities_data)
 
             self._activities_cache[filepath] = activities_data
             self._update_mtime(filepath)
@@ -314,17 +566,17 @@ class ConfigManager:
         Returns:
             AppSettings object
         """
-        if not self.settings_file.exists():
+        if not self._config_exists(self.settings_file):
             self.logger.warning("No settings.json found - creating default")
             self._create_default_settings_file()
             return AppSettings()
 
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_config(self.settings_file)
 
             settings = AppSettings(**data.get('app', {}))
             self._settings = settings
+            self.pretty_output = settings.pretty_output
             self._update_mtime(self.settings_file)
             self.logger.info("Loaded application settings")
 
@@ -345,13 +597,13 @@ class ConfigManager:
             True if saved successfully
         """
         try:
+            self.pretty_output = settings.pretty_output
             data = {
                 'app': settings.to_dict(),
                 'last_updated': datetime.now().isoformat()
             }
 
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_config(self.settings_file, data)
 
             self._settings = settings
             self._update_mtime(self.settings_file)
@@ -371,22 +623,94 @@ class ConfigManager:
         """
         Check if any configuration files have been modified.
 
+        With a file watcher running, only files that had change events are
+        stat'ed; otherwise all config files are polled.
+
         Returns:
             List of changed file names
         """
-        changed_files = []
+        watched_files = self._config_files()
+
+        if self._observer is not None:
+            while True:
+                try:
+                    self._pending_changes.add(self._change_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if not self._pending_changes:
+                return []
+
+            if self._use_unified:
+                changed_files = []
+                if self.unified_file.name in self._pending_changes:
+                    changed_files = self._unified_changes(watched_files)
+                self._pending_changes = {self.unified_file.name} if changed_files else set()
+                return changed_files
+
+            candidates = [path for path in watched_files if path.name in self._pending_changes]
+            changed_files = [path.name for path in candidates if self._file_changed(path)]
+            # Our own saves (mtime already recorded) and unrelated files drop out;
+            # real changes stay pending until reloaded
+            self._pending_changes = set(changed_files)
+            return changed_files
+
+        if self._use_unified:
+            return self._unified_changes(watched_files)
+
+        # One directory scan instead of an exists() + stat() per file
+        watched_names = [path.name for path in watched_files]
+        current_mtimes = {}
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                if entry.name in watched_names:
+                    current_mtimes[entry.name] = entry.stat().st_mtime
+
+        return [name for name in watched_names
+                if name in current_mtimes and current_mtimes[name] > self._file_mtimes.get(name, 0)]
+
+    def _start_observer(self):
+        """Start a watchdog observer feeding _change_queue, or None if unavailable"""
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            return None
+
+        put_change = self._change_queue.put
+
+        class _ConfigChangeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                put_change(os.path.basename(event.src_path))
+                # Atomic saves arrive as a move of the .tmp file onto the target
+                dest_path = getattr(event, 'dest_path', '')
+                if dest_path:
+                    put_change(os.path.basename(dest_path))
 
-        for filepath in [self.accounts_file, self.settings_file,
-                        self.activities_rok_file, self.activities_cod_file]:
-            if filepath.exists() and self._file_changed(filepath):
-                changed_files.append(filepath.name)
+        try:
+            observer = Observer()
+            observer.schedule(_ConfigChangeHandler(), str(self.config_dir), recursive=False)
+            observer.start()
+            return observer
+        except Exception as e:
+            self.logger.warning(f"File watcher unavailable, polling for config changes: {e}")
+            return None
 
-        return changed_files
+    def close(self):
+        """Stop the file watcher"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
 
     def reload_all(self) -> bool:
         """
         Reload all configuration files.
 
+        With config.json in use, the file is parsed once for all sections.
+
         Returns:
             True if all reloaded successfully
         """
@@ -403,20 +727,189 @@ class ConfigManager:
             self.logger.error(f"Error reloading configurations: {e}")
             return False
 
+    def _config_files(self) -> List[Path]:
+        """The per-file config paths (section names in config.json)"""
+        return [self.accounts_file, self.settings_file,
+                self.activities_rok_file, self.activities_cod_file]
+
     def _file_changed(self, filepath: Path) -> bool:
         """Check if file has been modified since last load"""
-        if not filepath.exists():
+        source = self.unified_file if self._use_unified else filepath
+        if not source.exists():
             return False
 
-        current_mtime = filepath.stat().st_mtime
-        last_mtime = self._file_mtimes.get(filepath, 0)
+        current_mtime = source.stat().st_mtime
+        last_mtime = self._file_mtimes.get(filepath.name, 0)
 
         return current_mtime > last_mtime
 
+    # Top-level keys that change on every save and don't count as content
+    _TIMESTAMP_KEYS = ('last_updated', 'created_at')
+
+    def _atomic_write_json(self, filepath: Path, data: Dict[str, Any]) -> bool:
+        """
+        Write JSON via a temp file + os.replace so a crash never leaves a partial file.
+
+        The write is skipped when the file already holds the same content
+        (ignoring save timestamps), which also avoids mtime churn that would
+        trigger a spurious hot-reload.
+
+        Returns:
+            True if the file was written, False if it was unchanged
+        """
+        if filepath.exists():
+            try:
+                current = _json_loads(filepath.read_bytes())
+            except ValueError:
+                current = None
+
+            if isinstance(current, dict) and self._strip_timestamps(current) == self._strip_timestamps(data):
+                self.logger.debug(f"{filepath.name} unchanged - skipping write")
+                return False
+
+        self._replace_json(filepath, data)
+        return True
+
+    def _replace_json(self, filepath: Path, data: Dict[str, Any]):
+        """Write data to a temp file and move it over filepath"""
+        tmp_path = filepath.with_suffix(filepath.suffix + '.tmp')
+        tmp_path.write_bytes(_json_dumps(data, self.pretty_output))
+        os.replace(tmp_path, filepath)
+
+    def _strip_timestamps(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of data without the save timestamp keys"""
+        return {key: value for key, value in data.items() if key not in self._TIMESTAMP_KEYS}
+
     def _update_mtime(self, filepath: Path):
         """Update stored modification time for file"""
-        if filepath.exists():
-            self._file_mtimes[filepath] = filepath.stat().st_mtime
+        source = self.unified_file if self._use_unified else filepath
+        if source.exists():
+            self._file_mtimes[filepath.name] = source.stat().st_mtime
+
+    # ========================================================================
+    # SINGLE-FILE LAYOUT (config.json)
+    # ========================================================================
+
+    def consolidate_config_files(self) -> bool:
+        """
+        Merge the per-file configs into config.json and switch to it.
+
+        Each existing file becomes a section keyed by its stem
+        ("accounts", "settings", "activities_rok", "activities_cod");
+        the old files are removed once config.json has been written.
+
+        The single-file layout is opt-in, so nothing calls this on startup;
+        run it once (e.g. from a shell) to migrate a config directory. Later
+        ConfigManager instances pick config.json up automatically.
+
+        Returns:
+            True if consolidated, False if already consolidated or on error
+        """
+        if self._use_unified:
+            return False
+
+        sources = [path for path in self._config_files() if path.exists()]
+
+        try:
+            unified = {path.stem: _load_json_file(path) for path in sources}
+            self._replace_json(self.unified_file, unified)
+        except Exception as e:
+            self.logger.error(f"Error consolidating config files: {e}")
+            return False
+
+        for path in sources:
+            path.unlink()
+
+        self._use_unified = True
+        self._unified_data = unified
+        self._unified_mtime = self.unified_file.stat().st_mtime
+        # Sections are re-read from the parsed config.json on next access
+        self._file_mtimes.clear()
+
+        self.logger.info(f"Consolidated {len(sources)} config files into {self.unified_file.name}")
+        return True
+
+    def _config_exists(self, filepath: Path) -> bool:
+        """Check whether a config file (or its config.json section) exists"""
+        if not self._use_unified:
+            return filepath.exists()
+
+        try:
+            return filepath.stem in self._load_unified()
+        except (OSError, ValueError):
+            # Let the load report the broken file instead of overwriting it with defaults
+            return True
+
+    def _read_config(self, filepath: Path) -> Dict[str, Any]:
+        """Parse a config file, or take its section from config.json"""
+        if self._use_unified:
+            return self._load_unified()[filepath.stem]
+        return _load_json_file(filepath)
+
+    def _write_config(self, filepath: Path, data: Dict[str, Any]) -> bool:
+        """
+        Write a config file, or replace its section in config.json.
+
+        Returns:
+            True if written, False if the content was unchanged
+        """
+        if not self._use_unified:
+            return self._atomic_write_json(filepath, data)
+
+        try:
+            unified = dict(self._load_unified())
+        except FileNotFoundError:
+            unified = {}
+
+        current = unified.get(filepath.stem)
+        if isinstance(current, dict) and self._strip_timestamps(current) == self._strip_timestamps(data):
+            self.logger.debug(f"{filepath.stem} section unchanged - skipping write")
+            return False
+
+        unified[filepath.stem] = data
+        self._replace_json(self.unified_file, unified)
+
+        previous_mtime = self._unified_mtime
+        self._unified_data = unified
+        self._unified_mtime = self.unified_file.stat().st_mtime
+
+        # Only this section changed; sections that were current stay current
+        for name, mtime in self._file_mtimes.items():
+            if mtime == previous_mtime:
+                self._file_mtimes[name] = self._unified_mtime
+
+        return True
+
+    def _load_unified(self) -> Dict[str, Any]:
+        """Parsed config.json, re-parsed only when the file changed"""
+        current_mtime = self.unified_file.stat().st_mtime
+
+        if self._unified_data is None or current_mtime != self._unified_mtime:
+            data = _load_json_file(self.unified_file)
+            if not isinstance(data, dict):
+                raise ValueError(f"{self.unified_file.name} must contain a JSON object")
+            self._unified_data = data
+            self._unified_mtime = current_mtime
+
+        return self._unified_data
+
+    def _unified_changes(self, watched_files: List[Path]) -> List[str]:
+        """Names of the sections modified since last load, from one stat of config.json"""
+        if not self.unified_file.exists():
+            return []
+
+        current_mtime = self.unified_file.stat().st_mtime
+        try:
+            sections = self._load_unified()
+        except (OSError, ValueError):
+            # Report every section so the reload surfaces the broken file
+            sections = None
+
+        # Sections missing from config.json (e.g. an unused game) are never
+        # loaded, so they would otherwise show up as changed on every check
+        return [path.name for path in watched_files
+                if (sections is None or path.stem in sections)
+                and current_mtime > self._file_mtimes.get(path.name, 0)]
 
     # ========================================================================
     # DEFAULT FILE CREATION
@@ -424,6 +917,7 @@ class ConfigManager:
 
     def _create_default_accounts_file(self):
         """Create default accounts.json"""
+        now_iso = datetime.now().isoformat()
         default = {
             "accounts": [
                 {
@@ -437,15 +931,14 @@ class ConfigManager:
                     "username": None,
                     "password": None,
                     "last_active": None,
-                    "created_at": datetime.now().isoformat()
+                    "created_at": now_iso
                 }
             ],
-            "emulator": EmulatorConfig().to_dict(),
-            "created_at": datetime.now().isoformat()
+            "emulator": dict(self._default_emulator_dict),
+            "created_at": now_iso
         }
 
-        with open(self.accounts_file, 'w', encoding='utf-8') as f:
-            json.dump(default, f, indent=2, ensure_ascii=False)
+        self._write_config(self.accounts_file, default)
 
         self.logger.info("Created default accounts.json")
 
@@ -456,8 +949,7 @@ class ConfigManager:
             "created_at": datetime.now().isoformat()
         }
 
-        with open(self.settings_file, 'w', encoding='utf-8') as f:
-            json.dump(default, f, indent=2, ensure_ascii=False)
+        self._write_config(self.settings_file, default)
 
         self.logger.info("Created default settings.json")
 
@@ -512,8 +1004,7 @@ class ConfigManager:
         filename = f"activities_{game}.json"
         filepath = self.config_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(default, f, indent=2, ensure_ascii=False)
+        self._write_config(filepath, default)
 
         self.logger.info(f"Created default {filename}")
 
@@ -531,6 +1022,16 @@ class ConfigManager:
         Returns:
             True if valid, False otherwise
         """
+        validate = _get_activity_validator()
+        if validate is not None:
+            from fastjsonschema import JsonSchemaException
+            try:
+                validate(activity_data)
+                return True
+            except JsonSchemaException as e:
+                self.logger.error(f"Invalid activity config: {e.message}")
+                return False
+
         required_fields = ['id', 'name', 'enabled', 'priority']
 
         for field in required_fields:
@@ -11,18 +11,29 @@ This is the BRAIN of the automation system. It:
 COMPLETE WORKING IMPLEMENTATION - not a placeholder!
 """
 
+import heapq
+import itertools
 import logging
 import time
 import threading
-from typing import List, Dict, Optional, Callable
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional, Callable, Set, Tuple
 from datetime import datetime
-from queue import PriorityQueue, Empty
+from queue import Empty, SimpleQueue
 from dataclasses import dataclass, field
 
-from .activity import Activity, ActivityState
+from .activity import Activity, ActivityState, STATE_DISABLED
 
 
-@dataclass(order=True)
+@lru_cache(maxsize=256)
+def _default_activity_id(name: str) -> str:
+    """Registry ID for an activity name ("Alliance Help" -> "alliance_help")"""
+    return name.lower().replace(' ', '_')
+
+
+@dataclass(order=True, slots=True)
 class ScheduledTask:
     """
     Wrapper for activity in priority queue.
@@ -49,28 +60,70 @@ class ActivityScheduler:
         """Initialize scheduler"""
         self.logger = logging.getLogger("Scheduler")
 
-        # Activity registry
-        self._activities: List[Activity] = []
+        # Activity registry (insertion-ordered; the id map is the source
+        # of truth, the reverse map gives O(1) membership checks)
         self._activities_by_id: Dict[str, Activity] = {}
+        self._activity_ids: Dict[Activity, str] = {}
+        # Read-only snapshot for get_all_activities, rebuilt on (un)register
+        self._activities_snapshot: Tuple[Activity, ...] = ()
+
+        # Last get_activity_summary() result
+        self._summary_cache: Optional[List[Dict[str, any]]] = None
+
+        # Registered activities with config.enabled set, kept in sync from
+        # the activity callbacks so get_status doesn't rescan the registry
+        self._enabled: Set[Activity] = set()
+
+        # Min-heap of [next_execution_monotonic, seq, activity] entries.
+        # Superseded entries are tombstoned (activity slot set to None)
+        # and skipped on pop instead of being removed from the heap.
+        self._schedule_heap: List[list] = []
+        self._heap_entries: Dict[Activity, list] = {}
+        # Entries popped off the heap, reused by the activity's next push
+        # so steady-state rescheduling allocates nothing
+        self._spare_entries: Dict[Activity, list] = {}
+        self._heap_seq = itertools.count()
+        self._heap_lock = threading.Lock()
+
+        # Manual "run now" requests, executed by the loop thread ahead of
+        # anything in the schedule heap
+        self._execute_queue: SimpleQueue = SimpleQueue()
+
+        # Single worker for run-now requests while the loop isn't running
+        # (created on first use)
+        self._manual_executor: Optional[ThreadPoolExecutor] = None
+        self._manual_executor_finalizer: Optional[weakref.finalize] = None
+
+        # Set when the loop should re-check its queues before its wait times
+        # out: a run-now request, a new earliest deadline, or stop()
+        self._wakeup = threading.Event()
 
         # Execution state
         self.running = False
         self._scheduler_thread: Optional[threading.Thread] = None
         self._current_activity: Optional[Activity] = None
 
-        # Statistics
-        self.total_executions = 0
-        self.successful_executions = 0
-        self.failed_executions = 0
+        # Statistics: (total, successful, failed), replaced as a whole so
+        # readers on other threads always see a consistent snapshot
+        self._stats = (0, 0, 0)
         self.start_time: Optional[datetime] = None
+        self._start_monotonic = 0.0  # Uptime reference, immune to clock changes
 
         # Callbacks for UI updates
         self.on_activity_start: Optional[Callable] = None
         self.on_activity_complete: Optional[Callable] = None
         self.on_status_change: Optional[Callable] = None
 
+        # Callbacks run on their own thread so slow UI code never stalls
+        # the scheduler loop; repeated status changes still pending are
+        # coalesced into one call
+        self._callback_queue: SimpleQueue = SimpleQueue()
+        self._callback_thread: Optional[threading.Thread] = None
+        self._callback_thread_finalizer: Optional[weakref.finalize] = None
+        self._pending_statuses: Set[str] = set()
+
         # Configuration
-        self.check_interval_seconds = 10  # How often to check for due activities
+        self.check_interval_seconds = 10  # Longest idle wait between heap checks
         self.max_execution_time_seconds = 600  # Global timeout (10 min)
 
         self.logger.info("Activity Scheduler initialized")
@@ -87,19 +140,31 @@ class ActivityScheduler:
             activity: Activity instance to register
             activity_id: Optional ID for lookup (defaults to activity.name)
         """
-        if activity in self._activities:
+        if activity in self._activity_ids:
             self.logger.warning(f"Activity '{activity.name}' already registered")
             return
 
-        self._activities.append(activity)
-
         # Register by ID for lookups
-        activity_id = activity_id or activity.name.lower().replace(' ', '_')
+        activity_id = activity_id or _default_activity_id(activity.name)
+        if activity_id in self._activities_by_id:
+            self.logger.warning(f"Replacing activity registered as '{activity_id}'")
+            self.unregister_activity(activity_id)
+
         self._activities_by_id[activity_id] = activity
+        self._activity_ids[activity] = activity_id
+        self._activities_snapshot = tuple(self._activities_by_id.values())
+        self._sync_enabled(activity)
 
         # Set callbacks for activity events
         activity.on_state_change = self._on_activity_state_change
         activity.on_execution_complete = self._on_activity_execution_complete
+        activity.on_reschedule = self._on_activity_reschedule
+
+        # Queue in the schedule heap (first run time is computed lazily)
+        if activity.next_execution is None:
+            activity.set_next_execution(activity.get_next_execution_time())
+        else:
+            self._push_activity(activity)
 
         self.logger.info(
             f"Registered activity: '{activity.name}' "
@@ -120,9 +185,17 @@ class ActivityScheduler:
         if activity_id not in self._activities_by_id:
             return False
 
-        activity = self._activities_by_id[activity_id]
-        self._activities.remove(activity)
-        del self._activities_by_id[activity_id]
+        activity = self._activities_by_id.pop(activity_id)
+        del self._activity_ids[activity]
+        self._activities_snapshot = tuple(self._activities_by_id.values())
+        self._enabled.discard(activity)
+
+        activity.on_reschedule = None
+        with self._heap_lock:
+            entry = self._heap_entries.pop(activity, None)
+            if entry is not None:
+                entry[-1] = None  # Tombstone
+            self._spare_entries.pop(activity, None)
 
         self.logger.info(f"Unregistered activity: {activity_id}")
         return True
@@ -131,13 +204,18 @@ class ActivityScheduler:
         """Get activity by ID"""
         return self._activities_by_id.get(activity_id)
 
-    def get_all_activities(self) -> List[Activity]:
-        """Get all registered activities"""
-        return self._activities.copy()
+    def get_all_activities(self) -> Tuple[Activity, ...]:
+        """
+        Get all registered activities.
+
+        Returns a shared snapshot that is only rebuilt when activities are
+        registered or unregistered, so polling doesn't copy the registry.
+        """
+        return self._activities_snapshot
 
     def get_enabled_activities(self) -> List[Activity]:
-        """Get only enabled activities"""
-        return [a for a in self._activities if a.config.enabled]
+        """Get only enabled activities (scans the registry - O(N))"""
+        return [a for a in self._activities_by_id.values() if a.config.enabled]
 
     # ========================================================================
     # SCHEDULER CONTROL
@@ -155,6 +233,7 @@ class ActivityScheduler:
 
         self.running = True
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
 
         # Start scheduler thread
         self._scheduler_thread = threading.Thread(
@@ -166,8 +245,7 @@ class ActivityScheduler:
 
         self.logger.info("Scheduler started")
 
-        if self.on_status_change:
-            self.on_status_change("started")
+        self._notify_status("started")
 
     def stop(self):
         """Stop the scheduler"""
@@ -175,6 +253,7 @@ class ActivityScheduler:
             return
 
         self.running = False
+        self._wakeup.set()
 
         # Wait for thread to finish (max 5 seconds)
         if self._scheduler_thread:
@@ -182,8 +261,7 @@ class ActivityScheduler:
 
         self.logger.info("Scheduler stopped")
 
-        if self.on_status_change:
-            self.on_status_change("stopped")
+        self._notify_status("stopped")
 
     def pause(self):
         """Pause scheduler (stops executing but keeps thread alive)"""
@@ -208,6 +286,13 @@ class ActivityScheduler:
 
         while self.running:
             try:
+                # Cleared before looking at the queues, so a push that lands
+                # after the check still interrupts the wait below
+                self._wakeup.clear()
+
+                # Manual run requests first
+                self._drain_execute_queue()
+
                 # Get next activity to execute
                 activity = self._get_next_due_activity()
 
@@ -215,12 +300,12 @@ class ActivityScheduler:
                     # Execute the activity
                     self._execute_activity(activity)
                 else:
-                    # No activities due, wait before checking again
-                    time.sleep(self.check_interval_seconds)
+                    # Nothing due - sleep until the earliest deadline
+                    self._wakeup.wait(timeout=self._seconds_until_next_due())
 
             except Exception as e:
                 self.logger.error(f"Error in scheduler loop: {e}")
-                time.sleep(self.check_interval_seconds)
+                self._wakeup.wait(timeout=self.check_interval_seconds)
 
         self.logger.info("Scheduler loop ended")
 
@@ -229,43 +314,99 @@ class ActivityScheduler:
         Get the next activity that should run now.
 
         PRIORITY LOGIC:
-        1. Check all enabled activities
-        2. Filter for activities that are due (time >= next_execution)
-        3. Sort by priority (lower number = higher priority)
-        4. Return highest priority activity
+        1. Pop every heap entry whose monotonic deadline has passed
+        2. Drop tombstoned, disabled and failed-out activities
+        3. Track the highest priority while popping (lower number =
+           higher priority; heap order breaks ties)
+        4. Push the remaining due activities back onto the heap
+
+        Only due entries are touched, so a tick costs O(k log N) for
+        k due activities instead of a scan over every activity, and the
+        common single-due case builds no temporary list.
 
         Returns:
             Activity to execute or None if nothing is due
         """
-        due_activities = []
-
-        # Find all activities that are due
-        for activity in self._activities:
-            if not activity.config.enabled:
-                continue
-
-            if activity.state == ActivityState.DISABLED:
-                continue
-
-            if activity.is_due():
-                due_activities.append(activity)
+        now = time.monotonic()
+        heap = self._schedule_heap
+        best_entry = None
+        best_priority = 0
+        displaced = None  # Due entries that lost to best_entry
+
+        with self._heap_lock:
+            while heap and heap[0][0] <= now:
+                entry = heapq.heappop(heap)
+                activity = entry[-1]
+
+                if activity is None:
+                    continue  # Tombstoned
+
+                del self._heap_entries[activity]
+                self._spare_entries[activity] = entry
+
+                # Disabled activities are re-queued by enable()
+                if not activity.config.enabled or activity.state_code == STATE_DISABLED:
+                    continue
+
+                # Strictly better only: entries pop in (deadline, seq)
+                # order, so the first of equal priorities is kept
+                priority = activity.config.priority
+                if best_entry is None or priority < best_priority:
+                    if best_entry is not None:
+                        displaced = displaced or []
+                        displaced.append(best_entry)
+                    best_entry = entry
+                    best_priority = priority
+                else:
+                    displaced = displaced or []
+                    displaced.append(entry)
 
-        if not due_activities:
-            return None
+            if best_entry is None:
+                return None
 
-        # Sort by priority (lower number = higher priority)
-        due_activities.sort(key=lambda a: a.config.priority)
+            for entry in displaced or ():
+                heapq.heappush(heap, entry)
+                self._heap_entries[entry[-1]] = entry
+                del self._spare_entries[entry[-1]]
 
-        # Return highest priority activity
-        next_activity = due_activities[0]
+        next_activity = best_entry[-1]
 
         self.logger.debug(
-            f"Next activity: {next_activity.name} "
-            f"(priority={next_activity.config.priority})"
+            "Next activity: %s (priority=%s)",
+            next_activity.name, next_activity.config.priority
         )
 
         return next_activity
 
+    def _drain_execute_queue(self):
+        """Execute every queued run-now request"""
+        while self.running:
+            try:
+                activity = self._execute_queue.get_nowait()
+            except Empty:
+                return
+            self._execute_activity(activity)
+
+    def _seconds_until_next_due(self) -> float:
+        """
+        Seconds until the earliest queued deadline.
+
+        Capped at check_interval_seconds as a sanity ceiling (e.g. for a
+        deadline moved by a wall-clock adjustment elsewhere).
+        """
+        heap = self._schedule_heap
+
+        with self._heap_lock:
+            while heap and heap[0][-1] is None:
+                heapq.heappop(heap)  # Drop tombstones sitting at the top
+
+            if not heap:
+                return self.check_interval_seconds
+
+            delay = heap[0][0] - time.monotonic()
+
+        return min(max(0.0, delay), self.check_interval_seconds)
+
     def _execute_activity(self, activity: Activity):
         """
         Execute a single activity.
@@ -279,27 +420,27 @@ class ActivityScheduler:
 
         # Notify listeners
         if self.on_activity_start:
-            self.on_activity_start(activity)
+            self._dispatch_callback(self.on_activity_start, activity)
 
         self.logger.info(f"⏵ Executing activity: {activity.name}")
-        execution_start = datetime.now()
+        execution_start = time.monotonic()
 
         try:
             # Run the activity (calls activity.run())
             success = activity.run()
 
-            execution_time = (datetime.now() - execution_start).total_seconds()
+            execution_time = time.monotonic() - execution_start
 
             # Update statistics
-            self.total_executions += 1
+            total, successful, failed = self._stats
             if success:
-                self.successful_executions += 1
+                self._stats = (total + 1, successful + 1, failed)
                 self.logger.info(
                     f"✓ Activity '{activity.name}' completed successfully "
                     f"in {execution_time:.1f}s"
                 )
             else:
-                self.failed_executions += 1
+                self._stats = (total + 1, successful, failed + 1)
                 self.logger.warning(
                     f"✗ Activity '{activity.name}' failed "
                     f"after {execution_time:.1f}s"
@@ -309,11 +450,47 @@ class ActivityScheduler:
             self.logger.error(
                 f"Unexpected error executing '{activity.name}': {e}"
             )
-            self.failed_executions += 1
+            total, successful, failed = self._stats
+            self._stats = (total, successful, failed + 1)
 
         finally:
             self._current_activity = None
 
+            # Re-queue if the run did not reschedule itself
+            # (e.g. prerequisites not met) so it is retried next tick
+            if activity.on_reschedule is not None and activity not in self._heap_entries:
+                self._push_activity(activity)
+
+    def _push_activity(self, activity: Activity):
+        """
+        Push activity onto the schedule heap, tombstoning any older entry.
+
+        An entry still in the heap can't be mutated without breaking the
+        heap order, so it is tombstoned and a new one allocated; an entry
+        already popped is reused in place.
+        """
+        with self._heap_lock:
+            old_entry = self._heap_entries.get(activity)
+            if old_entry is not None:
+                old_entry[-1] = None
+                entry = None
+            else:
+                entry = self._spare_entries.pop(activity, None)
+
+            if entry is None:
+                entry = [activity.next_execution_monotonic, next(self._heap_seq), activity]
+            else:
+                entry[0] = activity.next_execution_monotonic
+                entry[1] = next(self._heap_seq)
+
+            self._heap_entries[activity] = entry
+            heapq.heappush(self._schedule_heap, entry)
+            new_head = self._schedule_heap[0] is entry
+
+        # Only an earlier deadline than the one being waited on needs a wakeup
+        if new_head:
+            self._wakeup.set()
+
     # ========================================================================
     # ACTIVITY EVENT HANDLERS
     # ========================================================================
@@ -325,55 +502,148 @@ class ActivityScheduler:
         new_state: ActivityState
     ):
         """Handle activity state changes"""
+        self._sync_enabled(activity)
         self.logger.debug(
-            f"Activity '{activity.name}': {old_state.value} → {new_state.value}"
+            "Activity '%s': %s → %s", activity.name, old_state.value, new_state.value
         )
 
+    def _on_activity_reschedule(self, activity: Activity):
+        """Handle activity next_execution changes"""
+        self._sync_enabled(activity)
+        self._push_activity(activity)
+
     def _on_activity_execution_complete(self, activity: Activity, success: bool):
         """Handle activity execution completion"""
+        self._sync_enabled(activity)  # Max retries may have disabled it
         if self.on_activity_complete:
-            self.on_activity_complete(activity, success)
+            self._dispatch_callback(self.on_activity_complete, activity, success)
+
+    # ========================================================================
+    # CALLBACK DISPATCH
+    # ========================================================================
+
+    def _dispatch_callback(self, callback: Callable, *args):
+        """Queue a UI callback for the callback thread"""
+        if self._callback_thread is None:
+            # The thread holds only the queue and logger, not the scheduler,
+            # so it doesn't keep an abandoned scheduler alive
+            self._callback_thread = threading.Thread(
+                target=self._callback_loop,
+                args=(self._callback_queue, self.logger),
+                name="SchedulerCallbacks",
+                daemon=True
+            )
+            self._callback_thread.start()
+
+            # Stop the thread when the scheduler is closed or collected
+            self._callback_thread_finalizer = weakref.finalize(
+                self, self._callback_queue.put, (None, ())
+            )
+
+        self._callback_queue.put((callback, args))
+
+    def _notify_status(self, status: str):
+        """Queue on_status_change(status) unless that status is already pending"""
+        if not self.on_status_change or status in self._pending_statuses:
+            return
+
+        self._pending_statuses.add(status)
+        self._dispatch_callback(self._deliver_status, status)
+
+    def _deliver_status(self, status: str):
+        """Run on the callback thread for a queued status change"""
+        self._pending_statuses.discard(status)
+        if self.on_status_change:
+            self.on_status_change(status)
+
+    @staticmethod
+    def _callback_loop(callback_queue: SimpleQueue, logger: logging.Logger):
+        """Run queued callbacks in order until a None sentinel arrives"""
+        while True:
+            callback, args = callback_queue.get()
+            if callback is None:
+                return
+
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Error in scheduler callback: {e}")
+
+            # Don't pin the last callback (and its scheduler) while idle
+            callback = args = None
+
+    def _sync_enabled(self, activity: Activity):
+        """Record whether a registered activity is currently enabled"""
+        if activity.config.enabled:
+            if activity in self._activity_ids:
+                self._enabled.add(activity)
+        else:
+            self._enabled.discard(activity)
 
     # ========================================================================
     # SCHEDULER INFORMATION & STATISTICS
     # ========================================================================
 
-    def get_status(self) -> Dict[str, any]:
+    def get_status(self, include_formatted: bool = True) -> Dict[str, any]:
         """
         Get current scheduler status.
 
+        Args:
+            include_formatted: Include "uptime_formatted"; callers that only
+                read the numeric fields can skip building the string
+
         Returns:
             Dictionary with status information
         """
         uptime_seconds = 0
         if self.start_time:
-            uptime_seconds = (datetime.now() - self.start_time).total_seconds()
+            uptime_seconds = time.monotonic() - self._start_monotonic
+
+        total, successful, failed = self._stats
 
         success_rate = 0.0
-        if self.total_executions > 0:
-            success_rate = self.successful_executions / self.total_executions * 100
+        if total > 0:
+            success_rate = successful / total * 100
 
-        return {
+        status = {
             "running": self.running,
-            "total_activities": len(self._activities),
-            "enabled_activities": len(self.get_enabled_activities()),
+            "total_activities": len(self._activities_by_id),
+            "enabled_activities": len(self._enabled),
             "current_activity": self._current_activity.name if self._current_activity else None,
-            "total_executions": self.total_executions,
-            "successful_executions": self.successful_executions,
-            "failed_executions": self.failed_executions,
+            "total_executions": total,
+            "successful_executions": successful,
+            "failed_executions": failed,
             "success_rate_percent": round(success_rate, 1),
             "uptime_seconds": int(uptime_seconds),
-            "uptime_formatted": self._format_uptime(uptime_seconds)
         }
 
+        if include_formatted:
+            status["uptime_formatted"] = self._format_uptime(uptime_seconds)
+
+        return status
+
     def get_activity_summary(self) -> List[Dict[str, any]]:
         """
         Get summary of all activities.
 
+        The list is reused while every activity still returns the same
+        cached statistics dict; treat it (and its dicts) as read-only.
+
         Returns:
             List of activity status dictionaries
         """
-        return [activity.get_statistics() for activity in self._activities]
+        # get_statistics() is a cache hit for unchanged activities, and a
+        # new dict means its stats (or the registry) changed, whoever
+        # rebuilt it
+        stats = [activity.get_statistics() for activity in self._activities_snapshot]
+        summary = self._summary_cache
+
+        if (summary is None or len(summary) != len(stats)
+                or any(new is not old for new, old in zip(stats, summary))):
+            summary = stats
+            self._summary_cache = summary
+
+        return summary
 
     def get_next_scheduled_activities(self, count: int = 5) -> List[Dict[str, any]]:
         """
@@ -385,31 +655,30 @@ class ActivityScheduler:
         Returns:
             List of activity info dictionaries
         """
-        # Get enabled activities with next execution time
-        scheduled = []
-        for activity in self._activities:
-            if not activity.config.enabled:
-                continue
-
-            if activity.next_execution:
-                scheduled.append({
-                    "name": activity.name,
-                    "priority": activity.config.priority,
-                    "next_execution": activity.next_execution,
-                    "time_until": (activity.next_execution - datetime.now()).total_seconds()
-                })
-
-        # Sort by next execution time
-        scheduled.sort(key=lambda x: x["next_execution"])
-
-        # Return top N
-        return scheduled[:count]
+        # Top N by next execution time, O(N log count); dicts are only
+        # built for the entries returned
+        upcoming = heapq.nsmallest(
+            count,
+            (a for a in self._activities_by_id.values()
+             if a.config.enabled and a.next_execution),
+            key=lambda a: a.next_execution
+        )
+
+        now = datetime.now()
+        return [
+            {
+                "name": activity.name,
+                "priority": activity.config.priority,
+                "next_execution": activity.next_execution,
+                "time_until": (activity.next_execution - now).total_seconds()
+            }
+            for activity in upcoming
+        ]
 
     def _format_uptime(self, seconds: float) -> str:
         """Format uptime as human-readable string"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        hours, remainder = divmod(int(seconds), 3600)
+        minutes, secs = divmod(remainder, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
     # ========================================================================
@@ -420,11 +689,15 @@ class ActivityScheduler:
         """
         Force run an activity immediately (bypass scheduling).
 
+        While the scheduler is running, the request is queued for the
+        scheduler thread, which runs it as soon as the current activity
+        (if any) finishes - activities never run concurrently.
+
         Args:
             activity_id: ID of activity to run
 
         Returns:
-            True if executed, False if not found or already running
+            True if queued or started, False if not found or already running
         """
         activity = self.get_activity(activity_id)
 
@@ -432,20 +705,29 @@ class ActivityScheduler:
             self.logger.error(f"Activity not found: {activity_id}")
             return False
 
+        self.logger.info(f"Manual execution requested: {activity.name}")
+
+        if self.running:
+            self._execute_queue.put(activity)
+            self._wakeup.set()
+            return True
+
         if self._current_activity:
             self.logger.warning(
                 f"Cannot run '{activity_id}' - another activity is running"
             )
             return False
 
-        self.logger.info(f"Manual execution requested: {activity.name}")
-
-        # Execute in scheduler thread
-        threading.Thread(
-            target=self._execute_activity,
-            args=(activity,),
-            daemon=True
-        ).start()
+        # Scheduler stopped - nothing drains the queue, hand it to the
+        # manual-run worker (one at a time, no thread per request)
+        if self._manual_executor is None:
+            self._manual_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ManualRun"
+            )
+            self._manual_executor_finalizer = weakref.finalize(
+                self, self._manual_executor.shutdown, wait=False
+            )
+        self._manual_executor.submit(self._execute_activity, activity)
 
         return True
 
@@ -454,6 +736,7 @@ class ActivityScheduler:
         activity = self.get_activity(activity_id)
         if activity:
             activity.enable()
+            self._sync_enabled(activity)
             return True
         return False
 
@@ -462,6 +745,7 @@ class ActivityScheduler:
         activity = self.get_activity(activity_id)
         if activity:
             activity.disable()
+            self._sync_enabled(activity)
             return True
         return False
 
@@ -475,12 +759,11 @@ class ActivityScheduler:
 
     def reset_all_statistics(self):
         """Reset all scheduler and activity statistics"""
-        self.total_executions = 0
-        self.successful_executions = 0
-        self.failed_executions = 0
+        self._stats = (0, 0, 0)
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
 
-        for activity in self._activities:
+        for activity in self._activities_by_id.values():
             activity.reset_statistics()
 
         self.logger.info("All statistics reset")
@@ -489,16 +772,52 @@ class ActivityScheduler:
     # UTILITY METHODS
     # ========================================================================
 
+    @property
+    def total_executions(self) -> int:
+        """Executions that ran to completion"""
+        return self._stats[0]
+
+    @property
+    def successful_executions(self) -> int:
+        """Executions that succeeded"""
+        return self._stats[1]
+
+    @property
+    def failed_executions(self) -> int:
+        """Executions that failed or raised"""
+        return self._stats[2]
+
     def __repr__(self) -> str:
         return (
             f"ActivityScheduler("
             f"running={self.running}, "
-            f"activities={len(self._activities)}, "
+            f"activities={len(self._activities_by_id)}, "
             f"executions={self.total_executions}"
             f")"
         )
 
-    def __del__(self):
-        """Cleanup when scheduler is destroyed"""
-        if self.running:
-            self.stop()
+    def close(self):
+        """
+        Stop the scheduler and release its worker threads.
+
+        Prefer this (or a `with` block) for deterministic shutdown. An
+        abandoned scheduler only gets non-blocking cleanup from its
+        finalizers, which never join threads.
+        """
+        self.stop()
+
+        if self._manual_executor_finalizer is not None:
+            self._manual_executor_finalizer()
+            self._manual_executor = None
+            self._manual_executor_finalizer = None
+
+        if self._callback_thread_finalizer is not None:
+            self._callback_thread_finalizer()
+            self._callback_thread = None
+            self._callback_thread_finalizer = None
+
+    def __enter__(self) -> 'ActivityScheduler':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -14,9 +14,14 @@ NO PLACEHOLDERS - production-ready code!
 import cv2
 import numpy as np
 import pytesseract
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Any
 from pathlib import Path
 import logging
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
 
@@ -53,16 +58,58 @@ class ScreenAnalyzer:
 
         self.logger = logging.getLogger("ScreenAnalyzer")
 
-        # Template cache for performance
-        self._template_cache: Dict[str, np.ndarray] = {}
+        # Template cache for performance: path -> (bgr, gray), LRU-bounded
+        self.template_cache_size = 128
+        self._template_cache: "OrderedDict[str, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+
+        # Grayscale of the most recent screenshot: (weakref to frame, gray)
+        self._gray_screenshot_cache: Tuple[Optional[weakref.ref], Optional[np.ndarray]] = (None, None)
+        # HSV of the most recent find_color(hsv=True) frame: (weakref, hsv)
+        self._hsv_screenshot_cache: Tuple[Optional[weakref.ref], Any] = (None, None)
+        # Half-resolution of that gray frame: (weakref to gray, half)
+        self._half_gray_cache: Tuple[Optional[weakref.ref], Optional[np.ndarray]] = (None, None)
+        # find_button/check_screen verify half-res candidates at or above this
+        # confidence at full resolution in a small ROI
+        self.half_res_refine_threshold = 0.6
 
         # OCR configuration
         self.tesseract_config = r'--oem 3 --psm 6'  # Best for game text
+        self.ocr_bimodal_ratio = 0.85  # Histogram share at the extremes for the Otsu shortcut
+
+        # Optional in-process OCR engine (see _get_tess_api); the pytesseract
+        # config string above only applies to the subprocess fallback
+        self.use_tesserocr = True
+        self._tess_api = None
+        self._tess_unavailable = False
+        self._tess_lock = threading.Lock()
 
         # Detection thresholds
         self.default_confidence_threshold = 0.8
+
+        # Multi-scale search stops once a scale scores above this
+        self.early_exit_confidence = 0.95
+
+        # matchTemplate method: TM_CCOEFF_NORMED (default) or the cheaper
+        # TM_SQDIFF_NORMED for frames with constant lighting. SQDIFF scores
+        # unrelated content far higher (often > 0.95), so both thresholds
+        # above must be retuned when switching.
+        self.match_method = cv2.TM_CCOEFF_NORMED
         self.multi_scale_steps = [0.8, 0.9, 1.0, 1.1, 1.2]  # Scale variations
 
+        # Coarse-to-fine multi-scale search
+        self.pyramid_max_level = 2  # Each level halves the screenshot
+        self.pyramid_min_template_size = 12  # Smallest template side (px) at coarse level
+        self.pyramid_roi_padding = 8  # Refinement padding (px) per coarse pixel
+        self.pyramid_candidates = 3  # Coarse peaks refined at full resolution
+
+        # Match scales concurrently (pool created on first use)
+        self.parallel_scales = True
+        self._scale_pool: Optional[ThreadPoolExecutor] = None
+
+        # Scratch frame for save_debug_image
+        self._debug_buf: Optional[np.ndarray] = None
+        self._debug_lock = threading.Lock()
+
         self.logger.info("Screen Analyzer initialized")
 
     # ========================================================================
@@ -94,15 +141,13 @@ class ScreenAnalyzer:
             confidence_threshold = self.default_confidence_threshold
 
         try:
-            # Load template (with caching)
-            template = self._load_template(template_path)
-            if template is None:
+            # Load template (with caching); matching is done in grayscale
+            template_gray = self._load_template_gray(template_path)
+            if template_gray is None:
                 self.logger.error(f"Failed to load template: {template_path}")
                 return MatchResult(found=False, confidence=0.0)
 
-            # Convert to grayscale for better matching
-            screenshot_gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
-            template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+            screenshot_gray = self._to_gray(screenshot)
 
             if multi_scale:
                 return self._find_template_multi_scale(
@@ -134,7 +179,7 @@ class ScreenAnalyzer:
         """
         try:
             # Perform template matching
-            result = cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED)
+            result = self._match_response(screenshot, template)
 
             # Find best match
             min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
@@ -164,6 +209,18 @@ class ScreenAnalyzer:
             self.logger.error(f"Error in single-scale matching: {e}")
             return MatchResult(found=False, confidence=0.0)
 
+    def _match_response(self, screenshot: np.ndarray, template: np.ndarray) -> np.ndarray:
+        """
+        Run matchTemplate with ``match_method`` as a higher-is-better map.
+
+        TM_SQDIFF_NORMED scores are flipped to 1 - distance so every caller
+        can keep picking the maximum.
+        """
+        result = cv2.matchTemplate(screenshot, template, self.match_method)
+        if self.match_method == cv2.TM_SQDIFF_NORMED:
+            np.subtract(1.0, result, out=result)
+        return result
+
     def _find_template_multi_scale(
         self,
         screenshot: np.ndarray,
@@ -176,40 +233,188 @@ class ScreenAnalyzer:
         Games often have UI elements at slightly different sizes.
         """
         best_result = MatchResult(found=False, confidence=0.0)
+        h, w = template.shape[:2]
+
+        # Gaussian pyramid of the screenshot, built once and shared by all
+        # scales. Each scale is matched on the coarsest usable level to locate
+        # a candidate, then refined at full resolution in a small ROI.
+        level = self._pyramid_level(min(h, w) * min(self.multi_scale_steps))
+        pyramid = [screenshot]
+        for _ in range(level):
+            pyramid.append(cv2.pyrDown(pyramid[-1]))
+
+        pool = self._get_scale_pool()
+        if pool is None:
+            for scale in self.multi_scale_steps:
+                result = self._match_at_scale(pyramid, template, scale, confidence_threshold)
+
+                # Keep best result
+                if result.confidence > best_result.confidence:
+                    best_result = result
+
+                # If we found a high-confidence match, we can stop
+                if best_result.confidence > self.early_exit_confidence:
+                    break
 
-        for scale in self.multi_scale_steps:
-            # Resize template
-            h, w = template.shape[:2]
-            new_w = int(w * scale)
-            new_h = int(h * scale)
+            return best_result
+
+        # Scales are independent and matchTemplate releases the GIL, so run
+        # them concurrently. Ties go to the earlier scale, as in the serial loop.
+        futures = {
+            pool.submit(self._match_at_scale, pyramid, template, scale, confidence_threshold): index
+            for index, scale in enumerate(self.multi_scale_steps)
+        }
+        best_index = len(futures)
+        for future in as_completed(futures):
+            result = future.result()
+            index = futures[future]
+            if (result.confidence > best_result.confidence
+                    or (result.confidence == best_result.confidence and index < best_index)):
+                best_result, best_index = result, index
+
+            # If we found a high-confidence match, skip scales not yet started
+            if best_result.confidence > self.early_exit_confidence:
+                for pending in futures:
+                    pending.cancel()
+                break
+
+        return best_result
 
-            if new_w <= 0 or new_h <= 0 or new_w > screenshot.shape[1] or new_h > screenshot.shape[0]:
-                continue
+    def _match_at_scale(
+        self,
+        pyramid: List[np.ndarray],
+        template: np.ndarray,
+        scale: float,
+        confidence_threshold: float
+    ) -> MatchResult:
+        """Match template resized by ``scale`` against the screenshot pyramid."""
+        screenshot = pyramid[0]
+        h, w = template.shape[:2]
 
-            scaled_template = cv2.resize(template, (new_w, new_h))
+        # Resize template
+        new_w = int(w * scale)
+        new_h = int(h * scale)
 
-            # Try matching at this scale
-            result = self._find_template_single_scale(
-                screenshot,
+        if new_w <= 0 or new_h <= 0 or new_w > screenshot.shape[1] or new_h > screenshot.shape[0]:
+            return MatchResult(found=False, confidence=0.0)
+
+        scaled_template = cv2.resize(template, (new_w, new_h))
+
+        if len(pyramid) > 1:
+            return self._find_template_coarse_to_fine(
+                pyramid,
                 scaled_template,
                 confidence_threshold
             )
+        return self._find_template_single_scale(
+            screenshot,
+            scaled_template,
+            confidence_threshold
+        )
 
-            # Keep best result
-            if result.confidence > best_result.confidence:
-                best_result = result
+    def _get_scale_pool(self) -> Optional[ThreadPoolExecutor]:
+        """
+        Get the worker pool used for multi-scale matching.
 
-            # If we found a high-confidence match, we can stop
-            if best_result.confidence > 0.95:
+        Created on first use; returns None when parallel matching is disabled
+        or there is only one CPU, in which case scales run serially.
+        """
+        if self._scale_pool is None:
+            workers = min(len(self.multi_scale_steps), os.cpu_count() or 1)
+            if not self.parallel_scales or workers < 2:
+                return None
+            self._scale_pool = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="ScreenAnalyzerScale"
+            )
+            weakref.finalize(self, self._scale_pool.shutdown, wait=False)
+        return self._scale_pool
+
+    def _pyramid_level(self, template_size: float) -> int:
+        """
+        Pick how many pyramid levels to descend for a template.
+
+        Each level halves the image; stop before the template shrinks below
+        ``pyramid_min_template_size`` pixels, where correlation peaks become
+        unreliable.
+        """
+        level = 0
+        while (level < self.pyramid_max_level
+               and template_size / (2 ** (level + 1)) >= self.pyramid_min_template_size):
+            level += 1
+        return level
+
+    def _find_template_coarse_to_fine(
+        self,
+        pyramid: List[np.ndarray],
+        template: np.ndarray,
+        confidence_threshold: float
+    ) -> MatchResult:
+        """
+        Locate template on the coarsest pyramid level, then refine at full
+        resolution inside a padded ROI around each of the strongest coarse
+        peaks.
+
+        Several peaks are refined because a decoy can win at coarse
+        resolution; if none of them passes the threshold the whole frame is
+        matched at full resolution. The returned confidence always comes from
+        a full-resolution match, so thresholds mean the same as in
+        single-scale matching.
+        """
+        level = len(pyramid) - 1
+        factor = 2 ** level
+        screenshot = pyramid[0]
+        h, w = template.shape[:2]
+
+        coarse = pyramid[level]
+        coarse_w, coarse_h = max(1, w // factor), max(1, h // factor)
+        if coarse_w > coarse.shape[1] or coarse_h > coarse.shape[0]:
+            return self._find_template_single_scale(screenshot, template, confidence_threshold)
+
+        coarse_template = cv2.resize(template, (coarse_w, coarse_h), interpolation=cv2.INTER_AREA)
+        result = self._match_response(coarse, coarse_template)
+        rows, cols = result.shape
+
+        # Refine in ROI around each candidate; pad covers the rounding lost
+        # while descending the pyramid.
+        pad = self.pyramid_roi_padding * factor
+        best_match = MatchResult(found=False, confidence=0.0)
+        for _ in range(self.pyramid_candidates):
+            _, max_val, _, (coarse_x, coarse_y) = cv2.minMaxLoc(result)
+            if max_val == -np.inf:
                 break
 
-        return best_result
+            x0 = max(0, coarse_x * factor - pad)
+            y0 = max(0, coarse_y * factor - pad)
+            x1 = min(screenshot.shape[1], coarse_x * factor + w + pad)
+            y1 = min(screenshot.shape[0], coarse_y * factor + h + pad)
+
+            match = self._find_template_single_scale(
+                screenshot[y0:y1, x0:x1],
+                template,
+                confidence_threshold
+            )
+            if match.confidence > best_match.confidence:
+                if match.found:
+                    bx, by, bw, bh = match.bbox
+                    match.bbox = (bx + x0, by + y0, bw, bh)
+                    match.location = (match.location[0] + x0, match.location[1] + y0)
+                best_match = match
+
+            # Suppress this peak so the next pick is a different location
+            result[max(0, coarse_y - coarse_h // 2):min(rows, coarse_y + coarse_h // 2 + 1),
+                   max(0, coarse_x - coarse_w // 2):min(cols, coarse_x + coarse_w // 2 + 1)] = -np.inf
+
+        if best_match.found:
+            return best_match
+        return self._find_template_single_scale(screenshot, template, confidence_threshold)
 
     def find_all_templates(
         self,
         screenshot: np.ndarray,
         template_path: str,
-        confidence_threshold: float = None
+        confidence_threshold: float = None,
+        max_matches: int = 50
     ) -> List[MatchResult]:
         """
         Find ALL instances of a template in screenshot.
@@ -220,45 +425,53 @@ class ScreenAnalyzer:
             screenshot: Screenshot as numpy array
             template_path: Path to template image
             confidence_threshold: Minimum confidence
+            max_matches: Stop after this many instances
 
         Returns:
-            List of MatchResult objects
+            List of MatchResult objects, highest confidence first
         """
         if confidence_threshold is None:
             confidence_threshold = self.default_confidence_threshold
 
         try:
-            template = self._load_template(template_path)
-            if template is None:
+            template_gray = self._load_template_gray(template_path)
+            if template_gray is None:
                 return []
 
-            screenshot_gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
-            template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+            screenshot_gray = self._to_gray(screenshot)
 
             # Match template
-            result = cv2.matchTemplate(screenshot_gray, template_gray, cv2.TM_CCOEFF_NORMED)
-
-            # Find all matches above threshold
-            locations = np.where(result >= confidence_threshold)
+            result = self._match_response(screenshot_gray, template_gray)
 
-            matches = []
             h, w = template_gray.shape[:2]
+            rows, cols = result.shape
 
-            # Group nearby matches (non-maximum suppression)
-            for pt in zip(*locations[::-1]):
-                center_x = pt[0] + w // 2
-                center_y = pt[1] + h // 2
-                confidence = result[pt[1], pt[0]]
+            # Peak picking: take the global maximum, then blank every position
+            # whose box would overlap it by more than half of its area (the
+            # same rule as overlap filtering; all boxes share one size), and
+            # repeat. Only distinct hits are visited instead of every pixel
+            # above the threshold.
+            dy, dx = np.ogrid[-h + 1:h, -w + 1:w]
+            suppress = (h - np.abs(dy)) * (w - np.abs(dx)) > 0.5 * w * h
+
+            matches = []
+            while len(matches) < max_matches:
+                _, max_val, _, (x, y) = cv2.minMaxLoc(result)
+                if max_val < confidence_threshold:
+                    break
 
                 matches.append(MatchResult(
                     found=True,
-                    confidence=float(confidence),
-                    location=(center_x, center_y),
-                    bbox=(pt[0], pt[1], w, h)
+                    confidence=float(max_val),
+                    location=(x + w // 2, y + h // 2),
+                    bbox=(x, y, w, h)
                 ))
 
-            # Filter overlapping matches
-            matches = self._filter_overlapping_matches(matches)
+                y0, x0 = max(0, y - h + 1), max(0, x - w + 1)
+                y1, x1 = min(rows, y + h), min(cols, x + w)
+                window = result[y0:y1, x0:x1]
+                window[suppress[y0 - y + h - 1:y1 - y + h - 1,
+                                x0 - x + w - 1:x1 - x + w - 1]] = -np.inf
 
             self.logger.debug(f"Found {len(matches)} instances of template")
             return matches
@@ -267,68 +480,6 @@ class ScreenAnalyzer:
             self.logger.error(f"Error finding all templates: {e}")
             return []
 
-    def _filter_overlapping_matches(
-        self,
-        matches: List[MatchResult],
-        overlap_threshold: float = 0.5
-    ) -> List[MatchResult]:
-        """
-        Filter overlapping matches using non-maximum suppression.
-
-        Keeps only the best match when multiple matches overlap.
-        """
-        if not matches:
-            return []
-
-        # Sort by confidence (highest first)
-        matches = sorted(matches, key=lambda m: m.confidence, reverse=True)
-
-        filtered = []
-
-        for match in matches:
-            # Check if this match overlaps with any kept match
-            overlap = False
-
-            for kept_match in filtered:
-                if self._matches_overlap(match, kept_match, overlap_threshold):
-                    overlap = True
-                    break
-
-            if not overlap:
-                filtered.append(match)
-
-        return filtered
-
-    def _matches_overlap(
-        self,
-        match1: MatchResult,
-        match2: MatchResult,
-        threshold: float
-    ) -> bool:
-        """Check if two matches overlap significantly"""
-        if not (match1.bbox and match2.bbox):
-            return False
-
-        x1, y1, w1, h1 = match1.bbox
-        x2, y2, w2, h2 = match2.bbox
-
-        # Calculate intersection
-        x_left = max(x1, x2)
-        y_top = max(y1, y2)
-        x_right = min(x1 + w1, x2 + w2)
-        y_bottom = min(y1 + h1, y2 + h2)
-
-        if x_right < x_left or y_bottom < y_top:
-            return False  # No overlap
-
-        intersection_area = (x_right - x_left) * (y_bottom - y_top)
-        area1 = w1 * h1
-        area2 = w2 * h2
-
-        overlap_ratio = intersection_area / min(area1, area2)
-
-        return overlap_ratio > threshold
-
     # ========================================================================
     # OCR (TEXT RECOGNITION)
     # ========================================================================
@@ -365,7 +516,7 @@ class ScreenAnalyzer:
                 image = self._preprocess_for_ocr(image)
 
             # Run Tesseract OCR
-            text = pytesseract.image_to_string(image, config=self.tesseract_config)
+            text = self._image_to_string(image, self.tesseract_config)
 
             # Clean up text
             text = text.strip()
@@ -377,6 +528,90 @@ class ScreenAnalyzer:
             self.logger.error(f"OCR error: {e}")
             return ""
 
+    def read_texts(
+        self,
+        screenshot: np.ndarray,
+        regions: List[Tuple[int, int, int, int]],
+        sep_height: int = 20
+    ) -> List[str]:
+        """
+        Read text from several regions with a single Tesseract call.
+
+        Each region is preprocessed, padded to a common width and stacked
+        into one strip separated by blank rows. Recognized words are mapped
+        back to their region by vertical position, so only one OCR process
+        is started regardless of how many regions are read.
+
+        Args:
+            screenshot: Screenshot as numpy array
+            regions: List of (x, y, width, height) regions
+            sep_height: Blank rows between stacked regions
+
+        Returns:
+            Recognized text per region, in the same order as ``regions``
+        """
+        if not regions:
+            return []
+
+        try:
+            images = []
+            for x, y, w, h in regions:
+                image = self._preprocess_for_ocr(screenshot[y:y+h, x:x+w])
+                if image.ndim == 3:
+                    image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+                images.append(image)
+
+            # Stack regions top to bottom on a white background
+            width = max(image.shape[1] for image in images)
+            tops = []
+            rows = []
+            offset = 0
+            for image in images:
+                tops.append(offset)
+                h, w = image.shape
+                rows.append(cv2.copyMakeBorder(
+                    image, 0, sep_height, 0, width - w,
+                    cv2.BORDER_CONSTANT, value=255
+                ))
+                offset += h + sep_height
+            stitched = np.vstack(rows)
+
+            data = pytesseract.image_to_data(
+                stitched,
+                config=self.tesseract_config,
+                output_type=pytesseract.Output.DICT
+            )
+
+            # Bucket words into regions by their vertical center; words of
+            # the same Tesseract line are joined with spaces, lines with \n
+            lines: List[List[List[str]]] = [[] for _ in regions]
+            last_line: List[Optional[Tuple[int, int, int]]] = [None] * len(regions)
+            tops = np.asarray(tops)
+            for i, word in enumerate(data['text']):
+                word = word.strip()
+                if not word:
+                    continue
+
+                center = data['top'][i] + data['height'][i] // 2
+                index = int(np.searchsorted(tops, center, side='right')) - 1
+                if index < 0:
+                    continue
+
+                line = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+                if line != last_line[index]:
+                    lines[index].append([])
+                    last_line[index] = line
+                lines[index][-1].append(word)
+
+            texts = ['\n'.join(' '.join(words) for words in region_lines) for region_lines in lines]
+
+            self.logger.debug(f"Batch OCR result: {texts}")
+            return texts
+
+        except Exception as e:
+            self.logger.error(f"Batch OCR error: {e}")
+            return [""] * len(regions)
+
     def read_numbers(
         self,
         screenshot: np.ndarray,
@@ -408,7 +643,7 @@ class ScreenAnalyzer:
             image = self._preprocess_for_ocr(image)
 
             # OCR
-            text = pytesseract.image_to_string(image, config=config)
+            text = self._image_to_string(image, config, single_line=True, whitelist="0123456789")
 
             # Extract numbers
             numbers = ''.join(filter(str.isdigit, text))
@@ -422,14 +657,74 @@ class ScreenAnalyzer:
             self.logger.error(f"Error reading numbers: {e}")
             return None
 
+    def _image_to_string(
+        self,
+        image: np.ndarray,
+        config: str,
+        single_line: bool = False,
+        whitelist: str = ""
+    ) -> str:
+        """
+        Run OCR on an image.
+
+        Uses the persistent tesserocr engine when available, otherwise
+        pytesseract with ``config``. ``single_line`` and ``whitelist`` mirror
+        the psm 7 / digits settings used by read_numbers.
+        """
+        api = self._get_tess_api()
+        if api is None:
+            return pytesseract.image_to_string(image, config=config)
+
+        from tesserocr import PSM
+
+        if image.ndim == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        image = np.ascontiguousarray(image)
+        h, w = image.shape
+
+        # One engine instance, so page mode and image are per-call state
+        with self._tess_lock:
+            api.SetPageSegMode(PSM.SINGLE_LINE if single_line else PSM.SINGLE_BLOCK)
+            api.SetVariable("tessedit_char_whitelist", whitelist)
+            api.SetImageBytes(image.tobytes(), w, h, 1, w)
+            return api.GetUTF8Text()
+
+    def _get_tess_api(self):
+        """
+        Return the in-process tesserocr engine when use_tesserocr is set.
+
+        The engine loads the language model once and is reused for every
+        call, instead of pytesseract starting a tesseract process per read.
+        Returns None (pytesseract path) if disabled, if tesserocr isn't
+        installed or its tessdata can't be loaded.
+        """
+        if not self.use_tesserocr or self._tess_unavailable:
+            return None
+
+        if self._tess_api is not None:
+            return self._tess_api
+
+        with self._tess_lock:
+            if self._tess_api is None:
+                try:
+                    from tesserocr import PyTessBaseAPI, PSM, OEM
+                    self._tess_api = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT)
+                    weakref.finalize(self, self._tess_api.End)
+                except Exception as e:
+                    self._tess_unavailable = True
+                    self.logger.info(f"tesserocr unavailable, using pytesseract: {e}")
+                    return None
+
+        return self._tess_api
+
     def _preprocess_for_ocr(self, image: np.ndarray) -> np.ndarray:
         """
         Preprocess image for better OCR accuracy.
 
         Applies:
         - Grayscale conversion
-        - Thresholding
-        - Noise reduction
+        - Thresholding (a single Otsu pass for already high-contrast text)
+        - Noise reduction (median filter)
         """
         try:
             # Convert to grayscale
@@ -446,6 +741,18 @@ class ScreenAnalyzer:
                 new_h = int(h * scale)
                 gray = cv2.resize(gray, (new_w, new_h))
 
+            # Clean high-contrast readouts (most pixels at either end of the
+            # histogram) only need a global threshold; adaptive thresholding
+            # and denoising would just erode the glyphs
+            hist = cv2.calcHist([gray], [0], None, [16], [0, 256]).ravel()
+            if (hist[:4].sum() + hist[-4:].sum()) > self.ocr_bimodal_ratio * hist.sum():
+                _, processed = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+                # Tesseract prefers dark text on a light background
+                if cv2.countNonZero(processed) < processed.size // 2:
+                    processed = cv2.bitwise_not(processed)
+                return processed
+
             # Apply thresholding
             # Try adaptive thresholding first
             processed = cv2.adaptiveThreshold(
@@ -457,8 +764,9 @@ class ScreenAnalyzer:
                 2
             )
 
-            # Denoise
-            processed = cv2.fastNlMeansDenoising(processed, h=10)
+            # Denoise: the image is already binary, so a 3x3 median removes
+            # speckles as well as non-local means at a fraction of the cost
+            processed = cv2.medianBlur(processed, 3)
 
             return processed
 
@@ -495,7 +803,7 @@ class ScreenAnalyzer:
             self.logger.warning(f"Button template not found: {template_path}")
             return None
 
-        result = self.find_template(screenshot, str(template_path), confidence)
+        result = self._find_template_half_res(screenshot, str(template_path), confidence)
 
         if result.found:
             return result.location
@@ -527,9 +835,90 @@ class ScreenAnalyzer:
             self.logger.warning(f"Screen template not found: {template_path}")
             return False
 
-        result = self.find_template(screenshot, str(template_path), confidence)
+        result = self._find_template_half_res(screenshot, str(template_path), confidence)
         return result.found
 
+    def _find_template_half_res(
+        self,
+        screenshot: np.ndarray,
+        template_path: str,
+        confidence_threshold: float
+    ) -> MatchResult:
+        """
+        Find template on a half-resolution copy of the screenshot.
+
+        Button and screen checks don't need pixel accuracy, so the search runs
+        on a quarter of the pixels. Candidates scoring at least
+        ``half_res_refine_threshold`` are verified at full resolution in a
+        small ROI, so a reported confidence always comes from a full-resolution
+        match. When no candidate verifies, the full-resolution search runs on
+        the whole frame, so a miss costs more than plain find_template but
+        downsampling cannot lose a match. Templates too small to benefit are
+        matched at full resolution directly.
+        """
+        try:
+            template_gray = self._load_template_gray(template_path)
+            if template_gray is None:
+                self.logger.error(f"Failed to load template: {template_path}")
+                return MatchResult(found=False, confidence=0.0)
+
+            # Only worth it while the halved template still gets a coarse
+            # pyramid level; otherwise the full-resolution search is cheaper
+            h, w = template_gray.shape[:2]
+            if not self._pyramid_level(min(h, w) // 2 * min(self.multi_scale_steps)):
+                return self.find_template(screenshot, template_path, confidence_threshold)
+
+            screenshot_gray = self._to_gray(screenshot)
+            half = self._get_half(screenshot_gray)
+            half_template = cv2.resize(template_gray, (w // 2, h // 2), interpolation=cv2.INTER_AREA)
+
+            result = self._find_template_multi_scale(half, half_template, 0.0)
+
+            if result.confidence >= self.half_res_refine_threshold and result.bbox:
+                # Verify at full resolution around the candidate
+                x, y, bw, bh = result.bbox
+                pad = max(bw, bh)
+                x0, y0 = max(0, x * 2 - pad), max(0, y * 2 - pad)
+                x1 = min(screenshot_gray.shape[1], (x + bw) * 2 + pad)
+                y1 = min(screenshot_gray.shape[0], (y + bh) * 2 + pad)
+
+                refined = self._find_template_multi_scale(
+                    screenshot_gray[y0:y1, x0:x1],
+                    template_gray,
+                    confidence_threshold
+                )
+                if refined.found:
+                    rx, ry, rw, rh = refined.bbox
+                    refined.bbox = (rx + x0, ry + y0, rw, rh)
+                    refined.location = (refined.location[0] + x0, refined.location[1] + y0)
+                    return refined
+
+            # No verified candidate: search the whole frame at full resolution
+            return self._find_template_multi_scale(
+                screenshot_gray,
+                template_gray,
+                confidence_threshold
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error in half-resolution matching: {e}")
+            return MatchResult(found=False, confidence=0.0)
+
+    def _get_half(self, screenshot_gray: np.ndarray) -> np.ndarray:
+        """
+        Downsample a grayscale screenshot by 2, reusing the last result.
+
+        Cached like _to_gray: by weak reference to the gray frame, which
+        _to_gray itself keeps stable for repeated queries on one capture.
+        """
+        source, half = self._half_gray_cache
+        if source is not None and source() is screenshot_gray:
+            return half
+
+        half = cv2.pyrDown(screenshot_gray)
+        self._half_gray_cache = (weakref.ref(screenshot_gray), half)
+        return half
+
     def wait_for_element(
         self,
         adb,
@@ -540,31 +929,48 @@ class ScreenAnalyzer:
         """
         Wait for element to appear on screen.
 
-        Useful for waiting after actions.
+        Useful for waiting after actions. Polls quickly at first and backs off
+        (x1.5 per poll, up to ``check_interval``) while nothing changes;
+        frames identical to the previous one skip template matching.
 
         Args:
             adb: ADBConnection instance
             template_path: Template to wait for
             timeout_seconds: How long to wait
-            check_interval: How often to check
+            check_interval: Longest pause between checks
 
         Returns:
             Element location or None if timeout
         """
         import time
-        start_time = time.time()
+        deadline = time.monotonic() + timeout_seconds
+        min_interval = min(0.1, check_interval)
+        interval = min_interval
+        previous_sample = None
 
-        while (time.time() - start_time) < timeout_seconds:
+        while time.monotonic() < deadline:
             screenshot = adb.capture_screen()
-            if screenshot is None:
-                continue
 
-            result = self.find_template(screenshot, template_path)
+            if screenshot is not None:
+                # Cheap change detection on a sparse grid of the gray frame;
+                # the gray conversion is reused by find_template below
+                sample = self._to_gray(screenshot)[::16, ::16].tobytes()
+
+                if sample != previous_sample:
+                    previous_sample = sample
 
-            if result.found:
-                return result.location
+                    result = self.find_template(screenshot, template_path)
 
-            time.sleep(check_interval)
+                    if result.found:
+                        return result.location
+
+                    # Screen is changing: poll again soon
+                    interval = min_interval
+                    time.sleep(interval)
+                    continue
+
+            time.sleep(interval)
+            interval = min(interval * 1.5, check_interval)
 
         self.logger.warning(f"Element not found after {timeout_seconds}s timeout")
         return None
@@ -577,40 +983,126 @@ class ScreenAnalyzer:
         self,
         screenshot: np.ndarray,
         color_bgr: Tuple[int, int, int],
-        tolerance: int = 10
-    ) -> List[Tuple[int, int]]:
+        tolerance: int = 10,
+        hsv: bool = False
+    ) -> np.ndarray:
         """
-        Find all pixels matching a color.
+        Find regions matching a color.
 
-        Useful for finding colored markers, resource nodes, etc.
+        Useful for finding colored markers, resource nodes, etc. Matching
+        pixels are grouped into 8-connected regions and one point per region
+        is returned; use find_color_pixels() for every matching pixel.
 
         Args:
             screenshot: Screenshot
             color_bgr: Color to find (B, G, R)
             tolerance: Color matching tolerance
+            hsv: Match in HSV space (see _color_mask) instead of per BGR channel
 
         Returns:
-            List of (x, y) coordinates
+            Array of shape (K, 2) with the (x, y) centroid of each region
         """
         try:
+            mask = self._color_mask(screenshot, color_bgr, tolerance, hsv)
+
+            # Label regions; label 0 is the background
+            _, _, _, centroids = cv2.connectedComponentsWithStats(mask, connectivity=8)
+
+            return np.rint(centroids[1:]).astype(np.int32)
+
+        except Exception as e:
+            self.logger.error(f"Color detection error: {e}")
+            return np.empty((0, 2), dtype=np.int32)
+
+    def find_color_pixels(
+        self,
+        screenshot: np.ndarray,
+        color_bgr: Tuple[int, int, int],
+        tolerance: int = 10,
+        hsv: bool = False
+    ) -> np.ndarray:
+        """
+        Find all pixels matching a color.
+
+        Args:
+            screenshot: Screenshot
+            color_bgr: Color to find (B, G, R)
+            tolerance: Color matching tolerance
+            hsv: Match in HSV space (see _color_mask) instead of per BGR channel
+
+        Returns:
+            Array of shape (N, 2) with the (x, y) coordinates of each pixel
+        """
+        try:
+            mask = self._color_mask(screenshot, color_bgr, tolerance, hsv)
+
+            # argwhere yields (y, x) rows; flip to (x, y)
+            return np.argwhere(mask)[:, ::-1]
+
+        except Exception as e:
+            self.logger.error(f"Color detection error: {e}")
+            return np.empty((0, 2), dtype=np.intp)
+
+    def _color_mask(
+        self,
+        screenshot: np.ndarray,
+        color_bgr: Tuple[int, int, int],
+        tolerance: int,
+        hsv: bool = False
+    ) -> np.ndarray:
+        """
+        Build an inRange mask for a color.
+
+        BGR mode matches each channel +/- tolerance. HSV mode matches hue
+        +/- tolerance (wrapping around red) and saturation/value +/- twice
+        the tolerance, which holds up better under brightness changes.
+        """
+        if not hsv:
             # Create color range
             lower = np.array([max(0, c - tolerance) for c in color_bgr])
             upper = np.array([min(255, c + tolerance) for c in color_bgr])
 
-            # Create mask
-            mask = cv2.inRange(screenshot, lower, upper)
+            return cv2.inRange(screenshot, lower, upper)
+
+        frame = self._to_hsv(screenshot)
+        hue, sat, val = (int(c) for c in cv2.cvtColor(np.uint8([[color_bgr]]), cv2.COLOR_BGR2HSV)[0, 0])
+        sat_lo, sat_hi = max(0, sat - 2 * tolerance), min(255, sat + 2 * tolerance)
+        val_lo, val_hi = max(0, val - 2 * tolerance), min(255, val + 2 * tolerance)
+
+        # OpenCV hue is 0-179; split ranges that wrap past either end
+        hue_ranges = [(max(0, hue - tolerance), min(179, hue + tolerance))]
+        if hue - tolerance < 0:
+            hue_ranges.append((180 + hue - tolerance, 179))
+        if hue + tolerance > 179:
+            hue_ranges.append((0, hue + tolerance - 180))
+
+        mask = None
+        for hue_lo, hue_hi in hue_ranges:
+            part = cv2.inRange(
+                frame,
+                np.array([hue_lo, sat_lo, val_lo]),
+                np.array([hue_hi, sat_hi, val_hi])
+            )
+            mask = part if mask is None else cv2.bitwise_or(mask, part)
 
-            # Find coordinates
-            coords = np.column_stack(np.where(mask > 0))
+        return mask.get() if isinstance(mask, cv2.UMat) else mask
 
-            # Convert to (x, y) format
-            points = [(int(x), int(y)) for y, x in coords]
+    def _to_hsv(self, screenshot: np.ndarray):
+        """
+        Convert screenshot to HSV, reusing the last conversion.
 
-            return points
+        Cached per screenshot object like _to_gray. When OpenCL is available
+        the frame is kept as a cv2.UMat so the conversion and inRange run on
+        the GPU.
+        """
+        source, hsv = self._hsv_screenshot_cache
+        if source is not None and source() is screenshot:
+            return hsv
 
-        except Exception as e:
-            self.logger.error(f"Color detection error: {e}")
-            return []
+        frame = cv2.UMat(screenshot) if cv2.ocl.useOpenCL() else screenshot
+        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        self._hsv_screenshot_cache = (weakref.ref(screenshot), hsv)
+        return hsv
 
     # ========================================================================
     # UTILITY METHODS
@@ -626,9 +1118,29 @@ class ScreenAnalyzer:
         Returns:
             Template as numpy array or None
         """
-        # Check cache
-        if template_path in self._template_cache:
-            return self._template_cache[template_path]
+        entry = self._load_template_entry(template_path)
+        return entry[0] if entry else None
+
+    def _load_template_gray(self, template_path: str) -> Optional[np.ndarray]:
+        """Load grayscale version of a template (cached with the BGR image)."""
+        entry = self._load_template_entry(template_path)
+        return entry[1] if entry else None
+
+    def _load_template_entry(self, template_path: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Load template as a cached (bgr, gray) pair.
+
+        The grayscale conversion is done once per template instead of on
+        every match.
+        """
+        # Check cache (and mark as most recently used)
+        entry = self._template_cache.get(template_path)
+        if entry is not None:
+            try:
+                self._template_cache.move_to_end(template_path)
+            except KeyError:
+                pass  # Evicted by another thread meanwhile
+            return entry
 
         # Load template
         try:
@@ -638,15 +1150,41 @@ class ScreenAnalyzer:
                 self.logger.error(f"Failed to load template: {template_path}")
                 return None
 
-            # Cache it
-            self._template_cache[template_path] = template
+            # Cache it, evicting the least recently used templates
+            entry = (template, cv2.cvtColor(template, cv2.COLOR_BGR2GRAY))
+            self._template_cache[template_path] = entry
+            while len(self._template_cache) > self.template_cache_size:
+                try:
+                    self._template_cache.popitem(last=False)
+                except KeyError:
+                    break
 
-            return template
+            return entry
 
         except Exception as e:
             self.logger.error(f"Error loading template: {e}")
             return None
 
+    def _to_gray(self, screenshot: np.ndarray) -> np.ndarray:
+        """
+        Convert screenshot to grayscale, reusing the last conversion.
+
+        Several template queries usually run against the same capture, so the
+        gray frame of the most recent screenshot object is kept. The entry is
+        held by weak reference and never outlives the screenshot itself;
+        screenshots must not be modified in place between queries.
+        """
+        if screenshot.ndim == 2:
+            return screenshot
+
+        source, gray = self._gray_screenshot_cache
+        if source is not None and source() is screenshot:
+            return gray
+
+        gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+        self._gray_screenshot_cache = (weakref.ref(screenshot), gray)
+        return gray
+
     def save_debug_image(
         self,
         screenshot: np.ndarray,
@@ -665,17 +1203,23 @@ class ScreenAnalyzer:
             return
 
         try:
-            # Draw rectangle around match
-            img_copy = screenshot.copy()
-            x, y, w, h = result.bbox
-            cv2.rectangle(img_copy, (x, y), (x + w, y + h), (0, 255, 0), 2)
-
-            # Add confidence text
-            text = f"{result.confidence:.2f}"
-            cv2.putText(img_copy, text, (x, y - 10),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-
-            cv2.imwrite(output_path, img_copy)
+            with self._debug_lock:
+                # Draw on a reused scratch frame instead of a fresh copy
+                if self._debug_buf is None or self._debug_buf.shape != screenshot.shape:
+                    self._debug_buf = np.empty_like(screenshot)
+                img_copy = self._debug_buf
+                np.copyto(img_copy, screenshot)
+
+                # Draw rectangle around match
+                x, y, w, h = result.bbox
+                cv2.rectangle(img_copy, (x, y), (x + w, y + h), (0, 255, 0), 2)
+
+                # Add confidence text
+                text = f"{result.confidence:.2f}"
+                cv2.putText(img_copy, text, (x, y - 10),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+
+                cv2.imwrite(output_path, img_copy)
             self.logger.info(f"Debug image saved to {output_path}")
 
         except Exception as e:
@@ -684,6 +1228,10 @@ class ScreenAnalyzer:
     def clear_template_cache(self):
         """Clear template cache (free memory)"""
         self._template_cache.clear()
+        self._gray_screenshot_cache = (None, None)
+        self._half_gray_cache = (None, None)
+        self._hsv_screenshot_cache = (None, None)
+        self._debug_buf = None
         self.logger.info("Template cache cleared")
 
     def __repr__(self) -> str:
@@ -10,7 +10,9 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStackedWidget, QPushButton, QLabel, QFrame, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import (
+    Qt, QTimer, QSize, QObject, QThread, pyqtSignal, pyqtSlot, QPropertyAnimation, QEasingCurve
+)
 from PyQt6.QtGui import QIcon, QFont, QAction
 
 from .pages.dashboard import DashboardPage
@@ -21,7 +23,43 @@ from .pages.statistics import StatisticsPage
 from .pages.settings import SettingsPage
 from .widgets.status_bar import ModernStatusBar
 from .widgets.control_panel import ControlPanel
-from .styles.theme import DARK_THEME
+from .styles.theme import apply_theme
+from .styles.fonts import ui_font, monospace_font
+
+
+class AdbStatusWorker(QObject):
+    """Polls ADB connection state on a worker thread."""
+
+    # Emitted only when the connection state changes
+    connection_changed = pyqtSignal(bool)
+
+    def __init__(self, adb, interval_ms=5000):
+        super().__init__()
+        self.adb = adb
+        self.interval_ms = interval_ms
+        self.connected = None  # Last known state
+        self._timer = None
+
+    @pyqtSlot()
+    def start(self):
+        """Start polling; runs on the worker thread."""
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.check)
+        self._timer.start(self.interval_ms)
+        self.check()
+
+    @pyqtSlot()
+    def check(self):
+        """Check the connection (runs `adb devices`) and report changes."""
+        try:
+            connected = bool(self.adb.is_connected())
+        except Exception as e:
+            print(f"ADB status error: {e}")
+            connected = False
+
+        if connected != self.connected:
+            self.connected = connected
+            self.connection_changed.emit(connected)
 
 
 class MainWindow(QMainWindow):
@@ -31,6 +69,7 @@ class MainWindow(QMainWindow):
     start_automation = pyqtSignal()
     stop_automation = pyqtSignal()
     pause_automation = pyqtSignal()
+    scheduler_changed = pyqtSignal()
 
     def __init__(self, scheduler=None, adb=None, screen=None):
         super().__init__()
@@ -42,8 +81,11 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Game Automation Framework")
         self.setMinimumSize(1280, 800)
 
-        # Apply modern dark theme
-        self.setStyleSheet(DARK_THEME)
+        # Apply modern dark theme application-wide. The UI font is set as
+        # the application font: stylesheet rules that only change
+        # font-size resolve the rest of the font against it
+        QApplication.setFont(ui_font())
+        apply_theme()
 
         # Setup UI
         self._setup_ui()
@@ -82,7 +124,7 @@ class MainWindow(QMainWindow):
         self.pages.setObjectName("pageContainer")
 
         # Create pages
-        self.dashboard_page = DashboardPage(self.scheduler, self.adb)
+        self.dashboard_page = DashboardPage(self.scheduler)
         self.activities_page = ActivitiesPage(self.scheduler)
         self.templates_page = TemplatesPage(self.screen)
         self.logs_page = LogsPage()
@@ -156,9 +198,9 @@ class MainWindow(QMainWindow):
 
         # Control panel at bottom
         self.control_panel = ControlPanel()
-        self.control_panel.start_clicked.connect(self.start_automation.emit)
-        self.control_panel.pause_clicked.connect(self.pause_automation.emit)
-        self.control_panel.stop_clicked.connect(self.stop_automation.emit)
+        self.control_panel.start_clicked.connect(self.start_automation)
+        self.control_panel.pause_clicked.connect(self.pause_automation)
+        self.control_panel.stop_clicked.connect(self.stop_automation)
         layout.addWidget(self.control_panel)
 
         return sidebar
@@ -169,7 +211,8 @@ class MainWindow(QMainWindow):
         btn.setObjectName("navButton")
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
         btn.setCheckable(True)
-        btn.clicked.connect(lambda: self.show_page(page_idx))
+        btn.setProperty("page_index", page_idx)
+        btn.clicked.connect(self._on_nav_clicked)
 
         # Set size policy
         btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -196,6 +239,7 @@ class MainWindow(QMainWindow):
         # Quick stats
         self.quick_stats = QLabel("⏱ 00:00:00 | ✅ 0 | ❌ 0")
         self.quick_stats.setObjectName("quickStats")
+        self.quick_stats.setFont(monospace_font(13))
         layout.addWidget(self.quick_stats)
 
         return top_bar
@@ -206,6 +250,11 @@ class MainWindow(QMainWindow):
         if self.nav_buttons:
             self.nav_buttons[0].setChecked(True)
 
+    @pyqtSlot()
+    def _on_nav_clicked(self):
+        """Show the page stored on the clicked navigation button."""
+        self.show_page(self.sender().property("page_index"))
+
     def show_page(self, index):
         """Show a specific page."""
         # Update page
@@ -226,45 +275,94 @@ class MainWindow(QMainWindow):
             current_page.refresh()
 
     def _setup_status_updates(self):
-        """Setup periodic status updates."""
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self._update_status)
-        self.status_timer.start(1000)  # Update every second
-
+        """Setup event-driven status updates."""
+        # Scheduler callbacks fire on its callback thread; the queued signal
+        # hops them onto the GUI thread and never blocks the scheduler
+        self.scheduler_changed.connect(
+            self._update_status, Qt.ConnectionType.QueuedConnection
+        )
+
+        if self.scheduler:
+            self._chain_scheduler_callback('on_status_change')
+            self._chain_scheduler_callback('on_activity_complete')
+
+        # Uptime only advances while running, so this ticks only then
+        self.uptime_timer = QTimer()
+        self.uptime_timer.timeout.connect(self._update_quick_stats)
+
+        # ADBConnection has no connect/disconnect events; poll it slowly on
+        # a worker thread so the `adb devices` call never blocks the UI
+        self.status_bar.set_adb_status(False)
+        self.adb_thread = None
+        if self.adb:
+            self.adb_thread = QThread(self)
+            self.adb_worker = AdbStatusWorker(self.adb)
+            self.adb_worker.moveToThread(self.adb_thread)
+            self.adb_thread.started.connect(self.adb_worker.start)
+            self.adb_worker.connection_changed.connect(self.status_bar.set_adb_status)
+            self.adb_worker.connection_changed.connect(self.dashboard_page.set_adb_status)
+            # Worker and its timer must be destroyed on their own thread
+            self.adb_thread.finished.connect(self.adb_worker.deleteLater)
+            self.adb_thread.start()
+
+        self._update_status()
+
+    def _chain_scheduler_callback(self, name):
+        """Emit scheduler_changed after the scheduler callback `name`."""
+        previous = getattr(self.scheduler, name)
+
+        def callback(*args):
+            if previous:
+                previous(*args)
+            self.scheduler_changed.emit()
+
+        setattr(self.scheduler, name, callback)
+
+    @pyqtSlot()
     def _update_status(self):
-        """Update status displays."""
+        """Update status displays after a scheduler state change."""
         if not self.scheduler:
             return
 
         try:
-            status = self.scheduler.get_status()
-
-            # Update quick stats
-            uptime = status.get('uptime_formatted', '00:00:00')
-            success = status.get('successful_executions', 0)
-            failed = status.get('failed_executions', 0)
-
-            self.quick_stats.setText(f"⏱ {uptime} | ✅ {success} | ❌ {failed}")
+            running = self._update_quick_stats()
 
             # Update status bar
-            if status.get('running'):
+            if running:
                 self.status_bar.set_status("running", "Running")
+                if not self.uptime_timer.isActive():
+                    self.uptime_timer.start(1000)
             else:
                 self.status_bar.set_status("stopped", "Stopped")
-
-            # Update ADB status
-            if self.adb and self.adb.is_connected():
-                self.status_bar.set_adb_status(True)
-            else:
-                self.status_bar.set_adb_status(False)
+                self.uptime_timer.stop()
 
         except Exception as e:
             print(f"Status update error: {e}")
 
+    def _update_quick_stats(self):
+        """Update the uptime/success/failure line; returns running state."""
+        if not self.scheduler:
+            return False
+
+        status = self.scheduler.get_status()
+
+        # Update quick stats
+        uptime = status.get('uptime_formatted', '00:00:00')
+        success = status.get('successful_executions', 0)
+        failed = status.get('failed_executions', 0)
+
+        self.quick_stats.setText(f"⏱ {uptime} | ✅ {success} | ❌ {failed}")
+        return status.get('running', False)
+
     def closeEvent(self, event):
         """Handle window close."""
         # Stop automation if running
         if self.scheduler and self.scheduler.running:
             self.stop_automation.emit()
 
+        self.uptime_timer.stop()
+        if self.adb_thread:
+            self.adb_thread.quit()
+            self.adb_thread.wait()
+
         event.accept()
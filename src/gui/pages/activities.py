@@ -4,13 +4,85 @@ Activities Page - Manage and Configure Activities
 View, enable/disable, configure, and manually trigger activities.
 """
 
+from html import escape
+from types import MappingProxyType
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
-    QPushButton, QScrollArea, QLineEdit, QComboBox, QDialog,
-    QSpinBox, QDoubleSpinBox, QCheckBox, QSlider, QGridLayout
+    QPushButton, QScrollArea, QLineEdit, QComboBox, QCheckBox, QSlider
+)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+
+from ..styles import set_style_property
+from .base import LazyPage
+
+
+_STATUS_TEXT = {True: "⏳ Scheduled", False: "💤 Disabled"}
+
+# Stylesheet tone per priority: 9+ critical (red), 7+ high (orange),
+# 5+ normal (blue), below that low (gray)
+_PRIORITY_TONES = tuple(
+    "danger" if p >= 9 else "warning" if p >= 7 else "info" if p >= 5 else "muted"
+    for p in range(11)
+)
+
+
+# Filter combo entries -> predicate over activity data
+_FILTERS = {
+    "All Activities": lambda data: True,
+    "Enabled Only": lambda data: data.get('enabled', False),
+    "Disabled Only": lambda data: not data.get('enabled', False),
+    "High Priority": lambda data: data.get('priority', 0) >= 7,
+}
+
+
+# Placeholder activity list until the page reads the activities config;
+# read-only so cards can hold the entries without copying
+_SAMPLE_ACTIVITIES = tuple(MappingProxyType(activity) for activity in (
+    {"id": "alliance_help", "name": "Alliance Help", "enabled": True, "priority": 9,
+     "interval_hours": 0, "interval_minutes": 8},
+    {"id": "vip_collection", "name": "VIP Collection", "enabled": True, "priority": 8,
+     "interval_hours": 1, "interval_minutes": 0},
+    {"id": "daily_login", "name": "Daily Login", "enabled": True, "priority": 10,
+     "interval_hours": 24, "interval_minutes": 0},
+    {"id": "resource_gathering", "name": "Resource Gathering", "enabled": False, "priority": 5,
+     "interval_hours": 2, "interval_minutes": 30},
+    {"id": "barbarian_hunt", "name": "Barbarian Hunt", "enabled": True, "priority": 7,
+     "interval_hours": 3, "interval_minutes": 0},
+))
+
+
+def _priority_tone(priority):
+    """Get stylesheet tone for a priority (clamped to 0-10)."""
+    return _PRIORITY_TONES[min(max(priority, 0), 10)]
+
+
+# The stats row is one rich-text label; stylesheet tone rules cannot reach
+# inside rich text, so value colors are inlined per tone
+_TONE_COLORS = {
+    "danger": "#f44336",
+    "warning": "#ff9800",
+    "info": "#4a9eff",
+    "success": "#4caf50",
+    "muted": "#888888",
+}
+
+_STAT_TITLES = ("Priority", "Interval", "Next Run", "Success")
+
+_STATS_HEADER = (
+    "<table cellspacing='0' cellpadding='0'><tr>"
+    + "".join(
+        "<td style='padding: 0 24px 3px 0; font-size: 11px; color: #888888; "
+        f"font-weight: 600;'>{title}</td>"
+        for title in _STAT_TITLES
+    )
+    + "</tr><tr>"
+)
+
+_STAT_CELL = (
+    "<td style='padding-right: 24px; font-size: 14px; color: {color}; "
+    "font-weight: 600;'>{text}</td>"
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QFont
 
 
 class ActivityCard(QFrame):
@@ -28,26 +100,7 @@ class ActivityCard(QFrame):
 
     def _setup_ui(self):
         """Setup activity card UI."""
-        self.setStyleSheet("""
-            ActivityCard {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #2d2d2d,
-                    stop:1 #252525
-                );
-                border: 1px solid #404040;
-                border-radius: 12px;
-                padding: 0px;
-            }
-            ActivityCard:hover {
-                border-color: #4a9eff;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #323232,
-                    stop:1 #2a2a2a
-                );
-            }
-        """)
+        self.setProperty("class", "activityCard")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 15, 20, 15)
@@ -61,15 +114,15 @@ class ActivityCard(QFrame):
         name_layout.setSpacing(5)
 
         self.name_label = QLabel(self.activity_data.get('name', 'Unknown'))
-        self.name_label.setStyleSheet("font-size: 16px; font-weight: 600; color: #ffffff;")
+        self.name_label.setProperty("class", "activityName")
         name_layout.addWidget(self.name_label)
 
-        self.status_label = QLabel(self._get_status_text())
-        self.status_label.setStyleSheet("font-size: 12px; color: #888888;")
+        self.status_label = QLabel(_STATUS_TEXT[bool(self.activity_data.get('enabled'))])
+        self.status_label.setProperty("class", "activityStatus")
         name_layout.addWidget(self.status_label)
 
-        header_layout.addLayout(name_layout)
-        header_layout.addStretch()
+        # Name column takes the spare width instead of a spacer item
+        header_layout.addLayout(name_layout, 1)
 
         # Enable toggle
         self.enable_checkbox = QCheckBox("Enabled")
@@ -79,34 +132,21 @@ class ActivityCard(QFrame):
 
         layout.addLayout(header_layout)
 
-        # Stats row
-        stats_layout = QHBoxLayout()
-
-        # Priority
+        # Stats row: (text, tone) per column, rendered into one label
         priority = self.activity_data.get('priority', 5)
-        priority_widget = self._create_stat("Priority", f"{priority}/10", self._get_priority_color(priority))
-        stats_layout.addWidget(priority_widget)
-
-        # Interval
-        hours = self.activity_data.get('interval_hours', 0)
-        minutes = self.activity_data.get('interval_minutes', 0)
-        interval_text = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
-        interval_widget = self._create_stat("Interval", interval_text, "#888888")
-        stats_layout.addWidget(interval_widget)
-
-        # Next run
-        next_widget = self._create_stat("Next Run", "Calculating...", "#888888")
-        self.next_run_label = next_widget.value_label
-        stats_layout.addWidget(next_widget)
-
-        # Success rate
-        success_widget = self._create_stat("Success", "0/0 (0%)", "#888888")
-        self.success_label = success_widget.value_label
-        stats_layout.addWidget(success_widget)
-
-        stats_layout.addStretch()
-
-        layout.addLayout(stats_layout)
+        tone = _priority_tone(priority)
+        self._stats = {
+            "Priority": (f"{priority}/10", tone),
+            "Interval": (self._get_interval_text(), "muted"),
+            "Next Run": ("Calculating...", "muted"),
+            "Success": ("0/0 (0%)", "muted"),
+        }
+        self._stats_html = None
+
+        self.stats_label = QLabel()
+        self.stats_label.setTextFormat(Qt.TextFormat.RichText)
+        self._render_stats()
+        layout.addWidget(self.stats_label)
 
         # Progress bar for priority
         self.priority_bar = QSlider(Qt.Orientation.Horizontal)
@@ -114,24 +154,8 @@ class ActivityCard(QFrame):
         self.priority_bar.setMaximum(10)
         self.priority_bar.setValue(priority)
         self.priority_bar.setEnabled(False)
-        self.priority_bar.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                height: 6px;
-                background: #2d2d2d;
-                border-radius: 3px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {self._get_priority_color(priority)};
-                border-radius: 3px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {self._get_priority_color(priority)};
-                width: 16px;
-                height: 16px;
-                margin: -5px 0;
-                border-radius: 8px;
-            }}
-        """)
+        self.priority_bar.setProperty("class", "priorityBar")
+        self.priority_bar.setProperty("tone", tone)
         layout.addWidget(self.priority_bar)
 
         # Action buttons
@@ -139,90 +163,125 @@ class ActivityCard(QFrame):
 
         self.run_button = QPushButton("▶ Run Now")
         self.run_button.setProperty("class", "success")
-        self.run_button.clicked.connect(lambda: self.run_clicked.emit(self.activity_data['id']))
+        self.run_button.clicked.connect(self._emit_run)
         actions_layout.addWidget(self.run_button)
 
         self.config_button = QPushButton("⚙ Configure")
-        self.config_button.clicked.connect(lambda: self.configure_clicked.emit(self.activity_data['id']))
+        self.config_button.clicked.connect(self._emit_configure)
         actions_layout.addWidget(self.config_button)
 
-        actions_layout.addStretch()
+        # Pack buttons to the left without a trailing spacer item
+        actions_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
 
         layout.addLayout(actions_layout)
 
-    def _create_stat(self, label, value, color):
-        """Create a stat label."""
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(3)
-
-        label_widget = QLabel(label)
-        label_widget.setStyleSheet("font-size: 11px; color: #888888; font-weight: 600;")
-        layout.addWidget(label_widget)
-
-        value_widget = QLabel(value)
-        value_widget.setStyleSheet(f"font-size: 14px; color: {color}; font-weight: 600;")
-        layout.addWidget(value_widget)
-
-        container.value_label = value_widget
-
-        return container
-
-    def _get_status_text(self):
-        """Get activity status text."""
-        if not self.activity_data.get('enabled'):
-            return "💤 Disabled"
-        return "⏳ Scheduled"
-
-    def _get_priority_color(self, priority):
-        """Get color based on priority."""
-        if priority >= 9:
-            return "#f44336"  # Red (critical)
-        elif priority >= 7:
-            return "#ff9800"  # Orange (high)
-        elif priority >= 5:
-            return "#4a9eff"  # Blue (normal)
-        else:
-            return "#888888"  # Gray (low)
+    def _render_stats(self):
+        """Render the stats row, skipping setText when nothing changed."""
+        html = _STATS_HEADER + "".join(
+            _STAT_CELL.format(color=_TONE_COLORS[tone], text=escape(text))
+            for text, tone in (self._stats[title] for title in _STAT_TITLES)
+        ) + "</tr></table>"
+
+        if html != self._stats_html:
+            self._stats_html = html
+            self.stats_label.setText(html)
+
+    def update_from(self, activity_data):
+        """
+        Update the card in place from new activity data.
+
+        Only widgets whose backing field changed are touched.
+        """
+        old = self.activity_data
+        if activity_data is old:
+            return
+        self.activity_data = activity_data
+
+        if activity_data.get('name') != old.get('name'):
+            self.name_label.setText(activity_data.get('name', 'Unknown'))
+
+        if activity_data.get('enabled', False) != old.get('enabled', False):
+            # Reflect the new state without echoing it back as a user toggle
+            self.enable_checkbox.blockSignals(True)
+            self.enable_checkbox.setChecked(activity_data.get('enabled', False))
+            self.enable_checkbox.blockSignals(False)
+            self.status_label.setText(_STATUS_TEXT[bool(activity_data.get('enabled'))])
 
+        priority = activity_data.get('priority', 5)
+        if priority != old.get('priority', 5):
+            tone = _priority_tone(priority)
+            self._stats["Priority"] = (f"{priority}/10", tone)
+            self.priority_bar.setValue(priority)
+            set_style_property(self.priority_bar, "tone", tone)
+
+        interval_keys = ('interval_hours', 'interval_minutes')
+        if any(activity_data.get(k, 0) != old.get(k, 0) for k in interval_keys):
+            self._stats["Interval"] = (self._get_interval_text(), "muted")
+
+        self._render_stats()
+
+    def _get_interval_text(self):
+        """Get human readable interval text."""
+        hours = self.activity_data.get('interval_hours', 0)
+        minutes = self.activity_data.get('interval_minutes', 0)
+        return f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+
+    @pyqtSlot()
+    def _emit_run(self):
+        """Forward the Run Now click with this card's activity id."""
+        self.run_clicked.emit(self.activity_data['id'])
+
+    @pyqtSlot()
+    def _emit_configure(self):
+        """Forward the Configure click with this card's activity id."""
+        self.configure_clicked.emit(self.activity_data['id'])
+
+    @pyqtSlot(bool)
     def _on_toggle(self, checked):
         """Handle enable/disable toggle."""
         self.toggle_clicked.emit(self.activity_data['id'], checked)
-        self.status_label.setText(self._get_status_text())
+        self.status_label.setText(_STATUS_TEXT[checked])
+
+    def reset_stats(self):
+        """Reset the runtime stats to their initial placeholders."""
+        self._stats["Next Run"] = ("Calculating...", "muted")
+        self._stats["Success"] = ("0/0 (0%)", "muted")
+        self._render_stats()
 
     def update_stats(self, next_run_time, success_count, fail_count):
         """Update activity stats."""
         # Update next run
-        if next_run_time:
-            self.next_run_label.setText(next_run_time)
-        else:
-            self.next_run_label.setText("--")
+        self._stats["Next Run"] = (next_run_time or "--", "muted")
 
         # Update success rate
         total = success_count + fail_count
         if total > 0:
             rate = int((success_count / total) * 100)
-            self.success_label.setText(f"{success_count}/{total} ({rate}%)")
 
             if rate >= 90:
-                self.success_label.setStyleSheet("font-size: 14px; color: #4caf50; font-weight: 600;")
+                tone = "success"
             elif rate >= 70:
-                self.success_label.setStyleSheet("font-size: 14px; color: #ff9800; font-weight: 600;")
+                tone = "warning"
             else:
-                self.success_label.setStyleSheet("font-size: 14px; color: #f44336; font-weight: 600;")
+                tone = "danger"
+            self._stats["Success"] = (f"{success_count}/{total} ({rate}%)", tone)
 
+        self._render_stats()
 
-class ActivitiesPage(QWidget):
+
+class ActivitiesPage(LazyPage):
     """Activities management page."""
 
+    # Removed cards kept around for reuse by later reloads
+    CARD_POOL_SIZE = 8
+
     def __init__(self, scheduler=None):
         super().__init__()
 
         self.scheduler = scheduler
         self.activity_cards = {}
-
-        self._setup_ui()
+        self._placeholder = None
+        self._card_pool = []
 
     def _setup_ui(self):
         """Setup activities page UI."""
@@ -236,12 +295,18 @@ class ActivitiesPage(QWidget):
         # Search
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 Search activities...")
-        self.search_input.textChanged.connect(self._filter_activities)
         header_layout.addWidget(self.search_input, 1)
 
+        # Debounce typing so a burst of keystrokes filters once
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._filter_activities)
+        self.search_input.textChanged.connect(self._search_timer.start)
+
         # Filter combo
         self.filter_combo = QComboBox()
-        self.filter_combo.addItems(["All Activities", "Enabled Only", "Disabled Only", "High Priority"])
+        self.filter_combo.addItems(list(_FILTERS))
         self.filter_combo.currentTextChanged.connect(self._filter_activities)
         header_layout.addWidget(self.filter_combo)
 
@@ -261,6 +326,7 @@ class ActivitiesPage(QWidget):
         self.activities_layout = QVBoxLayout(scroll_widget)
         self.activities_layout.setSpacing(15)
         self.activities_layout.setContentsMargins(0, 0, 0, 0)
+        self.activities_layout.addStretch()
 
         scroll.setWidget(scroll_widget)
         layout.addWidget(scroll)
@@ -269,80 +335,125 @@ class ActivitiesPage(QWidget):
         self._load_activities()
 
     def _load_activities(self):
-        """Load activities from scheduler."""
-        # Clear existing
-        while self.activities_layout.count():
-            item = self.activities_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        self.activity_cards.clear()
+        """
+        Load activities from scheduler.
 
+        Cards are diffed by activity id: existing cards are updated in
+        place, and only added or removed activities create or destroy
+        widgets.
+        """
         if not self.scheduler:
+            self._sync_cards([])
+
             # Show placeholder
-            placeholder = QLabel("No scheduler connected")
-            placeholder.setStyleSheet("font-size: 14px; color: #888888; padding: 40px;")
-            placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.activities_layout.addWidget(placeholder)
+            if self._placeholder is None:
+                self._placeholder = QLabel("No scheduler connected")
+                self._placeholder.setProperty("class", "placeholder")
+                self._placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.activities_layout.insertWidget(0, self._placeholder)
             return
 
-        # Load from config (we'll need to pass activity data)
-        # For now, create sample activities
-        sample_activities = [
-            {"id": "alliance_help", "name": "Alliance Help", "enabled": True, "priority": 9,
-             "interval_hours": 0, "interval_minutes": 8},
-            {"id": "vip_collection", "name": "VIP Collection", "enabled": True, "priority": 8,
-             "interval_hours": 1, "interval_minutes": 0},
-            {"id": "daily_login", "name": "Daily Login", "enabled": True, "priority": 10,
-             "interval_hours": 24, "interval_minutes": 0},
-            {"id": "resource_gathering", "name": "Resource Gathering", "enabled": False, "priority": 5,
-             "interval_hours": 2, "interval_minutes": 30},
-            {"id": "barbarian_hunt", "name": "Barbarian Hunt", "enabled": True, "priority": 7,
-             "interval_hours": 3, "interval_minutes": 0},
-        ]
-
-        for activity_data in sample_activities:
-            card = ActivityCard(activity_data)
-            card.run_clicked.connect(self._run_activity)
-            card.configure_clicked.connect(self._configure_activity)
-            card.toggle_clicked.connect(self._toggle_activity)
-
-            self.activities_layout.addWidget(card)
-            self.activity_cards[activity_data['id']] = card
-
-        self.activities_layout.addStretch()
+        if self._placeholder is not None:
+            self.activities_layout.removeWidget(self._placeholder)
+            self._placeholder.deleteLater()
+            self._placeholder = None
 
+        # Load from config (we'll need to pass activity data)
+        # For now, show the sample activities
+        self._sync_cards(_SAMPLE_ACTIVITIES)
+
+    def _sync_cards(self, activities):
+        """Bring the card list in line with activities, preserving order."""
+        new_ids = {activity_data['id'] for activity_data in activities}
+
+        # Adding or removing cards relayouts the list once per widget;
+        # suspend painting so the whole batch lands in a single repaint.
+        # In-place updates are left alone, Qt already coalesces those.
+        batch = new_ids != self.activity_cards.keys()
+        if batch:
+            self.setUpdatesEnabled(False)
+
+        try:
+            for old_id in set(self.activity_cards) - new_ids:
+                card = self.activity_cards.pop(old_id)
+                self.activities_layout.removeWidget(card)
+                if len(self._card_pool) < self.CARD_POOL_SIZE:
+                    card.hide()
+                    self._card_pool.append(card)
+                else:
+                    card.deleteLater()
+
+            for index, activity_data in enumerate(activities):
+                card = self.activity_cards.get(activity_data['id'])
+
+                if card is None:
+                    if self._card_pool:
+                        # Pooled cards keep their signal connections to this page
+                        card = self._card_pool.pop()
+                        card.update_from(activity_data)
+                        card.reset_stats()
+                        card.show()
+                    else:
+                        card = ActivityCard(activity_data)
+                        card.run_clicked.connect(self._run_activity)
+                        card.configure_clicked.connect(self._configure_activity)
+                        card.toggle_clicked.connect(self._toggle_activity)
+
+                    self.activities_layout.insertWidget(index, card)
+                    self.activity_cards[activity_data['id']] = card
+                    continue
+
+                card.update_from(activity_data)
+                if self.activities_layout.indexOf(card) != index:
+                    self.activities_layout.removeWidget(card)
+                    self.activities_layout.insertWidget(index, card)
+        finally:
+            if batch:
+                self.setUpdatesEnabled(True)
+
+        # Pooled cards come back shown and updated ones may have changed
+        # state; bring them all in line with the active search and filter
+        self._filter_activities()
+
+    @pyqtSlot()
     def _filter_activities(self):
         """Filter activities based on search and filter."""
+        self._search_timer.stop()
+
         search_text = self.search_input.text().lower()
-        filter_type = self.filter_combo.currentText()
+        type_match = _FILTERS.get(self.filter_combo.currentText(), _FILTERS["All Activities"])
 
+        changes = []
         for activity_id, card in self.activity_cards.items():
-            # Search filter
-            name_match = search_text in card.activity_data['name'].lower()
+            data = card.activity_data
+            visible = search_text in data['name'].lower() and bool(type_match(data))
+            if visible != card.isVisibleTo(self):
+                changes.append((card, visible))
 
-            # Type filter
-            type_match = True
-            if filter_type == "Enabled Only":
-                type_match = card.activity_data.get('enabled', False)
-            elif filter_type == "Disabled Only":
-                type_match = not card.activity_data.get('enabled', False)
-            elif filter_type == "High Priority":
-                type_match = card.activity_data.get('priority', 0) >= 7
+        if not changes:
+            return
 
-            # Show/hide card
-            card.setVisible(name_match and type_match)
+        # Show/hide cards under one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            for card, visible in changes:
+                card.setVisible(visible)
+        finally:
+            self.setUpdatesEnabled(True)
 
+    @pyqtSlot(str)
     def _run_activity(self, activity_id):
         """Run activity manually."""
         print(f"Running activity: {activity_id}")
         # TODO: Implement manual run
 
+    @pyqtSlot(str)
     def _configure_activity(self, activity_id):
         """Open configuration dialog."""
         print(f"Configuring activity: {activity_id}")
         # TODO: Implement configuration dialog
 
+    @pyqtSlot(str, bool)
     def _toggle_activity(self, activity_id, enabled):
         """Toggle activity enabled state."""
         print(f"Toggle activity {activity_id}: {enabled}")
@@ -0,0 +1,31 @@
+"""
+Lazy Page Base
+
+Pages in the main QStackedWidget build their widget tree on first show,
+so startup only pays for the page that is actually displayed.
+"""
+
+from PyQt6.QtWidgets import QWidget
+
+
+class LazyPage(QWidget):
+    """Page whose UI is built by _setup_ui() the first time it is shown."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._built = False
+
+    def _setup_ui(self):
+        """Build the page widgets (override in subclasses)."""
+        raise NotImplementedError
+
+    def ensure_built(self):
+        """Build the page UI if it has not been built yet."""
+        if not self._built:
+            self._built = True
+            self._setup_ui()
+
+    def showEvent(self, event):
+        """Build the UI on first show."""
+        self.ensure_built()
+        super().showEvent(event)
@@ -4,22 +4,45 @@ Dashboard Page - Overview and Real-time Status
 Shows real-time automation status, activity timeline, and quick stats.
 """
 
+import time
+from datetime import datetime
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QFrame, QGridLayout, QScrollArea, QTextEdit
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QPlainTextEdit
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import QTimer, pyqtSlot
+
+from ..styles import set_style_property, monospace_font
 
 
 class DashboardPage(QWidget):
     """Main dashboard showing automation overview."""
 
-    def __init__(self, scheduler=None, adb=None):
+    CONSOLE_MAX_LINES = 500
+    TIMELINE_ROWS = 5
+
+    # get_status() is reused within one tick; the upcoming list is only
+    # re-queried when the scheduler state changes or every UPCOMING_TTL
+    STATUS_TTL = 0.9
+    UPCOMING_TTL = 5.0
+
+    def __init__(self, scheduler=None):
         super().__init__()
 
         self.scheduler = scheduler
-        self.adb = adb
+
+        # Last text pushed to each label, so unchanged values skip setText
+        self._last_values = {}
+        self._adb_connected = None
+
+        self._status_cache = None
+        self._status_time = 0.0
+        self._upcoming_cache = []
+        self._upcoming_key = None
+        self._upcoming_time = 0.0
+
+        # Console lines waiting for the next batched flush
+        self._log_buffer = []
 
         self._setup_ui()
         self._setup_updates()
@@ -56,11 +79,10 @@ class DashboardPage(QWidget):
 
         self.current_activity = QLabel("Idle")
         self.current_activity.setObjectName("currentActivity")
-        self.current_activity.setStyleSheet("font-size: 18px; font-weight: 600; color: #4a9eff;")
         status_layout.addWidget(self.current_activity)
 
         self.next_activity = QLabel("Next: --")
-        self.next_activity.setStyleSheet("font-size: 14px; color: #b0b0b0; margin-top: 10px;")
+        self.next_activity.setObjectName("nextActivity")
         status_layout.addWidget(self.next_activity)
 
         status_card.layout().addLayout(status_layout)
@@ -87,11 +109,13 @@ class DashboardPage(QWidget):
         timeline_card = self._create_card("📅 Upcoming Activities")
         self.timeline_container = QVBoxLayout()
 
-        self.timeline_items = []
-        for i in range(5):
-            item = self._create_timeline_item("--", "--", "⏳")
-            self.timeline_items.append(item)
+        self.timeline_items = [
+            self._create_timeline_item("--", "--", "⏳") for _ in range(self.TIMELINE_ROWS)
+        ]
+        for item in self.timeline_items:
             self.timeline_container.addWidget(item)
+        # (name, whole seconds until) last shown per row; None when empty
+        self._last_timeline = [None] * self.TIMELINE_ROWS
 
         timeline_card.layout().addLayout(self.timeline_container)
         layout.addWidget(timeline_card)
@@ -99,20 +123,12 @@ class DashboardPage(QWidget):
         # Live console log
         log_card = self._create_card("📝 Live Console")
 
-        self.console_log = QTextEdit()
+        self.console_log = QPlainTextEdit()
         self.console_log.setReadOnly(True)
+        self.console_log.setMaximumBlockCount(self.CONSOLE_MAX_LINES)
         self.console_log.setMaximumHeight(200)
-        self.console_log.setStyleSheet("""
-            QTextEdit {
-                background-color: #1a1a1a;
-                color: #e0e0e0;
-                border: 1px solid #333333;
-                border-radius: 6px;
-                padding: 10px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 12px;
-            }
-        """)
+        self.console_log.setObjectName("consoleLog")
+        self.console_log.setFont(monospace_font(12))
 
         log_card.layout().addWidget(self.console_log)
         layout.addWidget(log_card)
@@ -131,11 +147,11 @@ class DashboardPage(QWidget):
         # Icon and title
         header_layout = QHBoxLayout()
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 24px;")
+        icon_label.setProperty("class", "statIcon")
         header_layout.addWidget(icon_label)
 
         title_label = QLabel(title)
-        title_label.setStyleSheet("color: #888888; font-size: 11px; font-weight: 600;")
+        title_label.setProperty("class", "statTitle")
         header_layout.addWidget(title_label)
         header_layout.addStretch()
 
@@ -144,7 +160,7 @@ class DashboardPage(QWidget):
         # Value
         value_label = QLabel(value)
         value_label.setObjectName(f"{title.lower().replace(' ', '_')}_value")
-        value_label.setStyleSheet("font-size: 28px; font-weight: 700; color: #ffffff; margin-top: 10px;")
+        value_label.setProperty("class", "statValue")
         card_layout.addWidget(value_label)
 
         # Store reference
@@ -155,22 +171,14 @@ class DashboardPage(QWidget):
     def _create_card(self, title):
         """Create a standard card with title."""
         card = QFrame()
-        card.setProperty("class", "card")
-        card.setStyleSheet("""
-            QFrame[class="card"] {
-                background-color: #252525;
-                border: 1px solid #333333;
-                border-radius: 8px;
-                padding: 0px;
-            }
-        """)
+        card.setProperty("class", "panel")
 
         layout = QVBoxLayout(card)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
 
         title_label = QLabel(title)
-        title_label.setStyleSheet("font-size: 16px; font-weight: 600; color: #ffffff;")
+        title_label.setProperty("class", "panelTitle")
         layout.addWidget(title_label)
 
         return card
@@ -182,14 +190,14 @@ class DashboardPage(QWidget):
         layout.setContentsMargins(0, 5, 0, 5)
 
         label_widget = QLabel(label)
-        label_widget.setStyleSheet("font-size: 14px; color: #e0e0e0;")
+        label_widget.setProperty("class", "healthLabel")
         layout.addWidget(label_widget)
 
         layout.addStretch()
 
         status_widget = QLabel(status)
         status_widget.setObjectName(f"{label}_status")
-        status_widget.setStyleSheet("font-size: 13px; color: #888888;")
+        status_widget.setProperty("class", "healthStatus")
         layout.addWidget(status_widget)
 
         container.status_widget = status_widget
@@ -199,35 +207,24 @@ class DashboardPage(QWidget):
     def _create_timeline_item(self, activity, time_str, icon):
         """Create a timeline item."""
         item = QFrame()
-        item.setStyleSheet("""
-            QFrame {
-                background-color: #2d2d2d;
-                border: 1px solid #404040;
-                border-radius: 6px;
-                padding: 10px;
-                margin: 2px 0;
-            }
-            QFrame:hover {
-                background-color: #323232;
-                border-color: #4a9eff;
-            }
-        """)
+        item.setProperty("class", "timelineItem")
 
         layout = QHBoxLayout(item)
         layout.setContentsMargins(10, 8, 10, 8)
 
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 16px;")
+        icon_label.setProperty("class", "timelineIcon")
         layout.addWidget(icon_label)
 
         name_label = QLabel(activity)
-        name_label.setStyleSheet("font-size: 14px; color: #e0e0e0; font-weight: 500;")
+        name_label.setProperty("class", "timelineName")
         layout.addWidget(name_label)
 
         layout.addStretch()
 
         time_label = QLabel(time_str)
-        time_label.setStyleSheet("font-size: 13px; color: #888888; font-family: 'Consolas', monospace;")
+        time_label.setProperty("class", "timelineTime")
+        time_label.setFont(monospace_font(13))
         layout.addWidget(time_label)
 
         item.name_label = name_label
@@ -237,10 +234,25 @@ class DashboardPage(QWidget):
         return item
 
     def _setup_updates(self):
-        """Setup periodic updates."""
-        self.update_timer = QTimer()
+        """Setup periodic updates (only run while the page is shown)."""
+        self.update_timer = QTimer(self)
+        self.update_timer.setInterval(1000)
         self.update_timer.timeout.connect(self.refresh)
-        self.update_timer.start(1000)
+
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(100)
+        self.log_flush_timer.timeout.connect(self._flush_log)
+
+    def showEvent(self, event):
+        """Resume periodic updates when the page becomes visible."""
+        super().showEvent(event)
+        self.update_timer.start()
+
+    def hideEvent(self, event):
+        """Stop polling the scheduler while another page is shown."""
+        super().hideEvent(event)
+        self.update_timer.stop()
 
     def refresh(self):
         """Refresh dashboard data."""
@@ -248,27 +260,34 @@ class DashboardPage(QWidget):
             return
 
         try:
-            status = self.scheduler.get_status()
+            status = self._get_status()
 
             # Update stat cards
-            self.uptime_card.value_label.setText(status.get('uptime_formatted', '00:00:00'))
-            self.success_card.value_label.setText(str(status.get('successful_executions', 0)))
-            self.failed_card.value_label.setText(str(status.get('failed_executions', 0)))
-            self.rate_card.value_label.setText(f"{status.get('success_rate_percent', 0)}%")
+            self._set_text(self.uptime_card.value_label, status.get('uptime_formatted', '00:00:00'))
+            self._set_text(self.success_card.value_label, str(status.get('successful_executions', 0)))
+            self._set_text(self.failed_card.value_label, str(status.get('failed_executions', 0)))
+            self._set_text(self.rate_card.value_label, f"{status.get('success_rate_percent', 0)}%")
 
             # Update current activity
             current = status.get('current_activity', 'Idle')
-            self.current_activity.setText(current if current else "Idle")
+            self._set_text(self.current_activity, current if current else "Idle")
 
             # Update next activities
-            next_activities = self.scheduler.get_next_scheduled_activities(5)
+            next_activities = self._get_next_activities(status)
 
             for i, item in enumerate(self.timeline_items):
                 if i < len(next_activities):
                     act = next_activities[i]
-                    item.name_label.setText(act['name'])
 
+                    # Countdowns only change once per whole second
                     time_until = int(act['time_until'])
+                    key = (act['name'], time_until)
+                    if key == self._last_timeline[i]:
+                        continue
+                    self._last_timeline[i] = key
+
+                    self._set_text(item.name_label, act['name'])
+
                     if time_until < 0:
                         time_str = "NOW"
                         icon = "▶️"
@@ -279,29 +298,97 @@ class DashboardPage(QWidget):
                         time_str = f"in {time_until//60}m {time_until%60}s"
                         icon = "⏰"
 
-                    item.time_label.setText(time_str)
-                    item.icon_label.setText(icon)
-                else:
-                    item.name_label.setText("--")
-                    item.time_label.setText("--")
-                    item.icon_label.setText("⏳")
-
-            # Update system health
-            if self.adb:
-                if self.adb.is_connected():
-                    self.adb_status.status_widget.setText("✅ Connected")
-                    self.adb_status.status_widget.setStyleSheet("font-size: 13px; color: #4caf50; font-weight: 600;")
+                    self._set_text(item.time_label, time_str)
+                    self._set_text(item.icon_label, icon)
                 else:
-                    self.adb_status.status_widget.setText("❌ Disconnected")
-                    self.adb_status.status_widget.setStyleSheet("font-size: 13px; color: #f44336; font-weight: 600;")
+                    if self._last_timeline[i] is None:
+                        continue
+                    self._last_timeline[i] = None
+
+                    self._set_text(item.name_label, "--")
+                    self._set_text(item.time_label, "--")
+                    self._set_text(item.icon_label, "⏳")
 
         except Exception as e:
             print(f"Dashboard refresh error: {e}")
 
+    @pyqtSlot(bool)
+    def set_adb_status(self, connected):
+        """
+        Show the ADB connection state in the system health panel.
+
+        Connected to AdbStatusWorker.connection_changed, so the `adb devices`
+        check runs on the worker thread instead of in refresh().
+        """
+        if connected == self._adb_connected:
+            return
+        self._adb_connected = connected
+
+        if connected:
+            self.adb_status.status_widget.setText("✅ Connected")
+            set_style_property(self.adb_status.status_widget, "state", "ok")
+        else:
+            self.adb_status.status_widget.setText("❌ Disconnected")
+            set_style_property(self.adb_status.status_widget, "state", "error")
+
+    def _get_status(self):
+        """Get scheduler status, reusing it for STATUS_TTL seconds."""
+        now = time.monotonic()
+        if self._status_cache is None or now - self._status_time > self.STATUS_TTL:
+            self._status_cache = self.scheduler.get_status()
+            self._status_time = now
+        return self._status_cache
+
+    def _get_next_activities(self, status):
+        """
+        Get the next scheduled activities.
+
+        The list is re-queried when a run starts or finishes, when the set
+        of enabled activities changes, or after UPCOMING_TTL seconds;
+        otherwise only the countdowns are recomputed.
+        """
+        key = (
+            status.get('current_activity'),
+            status.get('total_executions'),
+            status.get('enabled_activities'),
+            status.get('total_activities'),
+        )
+        now = time.monotonic()
+
+        if key != self._upcoming_key or now - self._upcoming_time > self.UPCOMING_TTL:
+            self._upcoming_cache = self.scheduler.get_next_scheduled_activities(self.TIMELINE_ROWS)
+            self._upcoming_key = key
+            self._upcoming_time = now
+        else:
+            wall_now = datetime.now()
+            for act in self._upcoming_cache:
+                act['time_until'] = (act['next_execution'] - wall_now).total_seconds()
+
+        return self._upcoming_cache
+
+    def _set_text(self, label, text):
+        """Set label text, skipping the call when it is already showing it."""
+        if self._last_values.get(label) != text:
+            label.setText(text)
+            self._last_values[label] = text
+
     def log_message(self, message):
-        """Add message to console log."""
-        self.console_log.append(message)
+        """Queue message for the console log (flushed in 100ms batches)."""
+        self._log_buffer.append(message)
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+
+    def _flush_log(self):
+        """Append buffered messages to the console in one block."""
+        if not self._log_buffer:
+            return
 
-        # Auto-scroll to bottom
         scrollbar = self.console_log.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        self.console_log.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+
+        # Auto-scroll to bottom unless the user scrolled back
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
@@ -1,15 +1,33 @@
 """Logs Page - View Application Logs"""
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit
-from PyQt6.QtCore import Qt
+import logging
+import os
 
+from PyQt6.QtWidgets import QVBoxLayout, QLabel, QPlainTextEdit
 
-class LogsPage(QWidget):
+from ..styles import monospace_font
+from .base import LazyPage
+
+
+logger = logging.getLogger(__name__)
+
+
+class LogsPage(LazyPage):
     """Logs viewer page."""
 
-    def __init__(self):
+    MAX_LINES = 5000
+
+    def __init__(self, log_file=None):
         super().__init__()
 
+        # Log file to tail; refresh() only reads bytes appended since the
+        # last call
+        self.log_file = log_file
+        self._log_offset = 0
+        self._partial_line = b""
+
+    def _setup_ui(self):
+        """Setup logs page UI."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
 
@@ -17,21 +35,62 @@ class LogsPage(QWidget):
         label.setStyleSheet("font-size: 18px; font-weight: 600;")
         layout.addWidget(label)
 
-        self.log_view = QTextEdit()
+        self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(self.MAX_LINES)
+        self.log_view.setFont(monospace_font(12))
         self.log_view.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1a1a1a;
                 color: #e0e0e0;
                 border: 1px solid #333333;
                 border-radius: 8px;
                 padding: 15px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 12px;
             }
         """)
         layout.addWidget(self.log_view)
 
     def refresh(self):
-        """Refresh logs."""
-        pass
+        """Refresh logs by appending new lines from the log file."""
+        if not self.log_file:
+            return
+
+        self.ensure_built()
+
+        try:
+            size = os.path.getsize(self.log_file)
+        except OSError:
+            return
+
+        if size < self._log_offset:
+            # File was truncated or rotated - start over
+            self.log_view.clear()
+            self._log_offset = 0
+            self._partial_line = b""
+
+        if size == self._log_offset:
+            return
+
+        try:
+            with open(self.log_file, 'rb') as f:
+                f.seek(self._log_offset)
+                data = f.read()
+        except OSError as e:
+            logger.error(f"Failed to read log file {self.log_file}: {e}")
+            return
+
+        self._log_offset += len(data)
+
+        # Hold back an unterminated last line until the rest is written
+        data = self._partial_line + data
+        complete, sep, self._partial_line = data.rpartition(b"\n")
+        if not sep:
+            return
+
+        scrollbar = self.log_view.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        self.log_view.appendPlainText(complete.decode('utf-8', errors='replace'))
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
@@ -1,18 +1,21 @@
 """Settings Page - Application Configuration"""
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QSpinBox, QCheckBox, QGroupBox
 )
-from PyQt6.QtCore import Qt
 
+from .base import LazyPage
 
-class SettingsPage(QWidget):
+
+class SettingsPage(LazyPage):
     """Settings configuration page."""
 
     def __init__(self):
         super().__init__()
 
+    def _setup_ui(self):
+        """Setup settings page UI."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(20)
@@ -1,16 +1,19 @@
 """Statistics Page - Analytics and Charts"""
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QVBoxLayout, QLabel
 
+from .base import LazyPage
 
-class StatisticsPage(QWidget):
+
+class StatisticsPage(LazyPage):
     """Statistics and analytics page."""
 
     def __init__(self, scheduler=None):
         super().__init__()
         self.scheduler = scheduler
 
+    def _setup_ui(self):
+        """Setup statistics page UI."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
 
@@ -1,19 +1,19 @@
 """Templates Page - Manage Template Images"""
 
-from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QGridLayout, QScrollArea, QFrame, QPushButton
-)
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QVBoxLayout, QLabel
 
+from .base import LazyPage
 
-class TemplatesPage(QWidget):
+
+class TemplatesPage(LazyPage):
     """Template management page."""
 
     def __init__(self, screen=None):
         super().__init__()
         self.screen = screen
 
+    def _setup_ui(self):
+        """Setup templates page UI."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
 
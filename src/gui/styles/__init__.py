@@ -1,4 +1,6 @@
 """GUI Styles"""
-from .theme import DARK_THEME
+from .theme import load_theme, apply_theme
+from .helpers import set_style_property
+from .fonts import ui_font, monospace_font
 
-__all__ = ['DARK_THEME']
+__all__ = ['load_theme', 'apply_theme', 'set_style_property', 'ui_font', 'monospace_font']
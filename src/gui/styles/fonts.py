@@ -0,0 +1,43 @@
+"""
+Shared Fonts
+
+Fonts that are resolved once and handed to widgets with setFont().
+QFont is implicitly shared, so every widget using the same size shares
+one font instead of each stylesheet rule resolving the family list again.
+"""
+
+from functools import lru_cache
+
+from PyQt6.QtGui import QFont
+
+
+UI_FAMILIES = ["Segoe UI", "San Francisco", "Helvetica Neue", "Arial"]
+MONOSPACE_FAMILIES = ["Consolas", "Monaco"]
+
+
+@lru_cache(maxsize=None)
+def ui_font(pixel_size=13):
+    """
+    Get the shared application UI font.
+
+    Must be called after the QApplication is created.
+    """
+    font = QFont()
+    font.setFamilies(UI_FAMILIES)
+    font.setStyleHint(QFont.StyleHint.SansSerif)
+    font.setPixelSize(pixel_size)
+    return font
+
+
+@lru_cache(maxsize=None)
+def monospace_font(pixel_size=12):
+    """
+    Get the shared monospace font for log views and timers.
+
+    Must be called after the QApplication is created.
+    """
+    font = QFont()
+    font.setFamilies(MONOSPACE_FAMILIES)
+    font.setStyleHint(QFont.StyleHint.Monospace)
+    font.setPixelSize(pixel_size)
+    return font
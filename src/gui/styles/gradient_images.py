@@ -0,0 +1,65 @@
+"""
+Button Gradients
+
+Vertical gradients for the colored buttons, pre-rendered to 1px wide PNGs
+in gradients/ and stretched over the button with border-image, so a
+button repaint is a pixmap blit instead of sampling a qlineargradient.
+
+Regenerate the images after changing a color here:
+
+    python -m src.gui.styles.gradient_images
+"""
+
+from PyQt6.QtGui import QColor, QGuiApplication, QImage, QLinearGradient, QPainter
+
+from .theme import GRADIENTS_DIR
+
+
+GRADIENT_HEIGHT = 64
+
+# name -> (top color, bottom color); names match the url()s in dark/buttons.qss
+BUTTON_GRADIENTS = {
+    "primary": ("#5aa3ff", "#4a9eff"),
+    "primary_hover": ("#6ab0ff", "#5aa3ff"),
+    "primary_pressed": ("#4a9eff", "#3a8eef"),
+    "success": ("#5ec96e", "#4caf50"),
+    "success_hover": ("#6ed97e", "#5ec96e"),
+    "danger": ("#f55246", "#f44336"),
+    "danger_hover": ("#ff6256", "#f55246"),
+    "warning": ("#ffa910", "#ff9800"),
+}
+
+
+def render_gradient(top, bottom, height=GRADIENT_HEIGHT):
+    """
+    Render a top-to-bottom gradient into a 1px wide image.
+
+    Args:
+        top: Color at the top edge
+        bottom: Color at the bottom edge
+        height: Image height in pixels
+
+    Returns:
+        QImage with the gradient
+    """
+    image = QImage(1, height, QImage.Format.Format_RGB32)
+    gradient = QLinearGradient(0, 0, 0, height)
+    gradient.setColorAt(0, QColor(top))
+    gradient.setColorAt(1, QColor(bottom))
+
+    painter = QPainter(image)
+    painter.fillRect(image.rect(), gradient)
+    painter.end()
+    return image
+
+
+def render_all(directory=GRADIENTS_DIR):
+    """Write every button gradient to <directory>/<name>.png."""
+    directory.mkdir(exist_ok=True)
+    for name, (top, bottom) in BUTTON_GRADIENTS.items():
+        render_gradient(top, bottom).save(str(directory / f"{name}.png"))
+
+
+if __name__ == "__main__":
+    app = QGuiApplication([])
+    render_all()
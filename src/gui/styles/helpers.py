@@ -0,0 +1,25 @@
+"""
+Style Helpers
+
+Small utilities for driving the global stylesheet from widget properties.
+"""
+
+
+def set_style_property(widget, name, value):
+    """
+    Set a dynamic property used by stylesheet selectors.
+
+    Qt only re-evaluates property selectors on polish, so the widget is
+    re-polished when the value actually changes and left alone otherwise.
+
+    Returns:
+        True if the property changed
+    """
+    if widget.property(name) == value:
+        return False
+
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    return True
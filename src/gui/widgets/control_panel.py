@@ -14,34 +14,16 @@ class ControlPanel(QWidget):
     def __init__(self):
         super().__init__()
 
-        self.setStyleSheet("""
-            ControlPanel {
-                background-color: #2d2d2d;
-                border-top: 1px solid #404040;
-                padding: 15px;
-            }
-        """)
-
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(10)
 
-        # Title
-        label = QWidget()
-        label.setStyleSheet("font-size: 12px; color: #888888; font-weight: 600; margin-bottom: 10px;")
-
         # Start button
         self.start_button = QPushButton("▶ START")
         self.start_button.setProperty("class", "success")
+        self.start_button.setObjectName("startButton")
         self.start_button.setMinimumHeight(45)
-        self.start_button.setStyleSheet("""
-            QPushButton {
-                font-size: 14px;
-                font-weight: 700;
-                border-radius: 8px;
-            }
-        """)
-        self.start_button.clicked.connect(self.start_clicked.emit)
+        self.start_button.clicked.connect(self.start_clicked)
         layout.addWidget(self.start_button)
 
         # Pause button
@@ -49,7 +31,7 @@ class ControlPanel(QWidget):
         self.pause_button.setProperty("class", "warning")
         self.pause_button.setMinimumHeight(40)
         self.pause_button.setEnabled(False)
-        self.pause_button.clicked.connect(self.pause_clicked.emit)
+        self.pause_button.clicked.connect(self.pause_clicked)
         layout.addWidget(self.pause_button)
 
         # Stop button
@@ -57,7 +39,7 @@ class ControlPanel(QWidget):
         self.stop_button.setProperty("class", "danger")
         self.stop_button.setMinimumHeight(40)
         self.stop_button.setEnabled(False)
-        self.stop_button.clicked.connect(self.stop_clicked.emit)
+        self.stop_button.clicked.connect(self.stop_clicked)
         layout.addWidget(self.stop_button)
 
     def set_running(self, running):
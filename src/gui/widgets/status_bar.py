@@ -1,7 +1,26 @@
 """Modern Status Bar"""
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QIcon
+
+from ..styles import set_style_property
+from ..styles.theme import ICONS_DIR
+
+
+# Statuses with an icons/status_<name>.svg; text colors come from the
+# theme's QLabel#statusText[state=...] rules
+_STATUSES = ("running", "stopped", "paused", "error")
+_STATUS_ICON_SIZE = QSize(12, 12)
+
+
+@lru_cache(maxsize=None)
+def _status_pixmap(status):
+    """Render a status icon once; later calls reuse the cached pixmap."""
+    icon = QIcon(str(ICONS_DIR / f"status_{status}.svg"))
+    return icon.pixmap(_STATUS_ICON_SIZE)
 
 
 class ModernStatusBar(QWidget):
@@ -11,55 +30,52 @@ class ModernStatusBar(QWidget):
         super().__init__()
 
         self.setFixedHeight(30)
-        self.setStyleSheet("""
-            ModernStatusBar {
-                background-color: #252525;
-                border-top: 1px solid #333333;
-            }
-        """)
+
+        # Last values shown, so repeated polls don't touch the labels
+        self._last_status = None
+        self._last_adb = None
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(15, 5, 15, 5)
 
         # Status indicator
-        self.status_label = QLabel("⚫ Stopped")
-        self.status_label.setStyleSheet("color: #888888; font-size: 12px;")
+        self.status_icon = QLabel()
+        self.status_icon.setFixedSize(_STATUS_ICON_SIZE)
+        self.status_icon.setPixmap(_status_pixmap("stopped"))
+        layout.addWidget(self.status_icon)
+
+        self.status_label = QLabel("Stopped")
+        self.status_label.setObjectName("statusText")
         layout.addWidget(self.status_label)
 
         layout.addStretch()
 
         # ADB status
         self.adb_label = QLabel("📱 ADB: Checking...")
-        self.adb_label.setStyleSheet("color: #888888; font-size: 12px;")
+        self.adb_label.setObjectName("adbStatus")
         layout.addWidget(self.adb_label)
 
     def set_status(self, status, text):
         """Set automation status."""
-        colors = {
-            "running": "#4caf50",
-            "stopped": "#888888",
-            "paused": "#ff9800",
-            "error": "#f44336"
-        }
-
-        icons = {
-            "running": "🟢",
-            "stopped": "⚫",
-            "paused": "🟡",
-            "error": "🔴"
-        }
-
-        color = colors.get(status, "#888888")
-        icon = icons.get(status, "⚫")
-
-        self.status_label.setText(f"{icon} {text}")
-        self.status_label.setStyleSheet(f"color: {color}; font-size: 12px; font-weight: 600;")
+        if status not in _STATUSES:
+            status = "stopped"
+        if (status, text) == self._last_status:
+            return
+        self._last_status = (status, text)
+
+        self.status_icon.setPixmap(_status_pixmap(status))
+        self.status_label.setText(text)
+        set_style_property(self.status_label, "state", status)
 
     def set_adb_status(self, connected):
         """Set ADB connection status."""
+        connected = bool(connected)
+        if connected == self._last_adb:
+            return
+        self._last_adb = connected
+
         if connected:
             self.adb_label.setText("📱 ADB: ✅ Connected")
-            self.adb_label.setStyleSheet("color: #4caf50; font-size: 12px;")
         else:
             self.adb_label.setText("📱 ADB: ❌ Disconnected")
-            self.adb_label.setStyleSheet("color: #f44336; font-size: 12px;")
+        set_style_property(self.adb_label, "connected", connected)